@@ -0,0 +1,102 @@
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+import rich
+import typer
+
+from sightcall_scraping.domain.ports.document_parser import DocumentParser
+from sightcall_scraping.infrastructure.html_document_parser import HtmlDocumentParser
+from sightcall_scraping.infrastructure.lxml_document_parser import LxmlDocumentParser
+
+MAX_REPORTED_DIFFERENCES: int = 20
+
+app = typer.Typer()
+
+
+@dataclass
+class ParserBenchmarkResult:
+    parser_name: str
+    document_count: int
+    elapsed_seconds: float
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.document_count / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+@dataclass
+class ParserComparison:
+    reference: ParserBenchmarkResult
+    candidate: ParserBenchmarkResult
+    differing_urls: list[str] = field(default_factory=list)
+
+    @property
+    def difference_count(self) -> int:
+        return len(self.differing_urls)
+
+
+def load_corpus(corpus_dir: Path) -> list[tuple[str, str]]:
+    return [
+        (path.relative_to(corpus_dir).as_posix(), path.read_text(encoding="utf-8", errors="replace"))
+        for path in sorted(corpus_dir.rglob("*.html"))
+    ]
+
+
+def compare_document_parsers(
+    reference: DocumentParser, candidate: DocumentParser, corpus: Iterable[tuple[str, str]]
+) -> ParserComparison:
+    pages = list(corpus)
+    reference_documents, reference_result = _parse_corpus(reference, pages)
+    candidate_documents, candidate_result = _parse_corpus(candidate, pages)
+    differing_urls = [
+        url
+        for url, expected, actual in zip((url for url, _ in pages), reference_documents, candidate_documents)
+        if expected != actual
+    ]
+    return ParserComparison(reference_result, candidate_result, differing_urls)
+
+
+def _parse_corpus(
+    parser: DocumentParser, pages: list[tuple[str, str]]
+) -> tuple[list[tuple[str, str, tuple[str, ...]]], ParserBenchmarkResult]:
+    started_at = time.perf_counter()
+    documents = [parser.to_scraped_document(url, html) for url, html in pages]
+    elapsed_seconds = time.perf_counter() - started_at
+    fields = [(document.title, document.content, document.links) for document in documents]
+    return fields, ParserBenchmarkResult(type(parser).__name__, len(pages), elapsed_seconds)
+
+
+@app.command()
+def main(
+    corpus_dir: Path = typer.Argument(..., help="Directory of stored *.html pages."),
+    results_file: Optional[Path] = typer.Option(None, help="JSON file to write the comparison to."),
+) -> None:
+    comparison = compare_document_parsers(
+        HtmlDocumentParser(extract_links=True), LxmlDocumentParser(extract_links=True), load_corpus(corpus_dir)
+    )
+    for result in (comparison.reference, comparison.candidate):
+        rich.print(
+            f"{result.parser_name}: {result.document_count} docs in {result.elapsed_seconds:.2f}s "
+            f"({result.documents_per_second:.1f} docs/sec)"
+        )
+    rich.print(f"Differences: {comparison.difference_count}")
+    for url in comparison.differing_urls[:MAX_REPORTED_DIFFERENCES]:
+        rich.print(f"  {url}")
+    if results_file is not None:
+        report = {
+            "reference": _to_report(comparison.reference),
+            "candidate": _to_report(comparison.candidate),
+            "differing_urls": comparison.differing_urls,
+        }
+        results_file.write_text(json.dumps(report, indent=4))
+
+
+def _to_report(result: ParserBenchmarkResult) -> dict[str, object]:
+    return {**asdict(result), "documents_per_second": result.documents_per_second}
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,220 @@
+import asyncio
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from types import TracebackType
+from typing import AsyncGenerator, Optional, Self
+
+import rich
+import typer
+
+from benchmarks.synthetic_site import SyntheticSite, SyntheticSiteConfig
+from sightcall_scraping.application.page_scraping.concurrency_limits import MAX_CONCURRENT_REQUESTS, ConcurrencyLimits
+from sightcall_scraping.application.page_scraping.page_scraper import PageScraper
+from sightcall_scraping.application.scrape_sightcall_website import ScrapeSightCallWebsite
+from sightcall_scraping.domain.models.fetched_response import FetchedResponse
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.domain.ports.document_parser import DocumentParser
+from sightcall_scraping.infrastructure.document_parsers import ParserEngine, create_document_parser
+from sightcall_scraping.infrastructure.http_content_fetcher import HttpContentFetcher
+from sightcall_scraping.infrastructure.json_lines_scraped_document_storage import JsonLinesScrapedDocumentStorage
+
+DEFAULT_RESULTS_FILE: str = "benchmark_results.json"
+LOWER_IS_BETTER: frozenset[str] = frozenset(
+    {"wall_seconds", "cpu_seconds", "peak_rss_mb", "fetch_latency_ms", "parse_latency_ms", "failed_url_count"}
+)
+
+app = typer.Typer()
+
+
+@dataclass
+class LatencyPercentiles:
+    p50: float
+    p95: float
+    p99: float
+
+    @classmethod
+    def of(cls, durations_seconds: list[float]) -> "LatencyPercentiles":
+        if len(durations_seconds) < 2:
+            value: float = durations_seconds[0] * 1000 if durations_seconds else 0.0
+            return cls(value, value, value)
+        cut_points: list[float] = statistics.quantiles(durations_seconds, n=100, method="inclusive")
+        return cls(cut_points[49] * 1000, cut_points[94] * 1000, cut_points[98] * 1000)
+
+
+@dataclass
+class ScrapeBenchmarkResult:
+    scraped_document_count: int
+    failed_url_count: int
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_mb: float
+    fetch_latency_ms: LatencyPercentiles
+    parse_latency_ms: LatencyPercentiles
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.scraped_document_count / self.wall_seconds if self.wall_seconds else 0.0
+
+
+class TimedContentFetcher(ContentFetcher):
+    def __init__(self, content_fetcher: ContentFetcher):
+        self._content_fetcher = content_fetcher
+        self.durations_seconds: list[float] = []
+
+    async def __aenter__(self) -> Self:
+        await self._content_fetcher.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._content_fetcher.__aexit__(exc_type, exc_value, traceback)
+
+    async def fetch(self, uri: str) -> str:
+        return (await self.fetch_response(uri)).text
+
+    async def fetch_response(self, uri: str) -> FetchedResponse:
+        started_at: float = time.perf_counter()
+        try:
+            return await self._content_fetcher.fetch_response(uri)
+        finally:
+            self.durations_seconds.append(time.perf_counter() - started_at)
+
+    def stream(self, uri: str) -> AsyncGenerator[bytes, None]:
+        return self._content_fetcher.stream(uri)
+
+
+class TimedDocumentParser(DocumentParser):
+    def __init__(self, document_parser: DocumentParser):
+        self._document_parser = document_parser
+        self.durations_seconds: list[float] = []
+
+    def to_scraped_document(self, url: str, raw: str) -> ScrapedDocument:
+        started_at: float = time.perf_counter()
+        try:
+            return self._document_parser.to_scraped_document(url, raw)
+        finally:
+            self.durations_seconds.append(time.perf_counter() - started_at)
+
+    def to_scraped_document_from_bytes(self, url: str, body: bytes, encoding: str) -> ScrapedDocument:
+        started_at: float = time.perf_counter()
+        try:
+            return self._document_parser.to_scraped_document_from_bytes(url, body, encoding)
+        finally:
+            self.durations_seconds.append(time.perf_counter() - started_at)
+
+
+def run_scrape_benchmark(
+    site: SyntheticSite,
+    parser_engine: ParserEngine = ParserEngine.BEAUTIFULSOUP,
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+) -> ScrapeBenchmarkResult:
+    content_fetcher = TimedContentFetcher(HttpContentFetcher())
+    document_parser = TimedDocumentParser(create_document_parser(parser_engine))
+    with tempfile.TemporaryDirectory() as output_dir:
+        use_case = ScrapeSightCallWebsite(
+            PageScraper(content_fetcher, document_parser, ConcurrencyLimits(max_concurrent_requests=max_concurrency)),
+            JsonLinesScrapedDocumentStorage(Path(output_dir) / "documents.jsonl"),
+        )
+        started_at, cpu_started_at = time.perf_counter(), time.process_time()
+        summary = asyncio.run(use_case.execute(site.sitemap_index_url, lambda _: None))
+        wall_seconds, cpu_seconds = time.perf_counter() - started_at, time.process_time() - cpu_started_at
+    return ScrapeBenchmarkResult(
+        scraped_document_count=summary.scraped_document_count,
+        failed_url_count=summary.failed_url_count,
+        wall_seconds=wall_seconds,
+        cpu_seconds=cpu_seconds,
+        peak_rss_mb=_peak_rss_mb(),
+        fetch_latency_ms=LatencyPercentiles.of(content_fetcher.durations_seconds),
+        parse_latency_ms=LatencyPercentiles.of(document_parser.durations_seconds),
+    )
+
+
+def _peak_rss_mb() -> float:
+    peak_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss / (1024 * 1024) if sys.platform == "darwin" else peak_rss / 1024
+
+
+def _current_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@app.command()
+def run(
+    results_file: Path = typer.Option(DEFAULT_RESULTS_FILE, help="JSON file to write the results to."),
+    sitemap_count: int = typer.Option(SyntheticSiteConfig.sitemap_count, help="Number of child sitemaps."),
+    page_count: int = typer.Option(SyntheticSiteConfig.page_count, help="Number of HTML pages."),
+    page_size_bytes: int = typer.Option(SyntheticSiteConfig.page_size_bytes, help="Approximate size of a page."),
+    latency_ms: float = typer.Option(SyntheticSiteConfig.latency_ms, help="Mean server response latency."),
+    jitter_ms: float = typer.Option(SyntheticSiteConfig.jitter_ms, help="Latency varies uniformly by this much."),
+    error_rate: float = typer.Option(SyntheticSiteConfig.error_rate, help="Share of page requests answered 503."),
+    seed: int = typer.Option(SyntheticSiteConfig.seed, help="Seed of the generated corpus and errors."),
+    parser_engine: ParserEngine = typer.Option(ParserEngine.BEAUTIFULSOUP, "--parser", help="HTML extraction engine."),
+    max_concurrency: int = typer.Option(MAX_CONCURRENT_REQUESTS, help="Highest number of in-flight page requests."),
+) -> None:
+    config = SyntheticSiteConfig(sitemap_count, page_count, page_size_bytes, latency_ms, jitter_ms, error_rate, seed)
+    with SyntheticSite(config) as site:
+        result = run_scrape_benchmark(site, parser_engine, max_concurrency)
+    rich.print(
+        f"{result.scraped_document_count} pages in {result.wall_seconds:.2f}s ({result.pages_per_second:.1f} pages/sec), "
+        f"{result.cpu_seconds:.2f}s CPU, {result.peak_rss_mb:.0f} MB peak RSS"
+    )
+    for name, latency in (("fetch", result.fetch_latency_ms), ("parse", result.parse_latency_ms)):
+        rich.print(f"{name}: p50 {latency.p50:.1f} ms, p95 {latency.p95:.1f} ms, p99 {latency.p99:.1f} ms")
+    report = {
+        "commit": _current_commit(),
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "site": asdict(config),
+        "scraper": {"parser": parser_engine.value, "max_concurrency": max_concurrency},
+        "metrics": {**asdict(result), "pages_per_second": result.pages_per_second},
+    }
+    results_file.write_text(json.dumps(report, indent=4))
+
+
+@app.command()
+def compare(
+    baseline_file: Path = typer.Argument(..., help="Results of the reference commit."),
+    candidate_file: Path = typer.Argument(..., help="Results of the commit under test."),
+) -> None:
+    baseline, candidate = (json.loads(path.read_text()) for path in (baseline_file, candidate_file))
+    if baseline["site"] != candidate["site"] or baseline["scraper"] != candidate["scraper"]:
+        rich.print("[yellow]The two results were recorded with different settings.[/yellow]")
+    rich.print(f"{baseline['commit']} -> {candidate['commit']}")
+    for name, baseline_value, candidate_value in _flatten_metrics(baseline["metrics"], candidate["metrics"]):
+        change: float = (candidate_value - baseline_value) / baseline_value if baseline_value else 0.0
+        is_better: bool = (change < 0) == (name.split(".")[0] in LOWER_IS_BETTER)
+        colour: str = "green" if is_better or change == 0 else "red"
+        rich.print(f"{name}: {baseline_value:.2f} -> {candidate_value:.2f} [{colour}]({change:+.1%})[/{colour}]")
+
+
+def _flatten_metrics(baseline: dict, candidate: dict, prefix: str = "") -> list[tuple[str, float, float]]:
+    metrics: list[tuple[str, float, float]] = []
+    for name, baseline_value in baseline.items():
+        if isinstance(baseline_value, dict):
+            metrics.extend(_flatten_metrics(baseline_value, candidate[name], f"{prefix}{name}."))
+        else:
+            metrics.append((prefix + name, baseline_value, candidate[name]))
+    return metrics
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,142 @@
+import multiprocessing
+import random
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.connection import Connection
+from types import TracebackType
+from typing import Optional, Self
+
+SITEMAP_INDEX_PATH: str = "/sitemap_index.xml"
+SITEMAP_NAMESPACE: str = "http://www.sitemaps.org/schemas/sitemap/0.9"
+WORDS: tuple[str, ...] = tuple(
+    "video assistance remote field service technician customer support augmented reality platform insurance "
+    "claim inspection telecom device camera session workflow expert guidance resolution first time fix rate".split()
+)
+NAVIGATION: str = "".join(f"<li><a href='/{word}'>{word.title()}</a></li>" for word in WORDS[:8])
+SERVER_START_TIMEOUT_SECONDS: float = 10.0
+
+
+@dataclass(frozen=True)
+class SyntheticSiteConfig:
+    sitemap_count: int = 5
+    page_count: int = 500
+    page_size_bytes: int = 20_000
+    latency_ms: float = 20.0
+    jitter_ms: float = 10.0
+    error_rate: float = 0.0
+    seed: int = 0
+
+
+class SyntheticSite:
+    def __init__(self, config: SyntheticSiteConfig):
+        self._config = config
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._port: Optional[int] = None
+
+    def __enter__(self) -> Self:
+        context = multiprocessing.get_context("spawn")
+        receiving_end, sending_end = context.Pipe(duplex=False)
+        self._process = context.Process(target=_serve, args=(self._config, sending_end), daemon=True)
+        self._process.start()
+        if not receiving_end.poll(SERVER_START_TIMEOUT_SECONDS):
+            self._process.kill()
+            raise RuntimeError("Synthetic site did not start in time")
+        self._port = receiving_end.recv()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.join()
+            self._process = None
+
+    @property
+    def base_url(self) -> str:
+        if self._port is None:
+            raise RuntimeError("SyntheticSite must be used as a context manager")
+        return f"http://127.0.0.1:{self._port}"
+
+    @property
+    def sitemap_index_url(self) -> str:
+        return self.base_url + SITEMAP_INDEX_PATH
+
+
+def render_sitemap_index(base_url: str, config: SyntheticSiteConfig) -> str:
+    sitemaps = "".join(
+        f"<sitemap><loc>{base_url}/sitemap-{index}.xml</loc></sitemap>" for index in range(config.sitemap_count)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex xmlns="{SITEMAP_NAMESPACE}">{sitemaps}</sitemapindex>'
+
+
+def render_sitemap(base_url: str, config: SyntheticSiteConfig, sitemap_index: int) -> str:
+    urls = "".join(
+        f"<url><loc>{base_url}/pages/{page_index}</loc><lastmod>2025-01-01T00:00:00+00:00</lastmod></url>"
+        for page_index in range(sitemap_index, config.page_count, config.sitemap_count)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="{SITEMAP_NAMESPACE}">{urls}</urlset>'
+
+
+def render_page(config: SyntheticSiteConfig, page_index: int) -> str:
+    page_random = random.Random(config.seed * 1_000_003 + page_index)
+    title = " ".join(page_random.choices(WORDS, k=5)).capitalize()
+    paragraphs: list[str] = []
+    size: int = 0
+    while size < config.page_size_bytes:
+        paragraph = f"<p>{' '.join(page_random.choices(WORDS, k=page_random.randint(20, 80)))}.</p>"
+        paragraphs.append(paragraph)
+        size += len(paragraph)
+    return (
+        f"<!DOCTYPE html><html><head><title>{title}</title><script>var page = {page_index};</script></head>"
+        f"<body><nav><ul>{NAVIGATION}</ul></nav><main><h1>{title}</h1>{''.join(paragraphs)}</main>"
+        "<footer>Synthetic SightCall stand-in</footer></body></html>"
+    )
+
+
+def _serve(config: SyntheticSiteConfig, port_connection: Connection) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(config))
+    server.daemon_threads = True
+    port_connection.send(server.server_address[1])
+    port_connection.close()
+    server.serve_forever()
+
+
+def _handler_for(config: SyntheticSiteConfig) -> type[BaseHTTPRequestHandler]:
+    error_random = random.Random(config.seed)
+
+    class SyntheticSiteHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            delay_ms: float = config.latency_ms + random.uniform(-config.jitter_ms, config.jitter_ms)
+            time.sleep(max(0.0, delay_ms) / 1000)
+            base_url = f"http://{self.headers['Host']}"
+            if self.path == SITEMAP_INDEX_PATH:
+                self._reply(200, "application/xml", render_sitemap_index(base_url, config))
+            elif self.path.startswith("/sitemap-") and self.path.endswith(".xml"):
+                self._reply(200, "application/xml", render_sitemap(base_url, config, int(self.path[9:-4])))
+            elif self.path.startswith("/pages/"):
+                if error_random.random() < config.error_rate:
+                    self._reply(503, "text/plain", "Synthetic failure")
+                else:
+                    self._reply(200, "text/html; charset=utf-8", render_page(config, int(self.path[7:])))
+            else:
+                self._reply(404, "text/plain", "Not found")
+
+        def _reply(self, status: int, content_type: str, body: str) -> None:
+            encoded_body: bytes = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(encoded_body)))
+            self.end_headers()
+            self.wfile.write(encoded_body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return SyntheticSiteHandler
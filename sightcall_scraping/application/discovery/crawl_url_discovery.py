@@ -0,0 +1,83 @@
+import asyncio
+from contextlib import AsyncExitStack
+from types import TracebackType
+from typing import Optional, Self
+
+from sightcall_scraping.application.discovery.link_crawl import MAX_CRAWL_DEPTH, LinkCrawl
+from sightcall_scraping.application.discovery.url_discovery import DiscoveryRun, UrlDiscovery, UrlSink
+from sightcall_scraping.application.scrape_summary import ScrapeSummary
+from sightcall_scraping.domain.models.run_progress import RunProgress
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.ports.crawl_frontier import CrawlFrontier
+
+
+class CrawlUrlDiscovery(UrlDiscovery):
+    def __init__(
+        self,
+        seed_discovery: UrlDiscovery,
+        crawl_frontier: CrawlFrontier,
+        max_crawl_depth: int = MAX_CRAWL_DEPTH,
+        time_budget_seconds: Optional[float] = None,
+    ):
+        self._seed_discovery = seed_discovery
+        self._crawl_frontier = crawl_frontier
+        self._max_crawl_depth = max_crawl_depth
+        self._time_budget_seconds = time_budget_seconds
+        self._link_crawl: Optional[LinkCrawl] = None
+        self._summary = ScrapeSummary()
+        self._resources = AsyncExitStack()
+
+    async def __aenter__(self) -> Self:
+        async with AsyncExitStack() as resources:
+            await resources.enter_async_context(self._seed_discovery)
+            await resources.enter_async_context(self._crawl_frontier)
+            self._resources = resources.pop_all()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._resources.__aexit__(exc_type, exc_value, traceback)
+
+    async def discover(self, run: DiscoveryRun, on_url: UrlSink) -> None:
+        link_crawl = LinkCrawl(self._crawl_frontier, self._max_crawl_depth, run.max_urls, self._time_budget_seconds)
+        self._link_crawl, self._summary = link_crawl, run.summary
+        seeding: asyncio.Task[None] = asyncio.create_task(self._seed(link_crawl, run))
+        try:
+            await self._hand_out_urls(link_crawl, run.run_progress, on_url)
+            if seeding.done():
+                seeding.result()
+        finally:
+            seeding.cancel()
+
+    async def record_scraped(self, url: Url, document: ScrapedDocument) -> None:
+        self._summary.crawled_url_count += await self._current_crawl().complete(url, document.links)
+
+    async def record_skipped(self, url: Url) -> None:
+        await self._current_crawl().complete(url, [])
+
+    async def record_failed(self, url: Url) -> None:
+        await self._current_crawl().complete(url, [])
+
+    async def _seed(self, link_crawl: LinkCrawl, run: DiscoveryRun) -> None:
+        try:
+            await self._seed_discovery.discover(run, link_crawl.add_seed)
+        finally:
+            await link_crawl.finish_seeding()
+
+    async def _hand_out_urls(self, link_crawl: LinkCrawl, run_progress: RunProgress, on_url: UrlSink) -> None:
+        while urls := await link_crawl.next_urls():
+            for url in urls:
+                if url.value in run_progress.completed_urls:
+                    await link_crawl.complete(url, [])
+                    continue
+                await on_url(url)
+
+    def _current_crawl(self) -> LinkCrawl:
+        if self._link_crawl is None:
+            raise RuntimeError("Pages can only be recorded while the crawl is discovering them")
+        return self._link_crawl
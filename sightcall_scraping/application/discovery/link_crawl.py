@@ -0,0 +1,85 @@
+import asyncio
+import time
+from typing import Callable, List, Optional, Sequence
+
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.ports.crawl_frontier import CrawlFrontier
+
+MAX_CRAWL_DEPTH: int = 3
+FRONTIER_BATCH_SIZE: int = 100
+
+
+class LinkCrawl:
+    def __init__(
+        self,
+        frontier: CrawlFrontier,
+        max_depth: int = MAX_CRAWL_DEPTH,
+        max_pages: Optional[int] = None,
+        time_budget_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._frontier = frontier
+        self._max_depth = max_depth
+        self._max_pages = max_pages
+        self._time_budget_seconds = time_budget_seconds
+        self._clock = clock
+        self._started_at: float = clock()
+        self._seeds: List[Url] = []
+        self._is_seeding_done: bool = False
+        self._handed_out_count: int = 0
+        self._in_flight_count: int = 0
+        self._frontier_changed = asyncio.Event()
+
+    async def add_seed(self, url: Url) -> None:
+        self._seeds.append(url)
+        if len(self._seeds) >= FRONTIER_BATCH_SIZE:
+            await self._flush_seeds()
+
+    async def finish_seeding(self) -> None:
+        await self._flush_seeds()
+        self._is_seeding_done = True
+        self._frontier_changed.set()
+
+    async def next_urls(self) -> List[Url]:
+        while not self._is_budget_spent():
+            self._frontier_changed.clear()
+            await self._flush_seeds()
+            urls: List[Url] = await self._frontier.pop(self._batch_size())
+            if urls:
+                self._handed_out_count += len(urls)
+                self._in_flight_count += len(urls)
+                return urls
+            if self._is_seeding_done and self._in_flight_count == 0:
+                break
+            await self._frontier_changed.wait()
+        return []
+
+    async def complete(self, url: Url, links: Sequence[str]) -> int:
+        try:
+            same_site_links: List[Url] = [link for link in map(Url, links) if link.host == url.host]
+            if not same_site_links:
+                return 0
+            depth: Optional[int] = await self._frontier.depth_of(url)
+            if depth is None or depth >= self._max_depth:
+                return 0
+            return await self._frontier.add(same_site_links, depth + 1)
+        finally:
+            self._in_flight_count -= 1
+            self._frontier_changed.set()
+
+    async def _flush_seeds(self) -> None:
+        if not self._seeds:
+            return
+        seeds, self._seeds = self._seeds, []
+        await self._frontier.add(seeds, 0)
+        self._frontier_changed.set()
+
+    def _batch_size(self) -> int:
+        if self._max_pages is None:
+            return FRONTIER_BATCH_SIZE
+        return min(FRONTIER_BATCH_SIZE, self._max_pages - self._handed_out_count)
+
+    def _is_budget_spent(self) -> bool:
+        if self._max_pages is not None and self._handed_out_count >= self._max_pages:
+            return True
+        return self._time_budget_seconds is not None and self._clock() - self._started_at >= self._time_budget_seconds
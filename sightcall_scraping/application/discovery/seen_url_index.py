@@ -0,0 +1,53 @@
+import hashlib
+import math
+from abc import ABC, abstractmethod
+
+from sightcall_scraping.domain.models.url import Url
+
+DEFAULT_BLOOM_FILTER_CAPACITY: int = 10_000_000
+DEFAULT_FALSE_POSITIVE_RATE: float = 0.001
+
+
+class SeenUrlIndex(ABC):
+    @abstractmethod
+    def add(self, url: Url) -> bool:
+        pass
+
+
+class ExactSeenUrlIndex(SeenUrlIndex):
+    def __init__(self):
+        self._seen_urls: set[Url] = set()
+
+    def add(self, url: Url) -> bool:
+        if url in self._seen_urls:
+            return False
+        self._seen_urls.add(url)
+        return True
+
+
+class BloomFilterSeenUrlIndex(SeenUrlIndex):
+    def __init__(
+        self, capacity: int = DEFAULT_BLOOM_FILTER_CAPACITY, false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE
+    ):
+        self._bit_count: int = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        self._hash_count: int = max(1, round(self._bit_count / capacity * math.log(2)))
+        self._bits = bytearray(math.ceil(self._bit_count / 8))
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+    def add(self, url: Url) -> bool:
+        is_new: bool = False
+        for position in self._bit_positions(url.canonical_value):
+            byte_index, bit_mask = position // 8, 1 << (position % 8)
+            if not self._bits[byte_index] & bit_mask:
+                is_new = True
+                self._bits[byte_index] |= bit_mask
+        return is_new
+
+    def _bit_positions(self, key: str) -> list[int]:
+        digest: bytes = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first_hash: int = int.from_bytes(digest[:8], "little")
+        second_hash: int = int.from_bytes(digest[8:], "little") | 1
+        return [(first_hash + i * second_hash) % self._bit_count for i in range(self._hash_count)]
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from contextlib import aclosing
+from typing import AsyncGenerator, Awaitable, Callable
+
+from sightcall_scraping.application.page_scraping.backoff import (
+    MAX_RETRY_ATTEMPTS,
+    backoff_delay_seconds,
+    failure_cause,
+)
+from sightcall_scraping.domain.errors import FetchError, InvalidSitemapError
+from sightcall_scraping.domain.models.sitemap_entry import SitemapEntry
+from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.domain.ports.metrics_recorder import MetricsRecorder
+from sightcall_scraping.domain.sitemap_parser import SitemapParser
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+EntryHandler = Callable[[SitemapEntry], Awaitable[bool]]
+
+
+class SitemapEntryStream:
+    def __init__(self, content_fetcher: ContentFetcher, metrics_recorder: MetricsRecorder):
+        self._content_fetcher = content_fetcher
+        self._metrics_recorder = metrics_recorder
+        self._sitemap_parser = SitemapParser()
+
+    @property
+    def metrics_recorder(self) -> MetricsRecorder:
+        return self._metrics_recorder
+
+    async def stream_with_retry(self, sitemap_url: str, on_entry: EntryHandler) -> bool:
+        handled_entry_count: int = 0
+
+        async def count_handled_entry(entry: SitemapEntry) -> bool:
+            nonlocal handled_entry_count
+            handled_entry_count += 1
+            return await on_entry(entry)
+
+        with self._metrics_recorder.timer("discovery_duration_seconds"):
+            for attempt in range(MAX_RETRY_ATTEMPTS):
+                try:
+                    await self._stream(sitemap_url, count_handled_entry, handled_entry_count)
+                    return True
+                except (FetchError, InvalidSitemapError) as error:
+                    await self._handle_failure(sitemap_url, attempt, error)
+        return False
+
+    async def _handle_failure(self, sitemap_url: str, attempt: int, error: Exception) -> None:
+        labels: dict[str, str] = {"stage": "sitemap", "cause": failure_cause(error)}
+        if attempt + 1 == MAX_RETRY_ATTEMPTS:
+            logger.warning(f"[SITEMAP_FAIL] Skipping sitemap after retries: {sitemap_url} ({error})")
+            self._metrics_recorder.increment("failures", labels=labels)
+            return
+        delay: float = backoff_delay_seconds(attempt, error)
+        logger.info(f"[RETRY] Attempt {attempt + 1} failed for {sitemap_url}: {error}. Retrying in {delay} seconds...")
+        self._metrics_recorder.increment("retries", labels=labels)
+        await asyncio.sleep(delay)
+
+    async def _stream(self, sitemap_url: str, on_entry: EntryHandler, skipped_entry_count: int) -> None:
+        async with aclosing(self._iter_entries(sitemap_url)) as entries:
+            async for entry in entries:
+                if skipped_entry_count > 0:
+                    skipped_entry_count -= 1
+                    continue
+                if not await on_entry(entry):
+                    return
+
+    async def _iter_entries(self, sitemap_url: str) -> AsyncGenerator[SitemapEntry, None]:
+        parser = self._sitemap_parser.incremental()
+        async with aclosing(self._content_fetcher.stream(sitemap_url)) as chunks:
+            async for chunk in chunks:
+                for entry in parser.feed(chunk):
+                    yield entry
+        for entry in parser.close():
+            yield entry
@@ -0,0 +1,52 @@
+from dataclasses import replace
+from types import TracebackType
+from typing import Callable, List, Optional, Self
+
+from sightcall_scraping.application.discovery.seen_url_index import ExactSeenUrlIndex, SeenUrlIndex
+from sightcall_scraping.application.discovery.sitemap_entry_stream import SitemapEntryStream
+from sightcall_scraping.application.discovery.sitemap_walk import SitemapWalk
+from sightcall_scraping.application.discovery.url_discovery import DiscoveryRun, UrlDiscovery, UrlSink
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.domain.ports.metrics_recorder import MetricsRecorder
+
+MAX_SITEMAP_DEPTH: int = 3
+
+
+class SitemapUrlDiscovery(UrlDiscovery):
+    def __init__(
+        self,
+        content_fetcher: ContentFetcher,
+        create_seen_url_index: Callable[[], SeenUrlIndex] = ExactSeenUrlIndex,
+        max_sitemap_depth: int = MAX_SITEMAP_DEPTH,
+        metrics_recorder: Optional[MetricsRecorder] = None,
+    ):
+        self._content_fetcher = content_fetcher
+        self._create_seen_url_index = create_seen_url_index
+        self._max_sitemap_depth = max_sitemap_depth
+        self._sitemap_entry_stream = SitemapEntryStream(content_fetcher, metrics_recorder or MetricsRecorder())
+
+    async def __aenter__(self) -> Self:
+        await self._content_fetcher.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._content_fetcher.__aexit__(exc_type, exc_value, traceback)
+
+    async def discover(self, run: DiscoveryRun, on_url: UrlSink) -> None:
+        resumed_urls: List[Url] = run.run_progress.unfinished_urls[: run.max_urls]
+        for url in resumed_urls:
+            await on_url(url)
+        remaining_max_urls: Optional[int] = None if run.max_urls is None else run.max_urls - len(resumed_urls)
+        await SitemapWalk(
+            self._sitemap_entry_stream,
+            replace(run, max_urls=remaining_max_urls),
+            self._create_seen_url_index(),
+            self._max_sitemap_depth,
+            on_url,
+        ).walk()
@@ -0,0 +1,101 @@
+import asyncio
+from typing import List
+
+from tqdm import tqdm
+
+from sightcall_scraping.application.discovery.seen_url_index import SeenUrlIndex
+from sightcall_scraping.application.discovery.sitemap_entry_stream import EntryHandler, SitemapEntryStream
+from sightcall_scraping.application.discovery.url_discovery import DiscoveryRun, UrlSink
+from sightcall_scraping.domain.models.sitemap_entry import SitemapEntry
+from sightcall_scraping.domain.models.url import Url
+
+MAX_CONCURRENT_SITEMAP_FETCHES: int = 5
+SITEMAP_PROGRESS_DESCRIPTION: str = "Parsing sitemaps"
+
+
+class SitemapWalk:
+    def __init__(
+        self,
+        sitemap_entry_stream: SitemapEntryStream,
+        run: DiscoveryRun,
+        seen_url_index: SeenUrlIndex,
+        max_sitemap_depth: int,
+        on_url: UrlSink,
+    ):
+        self._sitemap_entry_stream = sitemap_entry_stream
+        self._metrics_recorder = sitemap_entry_stream.metrics_recorder
+        self._run = run
+        self._summary = run.summary
+        self._seen_url_index = seen_url_index
+        self._max_sitemap_depth = max_sitemap_depth
+        self._on_url = on_url
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_SITEMAP_FETCHES)
+        self._collected_url_count: int = 0
+        self._url_slot_lock = asyncio.Lock()
+        self._visited_sitemap_urls: set[Url] = {Url(url) for url in run.sitemap_index_urls}
+        self._progress_bar = tqdm(total=len(self._visited_sitemap_urls), desc=SITEMAP_PROGRESS_DESCRIPTION)
+
+    async def walk(self) -> None:
+        self._summary.sitemap_index_count += len(self._run.sitemap_index_urls)
+        with self._progress_bar:
+            await asyncio.gather(*(self._walk_sitemap_index(url) for url in self._run.sitemap_index_urls))
+
+    async def _walk_sitemap_index(self, sitemap_url: str) -> None:
+        nested_sitemap_urls: List[str] = []
+        entry_collector: EntryHandler = self._entry_collector(0, nested_sitemap_urls)
+        if not await self._sitemap_entry_stream.stream_with_retry(sitemap_url, entry_collector):
+            self._summary.failed_sitemap_index_urls.append(sitemap_url)
+        await self._walk_nested_sitemaps(nested_sitemap_urls, 1)
+
+    async def _walk_nested_sitemap(self, sitemap_url: str, depth: int) -> None:
+        nested_sitemap_urls: List[str] = []
+        async with self._semaphore:
+            if self._is_max_urls_reached():
+                return
+            entry_collector: EntryHandler = self._entry_collector(depth, nested_sitemap_urls)
+            is_fetched: bool = await self._sitemap_entry_stream.stream_with_retry(sitemap_url, entry_collector)
+        if not is_fetched:
+            self._summary.failed_sitemap_urls.append(sitemap_url)
+        await self._walk_nested_sitemaps(nested_sitemap_urls, depth + 1)
+
+    async def _walk_nested_sitemaps(self, sitemap_urls: List[str], depth: int) -> None:
+        self._metrics_recorder.increment("sitemaps_fetched")
+        self._progress_bar.total = len(self._visited_sitemap_urls)
+        self._progress_bar.update()
+        await asyncio.gather(*(self._walk_nested_sitemap(url, depth) for url in sitemap_urls))
+
+    def _entry_collector(self, depth: int, nested_sitemap_urls: List[str]) -> EntryHandler:
+        async def collect_entry(entry: SitemapEntry) -> bool:
+            if entry.is_sitemap:
+                if depth < self._max_sitemap_depth and entry.url not in self._visited_sitemap_urls:
+                    self._visited_sitemap_urls.add(entry.url)
+                    nested_sitemap_urls.append(entry.url.value)
+                return True
+            return await self._collect_page_url(entry.url)
+
+        return collect_entry
+
+    async def _collect_page_url(self, url: Url) -> bool:
+        async with self._url_slot_lock:
+            if self._is_max_urls_reached():
+                return False
+            if not await self._is_new_page(url):
+                return True
+            self._collected_url_count += 1
+        self._metrics_recorder.increment("urls_discovered")
+        await self._on_url(url)
+        return True
+
+    async def _is_new_page(self, url: Url) -> bool:
+        if not self._seen_url_index.add(url):
+            self._summary.duplicate_url_count += 1
+            return False
+        if self._run.run_progress.is_known(url.value):
+            return False
+        if await self._run.page_recorder.is_unchanged(url):
+            self._summary.unchanged_url_count += 1
+            return False
+        return True
+
+    def _is_max_urls_reached(self) -> bool:
+        return self._run.max_urls is not None and self._collected_url_count >= self._run.max_urls
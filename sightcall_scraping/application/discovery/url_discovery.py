@@ -0,0 +1,29 @@
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional, Sequence, Union
+
+from sightcall_scraping.application.recording.page_recorder import PageRecorder
+from sightcall_scraping.application.scrape_summary import ScrapeSummary
+from sightcall_scraping.domain.models.run_progress import RunProgress
+from sightcall_scraping.domain.models.url import Url
+
+UrlSink = Callable[[Url], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class DiscoveryRun:
+    sitemap_index_urls: List[str]
+    max_urls: Optional[int]
+    run_progress: RunProgress
+    summary: ScrapeSummary
+    page_recorder: PageRecorder
+
+
+class UrlDiscovery(PageRecorder):
+    @abstractmethod
+    async def discover(self, run: DiscoveryRun, on_url: UrlSink) -> None:
+        pass
+
+
+def sitemap_index_url_list(sitemap_index_urls: Union[str, Sequence[str]]) -> List[str]:
+    return [sitemap_index_urls] if isinstance(sitemap_index_urls, str) else list(sitemap_index_urls)
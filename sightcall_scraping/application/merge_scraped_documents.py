@@ -0,0 +1,43 @@
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.scraped_document_source import ScrapedDocumentSource
+from sightcall_scraping.domain.ports.scraped_document_storage import ScrapedDocumentStorage
+
+STORAGE_BATCH_SIZE: int = 50
+
+
+@dataclass
+class MergeReport:
+    merged_document_count: int = 0
+    duplicate_document_count: int = 0
+
+
+class MergeScrapedDocuments:
+    def __init__(self, sources: Sequence[ScrapedDocumentSource], storage: ScrapedDocumentStorage):
+        self._sources = sources
+        self._storage = storage
+
+    async def execute(self) -> MergeReport:
+        report = MergeReport()
+        merged_urls: set[str] = set()
+        async with self._storage:
+            batch: List[ScrapedDocument] = []
+            for source in self._sources:
+                async with aclosing(source.iter_documents()) as documents:
+                    async for document in documents:
+                        if document.url in merged_urls:
+                            report.duplicate_document_count += 1
+                            continue
+                        merged_urls.add(document.url)
+                        batch.append(document)
+                        if len(batch) >= STORAGE_BATCH_SIZE:
+                            await self._storage.save_all(batch)
+                            report.merged_document_count += len(batch)
+                            batch = []
+            if batch:
+                await self._storage.save_all(batch)
+                report.merged_document_count += len(batch)
+        return report
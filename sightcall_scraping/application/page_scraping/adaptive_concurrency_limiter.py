@@ -0,0 +1,142 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+
+from sightcall_scraping.domain.errors import FetchError, SkippedResponseError, ThrottledError
+
+DECREASE_FACTOR: float = 0.5
+ADDITIVE_INCREASE: int = 1
+LATENCY_TOLERANCE: float = 2.0
+MAX_HEALTHY_ERROR_RATE: float = 0.1
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        min_concurrency: int,
+        max_concurrency: int,
+        max_requests_per_second: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("Concurrency bounds must satisfy 1 <= min <= max")
+        self._min_concurrency = min_concurrency
+        self._max_concurrency = max_concurrency
+        self._min_request_interval: float = 1 / max_requests_per_second if max_requests_per_second else 0.0
+        self._clock = clock
+        self._limit: int = min_concurrency
+        self._is_slow_starting: bool = True
+        self._in_flight: int = 0
+        self._condition = asyncio.Condition()
+        self._next_ticket: int = 0
+        self._first_ticket_after_decrease: int = 0
+        self._next_start_time: float = 0.0
+        self._resume_time: float = 0.0
+        self._best_window_latency: Optional[float] = None
+        self._window_latencies: list[float] = []
+        self._window_error_count: int = 0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        ticket: int = await self._acquire()
+        started_at: float = self._clock()
+        try:
+            yield
+        except ThrottledError as error:
+            self._on_throttled(ticket, error.retry_after_seconds)
+            raise
+        except SkippedResponseError:
+            self._on_success(self._clock() - started_at)
+            raise
+        except FetchError:
+            self._on_error()
+            raise
+        else:
+            self._on_success(self._clock() - started_at)
+        finally:
+            await self._release()
+
+    async def _acquire(self) -> int:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+        ticket: int = self._next_ticket
+        self._next_ticket += 1
+        try:
+            await self._wait_for_turn()
+        except BaseException:
+            await self._release()
+            raise
+        return ticket
+
+    async def _release(self) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    async def _wait_for_turn(self) -> None:
+        while (start_time := self._reserve_start_time()) > self._clock():
+            await asyncio.sleep(start_time - self._clock())
+            if self._resume_time <= start_time:
+                return
+
+    def _reserve_start_time(self) -> float:
+        start_time: float = max(self._clock(), self._resume_time, self._next_start_time)
+        self._next_start_time = start_time + self._min_request_interval
+        return start_time
+
+    def _on_throttled(self, ticket: int, retry_after_seconds: Optional[float]) -> None:
+        if retry_after_seconds:
+            self._resume_time = max(self._resume_time, self._clock() + retry_after_seconds)
+        if ticket >= self._first_ticket_after_decrease:
+            self._decrease()
+
+    def _on_error(self) -> None:
+        self._window_error_count += 1
+        self._close_window_if_full()
+
+    def _on_success(self, latency: float) -> None:
+        self._window_latencies.append(latency)
+        self._close_window_if_full()
+
+    def _close_window_if_full(self) -> None:
+        window_size: int = len(self._window_latencies) + self._window_error_count
+        if window_size < self._limit:
+            return
+        error_rate: float = self._window_error_count / window_size
+        mean_latency: Optional[float] = (
+            sum(self._window_latencies) / len(self._window_latencies) if self._window_latencies else None
+        )
+        if error_rate > MAX_HEALTHY_ERROR_RATE:
+            self._decrease()
+        elif self._is_latency_healthy(mean_latency):
+            self._increase()
+        if mean_latency is not None and (
+            self._best_window_latency is None or mean_latency < self._best_window_latency
+        ):
+            self._best_window_latency = mean_latency
+        self._reset_window()
+
+    def _is_latency_healthy(self, mean_latency: Optional[float]) -> bool:
+        if mean_latency is None or self._best_window_latency is None:
+            return True
+        return mean_latency <= self._best_window_latency * LATENCY_TOLERANCE
+
+    def _increase(self) -> None:
+        increased_limit: int = self._limit * 2 if self._is_slow_starting else self._limit + ADDITIVE_INCREASE
+        self._limit = min(self._max_concurrency, increased_limit)
+
+    def _decrease(self) -> None:
+        self._is_slow_starting = False
+        self._limit = max(self._min_concurrency, int(self._limit * DECREASE_FACTOR))
+        self._first_ticket_after_decrease = self._next_ticket
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self._window_latencies = []
+        self._window_error_count = 0
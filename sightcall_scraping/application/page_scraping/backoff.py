@@ -0,0 +1,16 @@
+from sightcall_scraping.domain.errors import ThrottledError
+
+MAX_RETRY_ATTEMPTS: int = 3
+INITIAL_BACKOFF_DELAY_SECONDS: float = 1.0
+BACKOFF_MULTIPLIER: float = 3.0
+
+
+def backoff_delay_seconds(failed_attempt: int, error: Exception) -> float:
+    delay: float = INITIAL_BACKOFF_DELAY_SECONDS * BACKOFF_MULTIPLIER**failed_attempt
+    if isinstance(error, ThrottledError) and error.retry_after_seconds is not None:
+        return max(delay, error.retry_after_seconds)
+    return delay
+
+
+def failure_cause(error: Exception) -> str:
+    return type(error.__cause__ or error).__name__
@@ -0,0 +1,45 @@
+import time
+from typing import Callable
+from urllib.parse import urlsplit
+
+from sightcall_scraping.domain.errors import CircuitOpenError
+
+DEFAULT_FAILURE_THRESHOLD: int = 5
+DEFAULT_OPEN_SECONDS: float = 30.0
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        open_seconds: float = DEFAULT_OPEN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._failure_threshold = failure_threshold
+        self._open_seconds = open_seconds
+        self._clock = clock
+        self._consecutive_failures: dict[str, int] = {}
+        self._open_until: dict[str, float] = {}
+
+    def remaining_open_seconds(self, url: str) -> float:
+        return max(0.0, self._open_until.get(_host(url), 0.0) - self._clock())
+
+    def raise_if_open(self, url: str) -> None:
+        remaining_open_seconds: float = self.remaining_open_seconds(url)
+        if remaining_open_seconds > 0:
+            raise CircuitOpenError(url, remaining_open_seconds)
+
+    def record_success(self, url: str) -> None:
+        host: str = _host(url)
+        self._consecutive_failures.pop(host, None)
+        self._open_until.pop(host, None)
+
+    def record_failure(self, url: str) -> None:
+        host: str = _host(url)
+        self._consecutive_failures[host] = self._consecutive_failures.get(host, 0) + 1
+        if self._consecutive_failures[host] >= self._failure_threshold:
+            self._open_until[host] = self._clock() + self._open_seconds
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from sightcall_scraping.application.page_scraping.circuit_breaker import DEFAULT_OPEN_SECONDS, CircuitBreaker
+from sightcall_scraping.application.page_scraping.host_scheduler import HostScheduler
+
+MIN_CONCURRENT_REQUESTS: int = 1
+MAX_CONCURRENT_REQUESTS: int = 10
+MAX_CONCURRENT_PARSES: int = 4
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimits:
+    max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS
+    min_concurrent_requests: int = MIN_CONCURRENT_REQUESTS
+    max_concurrent_requests_per_host: Optional[int] = None
+    max_requests_per_second: Optional[float] = None
+    max_concurrent_parses: int = MAX_CONCURRENT_PARSES
+    circuit_open_seconds: float = DEFAULT_OPEN_SECONDS
+
+    @property
+    def host_request_limit(self) -> int:
+        return min(self.max_concurrent_requests_per_host or self.max_concurrent_requests, self.max_concurrent_requests)
+
+    @property
+    def workers_per_host(self) -> int:
+        return self.host_request_limit + self.max_concurrent_parses
+
+    def create_host_scheduler(self) -> HostScheduler:
+        return HostScheduler(
+            self.max_concurrent_requests,
+            min(self.min_concurrent_requests, self.host_request_limit),
+            self.host_request_limit,
+            self.max_requests_per_second,
+        )
+
+    def create_circuit_breaker(self) -> CircuitBreaker:
+        return CircuitBreaker(open_seconds=self.circuit_open_seconds)
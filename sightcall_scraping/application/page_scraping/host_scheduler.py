@@ -0,0 +1,46 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+
+from sightcall_scraping.application.page_scraping.adaptive_concurrency_limiter import AdaptiveConcurrencyLimiter
+from sightcall_scraping.domain.models.url import Url
+
+
+class HostScheduler:
+    def __init__(
+        self,
+        max_concurrent_requests: int,
+        min_concurrent_requests_per_host: int,
+        max_concurrent_requests_per_host: int,
+        max_requests_per_second_per_host: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_concurrent_requests < 1:
+            raise ValueError("The global request budget must be at least 1")
+        self._global_slots = asyncio.Semaphore(max_concurrent_requests)
+        self._min_concurrent_requests_per_host = min_concurrent_requests_per_host
+        self._max_concurrent_requests_per_host = max_concurrent_requests_per_host
+        self._max_requests_per_second_per_host = max_requests_per_second_per_host
+        self._clock = clock
+        self._limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+    @property
+    def hosts(self) -> list[str]:
+        return list(self._limiters)
+
+    def limiter_for(self, host: str) -> AdaptiveConcurrencyLimiter:
+        if host not in self._limiters:
+            self._limiters[host] = AdaptiveConcurrencyLimiter(
+                self._min_concurrent_requests_per_host,
+                self._max_concurrent_requests_per_host,
+                self._max_requests_per_second_per_host,
+                self._clock,
+            )
+        return self._limiters[host]
+
+    @asynccontextmanager
+    async def slot(self, url: Url) -> AsyncIterator[None]:
+        async with self.limiter_for(url.host).slot():
+            async with self._global_slots:
+                yield
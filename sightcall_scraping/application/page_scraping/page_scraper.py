@@ -0,0 +1,100 @@
+import asyncio
+from concurrent.futures import BrokenExecutor, Executor
+from types import TracebackType
+from typing import Optional, Self
+
+from sightcall_scraping.application.page_scraping.circuit_breaker import CircuitBreaker
+from sightcall_scraping.application.page_scraping.concurrency_limits import ConcurrencyLimits
+from sightcall_scraping.application.page_scraping.host_scheduler import HostScheduler
+from sightcall_scraping.domain.errors import FetchError, ParseError, SkippedResponseError
+from sightcall_scraping.domain.models.fetched_response import FetchedResponse
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.domain.ports.document_parser import DocumentParser
+from sightcall_scraping.domain.ports.metrics_recorder import MetricsRecorder
+
+
+class PageScraper:
+    def __init__(
+        self,
+        content_fetcher: ContentFetcher,
+        document_parser: DocumentParser,
+        limits: Optional[ConcurrencyLimits] = None,
+        parse_executor: Optional[Executor] = None,
+        metrics_recorder: Optional[MetricsRecorder] = None,
+    ):
+        self._content_fetcher = content_fetcher
+        self._document_parser = document_parser
+        self._limits = limits or ConcurrencyLimits()
+        self._parse_executor = parse_executor
+        self._metrics_recorder = metrics_recorder or MetricsRecorder()
+        self._host_scheduler: HostScheduler = self._limits.create_host_scheduler()
+        self._circuit_breaker: CircuitBreaker = self._limits.create_circuit_breaker()
+        self._parse_semaphore = asyncio.Semaphore(self._limits.max_concurrent_parses)
+
+    @property
+    def content_fetcher(self) -> ContentFetcher:
+        return self._content_fetcher
+
+    @property
+    def limits(self) -> ConcurrencyLimits:
+        return self._limits
+
+    @property
+    def metrics_recorder(self) -> MetricsRecorder:
+        return self._metrics_recorder
+
+    async def __aenter__(self) -> Self:
+        await self._content_fetcher.__aenter__()
+        self._host_scheduler = self._limits.create_host_scheduler()
+        self._circuit_breaker = self._limits.create_circuit_breaker()
+        self._parse_semaphore = asyncio.Semaphore(self._limits.max_concurrent_parses)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._content_fetcher.__aexit__(exc_type, exc_value, traceback)
+
+    async def scrape(self, url: Url) -> ScrapedDocument:
+        response: FetchedResponse = await self._fetch(url)
+        self._metrics_recorder.increment("pages_fetched")
+        async with self._parse_semaphore:
+            with self._metrics_recorder.timer("parse_duration_seconds"):
+                document: ScrapedDocument = await self._parse_off_event_loop(url.value, response)
+        self._metrics_recorder.increment("documents_parsed")
+        return document
+
+    async def _fetch(self, url: Url) -> FetchedResponse:
+        async with self._host_scheduler.slot(url):
+            self._circuit_breaker.raise_if_open(url.value)
+            try:
+                with self._metrics_recorder.timer("fetch_duration_seconds"):
+                    response: FetchedResponse = await self._content_fetcher.fetch_response(url.value)
+            except SkippedResponseError:
+                self._circuit_breaker.record_success(url.value)
+                raise
+            except FetchError:
+                self._circuit_breaker.record_failure(url.value)
+                raise
+        self._circuit_breaker.record_success(url.value)
+        return response
+
+    async def _parse_off_event_loop(self, url: str, response: FetchedResponse) -> ScrapedDocument:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._parse_executor,
+                self._document_parser.to_scraped_document_from_bytes,
+                url,
+                response.body,
+                response.encoding,
+            )
+        except BrokenExecutor:
+            raise
+        except Exception as error:
+            raise ParseError(url, str(error)) from error
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from typing import Callable, Optional, Tuple, Union
+
+from sightcall_scraping.application.page_scraping.backoff import (
+    MAX_RETRY_ATTEMPTS,
+    backoff_delay_seconds,
+    failure_cause,
+)
+from sightcall_scraping.application.page_scraping.page_scraper import PageScraper
+from sightcall_scraping.application.page_scraping.retry_scheduler import RetryScheduler
+from sightcall_scraping.application.recording.page_recorder import PageRecorder, ScrapedPage
+from sightcall_scraping.application.scrape_summary import ScrapeSummary
+from sightcall_scraping.domain.errors import CircuitOpenError, FetchError, ParseError, SkippedResponseError
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.models.url import Url
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+PageAttempt = Tuple[Url, int]
+
+MAX_UNFINISHED_URLS: int = 1000
+SCRAPED_PAGE_QUEUE_SIZE: int = 100
+
+
+class PageWorkerPool:
+    def __init__(
+        self,
+        page_scraper: PageScraper,
+        page_recorder: PageRecorder,
+        summary: ScrapeSummary,
+        on_progress: Callable[[int], None],
+    ):
+        self._page_scraper = page_scraper
+        self._metrics_recorder = page_scraper.metrics_recorder
+        self._page_recorder = page_recorder
+        self._summary = summary
+        self._on_progress = on_progress
+        self.scraped_pages: asyncio.Queue[Optional[ScrapedPage]] = asyncio.Queue(maxsize=SCRAPED_PAGE_QUEUE_SIZE)
+        self._retry_scheduler: RetryScheduler[PageAttempt] = RetryScheduler()
+        self._host_queues: dict[str, asyncio.Queue[Optional[PageAttempt]]] = {}
+        self._unfinished_url_slots = asyncio.Semaphore(MAX_UNFINISHED_URLS)
+        self._unfinished_url_count: int = 0
+        self._progress_count: int = 0
+        self._is_discovery_done: bool = False
+
+    async def run(self, url_queue: asyncio.Queue[Optional[Url]]) -> None:
+        retry_dispatcher: asyncio.Task[None] = asyncio.create_task(self._enqueue_due_retries())
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                await self._enqueue_discovered_urls(url_queue, task_group)
+        except ExceptionGroup as errors:
+            await self.scraped_pages.put(None)
+            raise errors.exceptions[0]
+        finally:
+            retry_dispatcher.cancel()
+        await self.scraped_pages.put(None)
+
+    async def _enqueue_discovered_urls(
+        self, url_queue: asyncio.Queue[Optional[Url]], task_group: asyncio.TaskGroup
+    ) -> None:
+        while (url := await url_queue.get()) is not None:
+            await self._unfinished_url_slots.acquire()
+            self._unfinished_url_count += 1
+            self._enqueue(url, task_group)
+        self._is_discovery_done = True
+        if self._unfinished_url_count == 0:
+            self._stop_workers()
+
+    def _enqueue(self, url: Url, task_group: asyncio.TaskGroup) -> None:
+        if url.host not in self._host_queues:
+            self._host_queues[url.host] = asyncio.Queue()
+            for _ in range(self._page_scraper.limits.workers_per_host):
+                task_group.create_task(self._scrape_urls_from_queue(self._host_queues[url.host]))
+        self._host_queues[url.host].put_nowait((url, 0))
+
+    async def _enqueue_due_retries(self) -> None:
+        while True:
+            url, attempt = await self._retry_scheduler.next_due()
+            self._host_queues[url.host].put_nowait((url, attempt))
+
+    async def _scrape_urls_from_queue(self, host_queue: asyncio.Queue[Optional[PageAttempt]]) -> None:
+        while (page_attempt := await host_queue.get()) is not None:
+            if await self._scrape_page(*page_attempt):
+                self._finish_page()
+        host_queue.put_nowait(None)
+
+    async def _scrape_page(self, url: Url, attempt: int) -> bool:
+        try:
+            document: ScrapedDocument = await self._page_scraper.scrape(url)
+        except SkippedResponseError as skip:
+            await self._skip_page(url, skip)
+        except CircuitOpenError as open_circuit:
+            self._postpone_page(url, attempt, open_circuit)
+            return False
+        except FetchError as error:
+            if attempt + 1 < MAX_RETRY_ATTEMPTS:
+                self._schedule_retry(url, attempt, error)
+                return False
+            await self._fail_page(url, error)
+        except ParseError as error:
+            await self._fail_page(url, error)
+        else:
+            await self.scraped_pages.put((url, document))
+            await self._page_recorder.record_scraped(url, document)
+        return True
+
+    async def _skip_page(self, url: Url, skip: SkippedResponseError) -> None:
+        logger.info(f"[SCRAPE_SKIP] {skip}")
+        self._metrics_recorder.increment("skipped_pages", labels={"reason": skip.reason})
+        self._summary.skipped_url_count += 1
+        await self._page_recorder.record_skipped(url)
+
+    async def _fail_page(self, url: Url, error: Union[FetchError, ParseError]) -> None:
+        logger.warning(f"[SCRAPE_FAIL] Skipping URL: {url.value} ({error})")
+        self._metrics_recorder.increment("failures", labels={"stage": "page", "cause": failure_cause(error)})
+        self._summary.failed_urls.append(url.value)
+        await self._page_recorder.record_failed(url)
+
+    def _schedule_retry(self, url: Url, attempt: int, error: FetchError) -> None:
+        delay: float = backoff_delay_seconds(attempt, error)
+        logger.info(f"[RETRY] Attempt {attempt + 1} failed for {url.value}: {error}. Retrying in {delay} seconds...")
+        self._metrics_recorder.increment("retries", labels={"stage": "page", "cause": failure_cause(error)})
+        self._retry_scheduler.schedule((url, attempt + 1), delay)
+
+    def _postpone_page(self, url: Url, attempt: int, open_circuit: CircuitOpenError) -> None:
+        logger.info(f"[POSTPONE] {open_circuit}")
+        self._metrics_recorder.increment("postponed_pages")
+        self._retry_scheduler.schedule((url, attempt), open_circuit.remaining_open_seconds)
+
+    def _finish_page(self) -> None:
+        self._progress_count += 1
+        self._on_progress(self._progress_count)
+        self._unfinished_url_count -= 1
+        self._unfinished_url_slots.release()
+        if self._is_discovery_done and self._unfinished_url_count == 0:
+            self._stop_workers()
+
+    def _stop_workers(self) -> None:
+        for host_queue in self._host_queues.values():
+            host_queue.put_nowait(None)
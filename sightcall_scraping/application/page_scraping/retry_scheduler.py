@@ -0,0 +1,41 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class RetryScheduler(Generic[T]):
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._timers: list[tuple[float, int, T]] = []
+        self._sequence = itertools.count()
+        self._timers_changed = asyncio.Event()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._timers)
+
+    def schedule(self, item: T, delay_seconds: float) -> None:
+        heapq.heappush(self._timers, (self._clock() + delay_seconds, next(self._sequence), item))
+        self._timers_changed.set()
+
+    async def next_due(self) -> T:
+        while True:
+            self._timers_changed.clear()
+            if not self._timers:
+                await self._timers_changed.wait()
+            elif await self._sleep_until(self._timers[0][0]):
+                return heapq.heappop(self._timers)[2]
+
+    async def _sleep_until(self, due_time: float) -> bool:
+        timer = asyncio.ensure_future(asyncio.sleep(max(0.0, due_time - self._clock())))
+        timers_changed = asyncio.ensure_future(self._timers_changed.wait())
+        try:
+            await asyncio.wait({timer, timers_changed}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            timer.cancel()
+            timers_changed.cancel()
+        return timer.done() and not timer.cancelled()
@@ -0,0 +1,63 @@
+import asyncio
+from typing import AsyncGenerator, Awaitable, Callable, List, Optional
+
+from sightcall_scraping.application.discovery.url_discovery import UrlSink
+from sightcall_scraping.application.page_scraping.page_scraper import PageScraper
+from sightcall_scraping.application.page_scraping.page_worker_pool import PageWorkerPool
+from sightcall_scraping.application.recording.page_recorder import PageRecorder, ScrapedPage
+from sightcall_scraping.application.scrape_summary import ScrapeSummary
+from sightcall_scraping.domain.models.url import Url
+
+URL_QUEUE_SIZE: int = 1000
+STORAGE_BATCH_SIZE: int = 50
+
+UrlDiscoverer = Callable[[UrlSink], Awaitable[None]]
+
+
+class ScrapePipeline:
+    def __init__(
+        self,
+        page_scraper: PageScraper,
+        page_recorder: PageRecorder,
+        summary: ScrapeSummary,
+        on_progress: Callable[[int], None],
+    ):
+        self._page_recorder = page_recorder
+        self._worker_pool = PageWorkerPool(page_scraper, page_recorder, summary, on_progress)
+        self._url_queue: asyncio.Queue[Optional[Url]] = asyncio.Queue(maxsize=URL_QUEUE_SIZE)
+
+    async def scraped_batches(self, discover_urls: UrlDiscoverer) -> AsyncGenerator[List[ScrapedPage], None]:
+        tasks: List[asyncio.Task[None]] = [
+            asyncio.create_task(self._discover(discover_urls)),
+            asyncio.create_task(self._worker_pool.run(self._url_queue)),
+        ]
+        try:
+            async for batch in self._batches():
+                yield batch
+                await self._page_recorder.record_stored(batch)
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _discover(self, discover_urls: UrlDiscoverer) -> None:
+        try:
+            await discover_urls(self._queue_url)
+        finally:
+            await self._url_queue.put(None)
+
+    async def _queue_url(self, url: Url) -> None:
+        await self._page_recorder.record_discovered(url)
+        await self._url_queue.put(url)
+
+    async def _batches(self) -> AsyncGenerator[List[ScrapedPage], None]:
+        scraped_pages: asyncio.Queue[Optional[ScrapedPage]] = self._worker_pool.scraped_pages
+        batch: List[ScrapedPage] = []
+        while (scraped_page := await scraped_pages.get()) is not None:
+            batch.append(scraped_page)
+            if len(batch) >= STORAGE_BATCH_SIZE or scraped_pages.empty():
+                yield batch
+                batch = []
+        if batch:
+            yield batch
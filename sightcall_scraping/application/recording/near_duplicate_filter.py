@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Callable, List, Optional, Self
+
+from sightcall_scraping.application.recording.near_duplicate_index import MinHashNearDuplicateIndex, NearDuplicateIndex
+from sightcall_scraping.application.scrape_summary import ScrapeSummary
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+
+
+class NearDuplicateFilter:
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+    def filter(self, documents: List[ScrapedDocument], summary: ScrapeSummary) -> List[ScrapedDocument]:
+        return documents
+
+
+class IndexedNearDuplicateFilter(NearDuplicateFilter, ABC):
+    def __init__(self, create_near_duplicate_index: Callable[[], NearDuplicateIndex] = MinHashNearDuplicateIndex):
+        self._create_near_duplicate_index = create_near_duplicate_index
+        self._near_duplicate_index: NearDuplicateIndex = create_near_duplicate_index()
+
+    def __enter__(self) -> Self:
+        self._near_duplicate_index = self._create_near_duplicate_index()
+        return self
+
+    def filter(self, documents: List[ScrapedDocument], summary: ScrapeSummary) -> List[ScrapedDocument]:
+        kept_documents: List[ScrapedDocument] = []
+        for document in documents:
+            canonical_url: Optional[str] = self._near_duplicate_index.find_or_add(document)
+            if canonical_url is None:
+                kept_documents.append(document)
+                continue
+            summary.near_duplicate_document_count += 1
+            kept_documents.extend(self._kept_near_duplicates(document, canonical_url))
+        return kept_documents
+
+    @abstractmethod
+    def _kept_near_duplicates(self, document: ScrapedDocument, canonical_url: str) -> List[ScrapedDocument]:
+        pass
+
+
+class LinkingNearDuplicateFilter(IndexedNearDuplicateFilter):
+    def _kept_near_duplicates(self, document: ScrapedDocument, canonical_url: str) -> List[ScrapedDocument]:
+        return [ScrapedDocument(document.url, document.title, document.content, duplicate_of=canonical_url)]
+
+
+class DroppingNearDuplicateFilter(IndexedNearDuplicateFilter):
+    def _kept_near_duplicates(self, document: ScrapedDocument, canonical_url: str) -> List[ScrapedDocument]:
+        return []
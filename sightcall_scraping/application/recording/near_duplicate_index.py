@@ -0,0 +1,88 @@
+from abc import ABC, abstractmethod
+from array import array
+from typing import List, Optional
+
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+
+DEFAULT_SIMILARITY_THRESHOLD: float = 0.9
+DEFAULT_SIGNATURE_SIZE: int = 128
+DEFAULT_BAND_COUNT: int = 16
+DEFAULT_SHINGLE_SIZE: int = 5
+HASH_MASK: int = (1 << 64) - 1
+EMPTY_BIN: int = HASH_MASK
+
+
+class NearDuplicateIndex(ABC):
+    @abstractmethod
+    def find_or_add(self, document: ScrapedDocument) -> Optional[str]:
+        pass
+
+
+class MinHashNearDuplicateIndex(NearDuplicateIndex):
+    def __init__(
+        self,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        signature_size: int = DEFAULT_SIGNATURE_SIZE,
+        band_count: int = DEFAULT_BAND_COUNT,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    ):
+        if signature_size % band_count:
+            raise ValueError("Signature size must be a multiple of the band count")
+        self._similarity_threshold = similarity_threshold
+        self._signature_size = signature_size
+        self._band_count = band_count
+        self._rows_per_band = signature_size // band_count
+        self._shingle_size = shingle_size
+        self._urls: List[str] = []
+        self._signatures: List[array] = []
+        self._buckets: dict[int, int] = {}
+
+    def find_or_add(self, document: ScrapedDocument) -> Optional[str]:
+        signature: Optional[array] = self._signature(document.content)
+        if signature is None:
+            return None
+        band_keys: List[int] = [
+            hash((band, tuple(signature[band * self._rows_per_band : (band + 1) * self._rows_per_band])))
+            for band in range(self._band_count)
+        ]
+        compared_ids: set[int] = set()
+        for band_key in band_keys:
+            candidate_id: Optional[int] = self._buckets.get(band_key)
+            if candidate_id is None or candidate_id in compared_ids:
+                continue
+            compared_ids.add(candidate_id)
+            if self._similarity(signature, self._signatures[candidate_id]) >= self._similarity_threshold:
+                return self._urls[candidate_id]
+        document_id: int = len(self._urls)
+        self._urls.append(document.url)
+        self._signatures.append(signature)
+        for band_key in band_keys:
+            self._buckets.setdefault(band_key, document_id)
+        return None
+
+    def _signature(self, content: str) -> Optional[array]:
+        words: List[str] = content.split()
+        if not words:
+            return None
+        bins: array = array("Q", [EMPTY_BIN]) * self._signature_size
+        for start in range(max(1, len(words) - self._shingle_size + 1)):
+            shingle_hash: int = hash(tuple(words[start : start + self._shingle_size])) & HASH_MASK
+            bin_index, value = shingle_hash % self._signature_size, shingle_hash // self._signature_size
+            if value < bins[bin_index]:
+                bins[bin_index] = value
+        return self._densify(bins)
+
+    def _densify(self, bins: array) -> array:
+        size: int = len(bins)
+        signature: array = array(bins.typecode, bins)
+        for bin_index in range(size):
+            distance: int = 1
+            while signature[bin_index] == EMPTY_BIN:
+                borrowed: int = bins[(bin_index + distance) % size]
+                if borrowed != EMPTY_BIN:
+                    signature[bin_index] = borrowed + distance * size
+                distance += 1
+        return signature
+
+    def _similarity(self, signature: array, other_signature: array) -> float:
+        return sum(a == b for a, b in zip(signature, other_signature)) / self._signature_size
@@ -0,0 +1,106 @@
+from abc import ABC
+from contextlib import AsyncExitStack
+from types import TracebackType
+from typing import List, Optional, Self, Sequence, Tuple
+
+from sightcall_scraping.domain.models.run_progress import RunProgress
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.models.url import Url
+
+ScrapedPage = Tuple[Url, ScrapedDocument]
+
+
+class PageRecorder(ABC):
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+    @property
+    def is_durable(self) -> bool:
+        return False
+
+    async def load_progress(self) -> RunProgress:
+        return RunProgress()
+
+    async def is_unchanged(self, url: Url) -> bool:
+        return False
+
+    async def record_discovered(self, url: Url) -> None:
+        pass
+
+    async def record_scraped(self, url: Url, document: ScrapedDocument) -> None:
+        pass
+
+    async def record_stored(self, pages: List[ScrapedPage]) -> None:
+        pass
+
+    async def record_skipped(self, url: Url) -> None:
+        pass
+
+    async def record_failed(self, url: Url) -> None:
+        pass
+
+
+class PageRecorders(PageRecorder):
+    def __init__(self, page_recorders: Sequence[PageRecorder]):
+        self._page_recorders = page_recorders
+        self._resources = AsyncExitStack()
+
+    async def __aenter__(self) -> Self:
+        async with AsyncExitStack() as resources:
+            for page_recorder in self._page_recorders:
+                await resources.enter_async_context(page_recorder)
+            self._resources = resources.pop_all()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._resources.__aexit__(exc_type, exc_value, traceback)
+
+    @property
+    def is_durable(self) -> bool:
+        return any(page_recorder.is_durable for page_recorder in self._page_recorders)
+
+    async def load_progress(self) -> RunProgress:
+        progresses: List[RunProgress] = [await page_recorder.load_progress() for page_recorder in self._page_recorders]
+        return RunProgress(
+            set().union(*(progress.completed_urls for progress in progresses)),
+            [url for progress in progresses for url in progress.unfinished_urls],
+        )
+
+    async def is_unchanged(self, url: Url) -> bool:
+        for page_recorder in self._page_recorders:
+            if await page_recorder.is_unchanged(url):
+                return True
+        return False
+
+    async def record_discovered(self, url: Url) -> None:
+        for page_recorder in self._page_recorders:
+            await page_recorder.record_discovered(url)
+
+    async def record_scraped(self, url: Url, document: ScrapedDocument) -> None:
+        for page_recorder in self._page_recorders:
+            await page_recorder.record_scraped(url, document)
+
+    async def record_stored(self, pages: List[ScrapedPage]) -> None:
+        for page_recorder in self._page_recorders:
+            await page_recorder.record_stored(pages)
+
+    async def record_skipped(self, url: Url) -> None:
+        for page_recorder in self._page_recorders:
+            await page_recorder.record_skipped(url)
+
+    async def record_failed(self, url: Url) -> None:
+        for page_recorder in self._page_recorders:
+            await page_recorder.record_failed(url)
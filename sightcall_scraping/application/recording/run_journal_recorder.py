@@ -0,0 +1,63 @@
+from types import TracebackType
+from typing import List, Optional, Self
+
+from sightcall_scraping.application.recording.page_recorder import PageRecorder, ScrapedPage
+from sightcall_scraping.domain.models.run_progress import RunProgress
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.ports.run_journal import RunJournal
+
+DISCOVERED_URL_BATCH_SIZE: int = 100
+
+
+class RunJournalRecorder(PageRecorder):
+    def __init__(self, run_journal: RunJournal):
+        self._run_journal = run_journal
+        self._progress = RunProgress()
+        self._discovered_urls: List[Url] = []
+
+    async def __aenter__(self) -> Self:
+        await self._run_journal.__aenter__()
+        self._discovered_urls = []
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        try:
+            await self._record_discovered_urls()
+        finally:
+            await self._run_journal.__aexit__(exc_type, exc_value, traceback)
+
+    @property
+    def is_durable(self) -> bool:
+        return True
+
+    async def load_progress(self) -> RunProgress:
+        self._progress = await self._run_journal.load_progress()
+        return self._progress
+
+    async def record_discovered(self, url: Url) -> None:
+        if not self._progress.is_known(url.value):
+            self._discovered_urls.append(url)
+        if len(self._discovered_urls) >= DISCOVERED_URL_BATCH_SIZE:
+            await self._record_discovered_urls()
+
+    async def record_stored(self, pages: List[ScrapedPage]) -> None:
+        await self._record_discovered_urls()
+        await self._run_journal.record_completed([url.value for url, _ in pages])
+
+    async def record_skipped(self, url: Url) -> None:
+        await self._record_discovered_urls()
+        await self._run_journal.record_completed([url.value])
+
+    async def record_failed(self, url: Url) -> None:
+        await self._record_discovered_urls()
+        await self._run_journal.record_failed(url.value)
+
+    async def _record_discovered_urls(self) -> None:
+        urls, self._discovered_urls = self._discovered_urls, []
+        if urls:
+            await self._run_journal.record_discovered(urls)
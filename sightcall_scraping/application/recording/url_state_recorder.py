@@ -0,0 +1,35 @@
+from types import TracebackType
+from typing import List, Optional, Self
+
+from sightcall_scraping.application.recording.page_recorder import PageRecorder, ScrapedPage
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.models.url_state import UrlState
+from sightcall_scraping.domain.ports.url_state_store import UrlStateStore
+
+
+class UrlStateRecorder(PageRecorder):
+    def __init__(self, url_state_store: UrlStateStore):
+        self._url_state_store = url_state_store
+
+    async def __aenter__(self) -> Self:
+        await self._url_state_store.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._url_state_store.__aexit__(exc_type, exc_value, traceback)
+
+    async def record_stored(self, pages: List[ScrapedPage]) -> None:
+        await self._url_state_store.save_all(
+            [UrlState(url.value, url.lastmod, document.content_hash) for url, document in pages]
+        )
+
+
+class IncrementalUrlStateRecorder(UrlStateRecorder):
+    async def is_unchanged(self, url: Url) -> bool:
+        state: Optional[UrlState] = await self._url_state_store.get(url.value)
+        return state is not None and state.is_up_to_date_with(url.lastmod)
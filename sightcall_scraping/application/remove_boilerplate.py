@@ -0,0 +1,65 @@
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import List
+
+from sightcall_scraping.domain.boilerplate_detector import BoilerplateDetector
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.scraped_document_source import ScrapedDocumentSource
+from sightcall_scraping.domain.ports.scraped_document_storage import ScrapedDocumentStorage
+
+STORAGE_BATCH_SIZE: int = 50
+
+
+@dataclass
+class BoilerplateReport:
+    document_count: int = 0
+    changed_document_count: int = 0
+    original_content_bytes: int = 0
+    stripped_content_bytes: int = 0
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.original_content_bytes - self.stripped_content_bytes
+
+    @property
+    def saved_ratio(self) -> float:
+        return self.saved_bytes / self.original_content_bytes if self.original_content_bytes else 0.0
+
+
+class RemoveBoilerplate:
+    def __init__(
+        self,
+        source: ScrapedDocumentSource,
+        storage: ScrapedDocumentStorage,
+        boilerplate_detector: BoilerplateDetector,
+    ):
+        self._source = source
+        self._storage = storage
+        self._boilerplate_detector = boilerplate_detector
+
+    async def execute(self) -> BoilerplateReport:
+        async with aclosing(self._source.iter_documents()) as documents:
+            async for document in documents:
+                self._boilerplate_detector.learn(document.content)
+
+        report = BoilerplateReport()
+        async with self._storage, aclosing(self._source.iter_documents()) as documents:
+            batch: List[ScrapedDocument] = []
+            async for document in documents:
+                batch.append(self._strip(document, report))
+                if len(batch) >= STORAGE_BATCH_SIZE:
+                    await self._storage.save_all(batch)
+                    batch = []
+            if batch:
+                await self._storage.save_all(batch)
+        return report
+
+    def _strip(self, document: ScrapedDocument, report: BoilerplateReport) -> ScrapedDocument:
+        content: str = self._boilerplate_detector.remove_boilerplate(document.content)
+        report.document_count += 1
+        report.original_content_bytes += len(document.content.encode("utf-8"))
+        report.stripped_content_bytes += len(content.encode("utf-8"))
+        if content == document.content:
+            return document
+        report.changed_document_count += 1
+        return document.with_content(content)
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+from concurrent.futures import Executor
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from sightcall_scraping.application.page_scraping.concurrency_limits import MAX_CONCURRENT_PARSES
+from sightcall_scraping.domain.models.archived_response import ArchivedResponse
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.document_parser import DocumentParser
+from sightcall_scraping.domain.ports.response_archive import ResponseArchive
+from sightcall_scraping.domain.ports.scraped_document_storage import ScrapedDocumentStorage
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+STORAGE_BATCH_SIZE: int = 50
+PENDING_PARSES_PER_WORKER: int = 2
+
+
+@dataclass
+class ReparseSummary:
+    reparsed_document_count: int = 0
+    superseded_response_count: int = 0
+    failed_urls: list[str] = field(default_factory=list)
+
+
+class ReparseArchivedResponses:
+    def __init__(
+        self,
+        response_archive: ResponseArchive,
+        document_parser: DocumentParser,
+        storage: ScrapedDocumentStorage,
+        parse_executor: Optional[Executor] = None,
+        max_concurrent_parses: int = MAX_CONCURRENT_PARSES,
+    ):
+        self._response_archive = response_archive
+        self._document_parser = document_parser
+        self._storage = storage
+        self._parse_executor = parse_executor
+        self._max_pending_parses = max_concurrent_parses * PENDING_PARSES_PER_WORKER
+
+    async def execute(self, on_progress: Callable[[int], None]) -> ReparseSummary:
+        summary = ReparseSummary()
+        latest_response_indexes: dict[str, int] = await self._index_latest_responses()
+        pending_parses: dict[asyncio.Future[ScrapedDocument], str] = {}
+        batch: List[ScrapedDocument] = []
+
+        async def collect_finished_parses(return_when: str) -> None:
+            finished_parses, _ = await asyncio.wait(pending_parses, return_when=return_when)
+            for finished_parse in finished_parses:
+                url: str = pending_parses.pop(finished_parse)
+                if (error := finished_parse.exception()) is not None:
+                    logger.warning(f"[REPARSE_FAIL] Could not parse archived page: {url} ({error})")
+                    summary.failed_urls.append(url)
+                    continue
+                batch.append(finished_parse.result())
+                if len(batch) >= STORAGE_BATCH_SIZE:
+                    await self._save_batch(batch, summary, on_progress)
+
+        async with self._storage, aclosing(self._response_archive.iter_responses()) as responses:
+            index: int = 0
+            async for response in responses:
+                if latest_response_indexes[response.url] != index:
+                    summary.superseded_response_count += 1
+                else:
+                    if len(pending_parses) >= self._max_pending_parses:
+                        await collect_finished_parses(asyncio.FIRST_COMPLETED)
+                    pending_parses[self._parse(response)] = response.url
+                index += 1
+            if pending_parses:
+                await collect_finished_parses(asyncio.ALL_COMPLETED)
+            if batch:
+                await self._save_batch(batch, summary, on_progress)
+        return summary
+
+    async def _index_latest_responses(self) -> dict[str, int]:
+        latest_response_indexes: dict[str, int] = {}
+        async with aclosing(self._response_archive.iter_responses()) as responses:
+            index: int = 0
+            async for response in responses:
+                latest_response_indexes[response.url] = index
+                index += 1
+        return latest_response_indexes
+
+    def _parse(self, response: ArchivedResponse) -> asyncio.Future[ScrapedDocument]:
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(
+            self._parse_executor,
+            self._document_parser.to_scraped_document_from_bytes,
+            response.url,
+            response.body,
+            response.encoding,
+        )
+
+    async def _save_batch(
+        self, batch: List[ScrapedDocument], summary: ReparseSummary, on_progress: Callable[[int], None]
+    ) -> None:
+        await self._storage.save_all(list(batch))
+        summary.reparsed_document_count += len(batch)
+        batch.clear()
+        on_progress(summary.reparsed_document_count)
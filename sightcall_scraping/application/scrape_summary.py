@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ScrapeSummary:
+    scraped_document_count: int = 0
+    unchanged_url_count: int = 0
+    duplicate_url_count: int = 0
+    near_duplicate_document_count: int = 0
+    previously_completed_url_count: int = 0
+    crawled_url_count: int = 0
+    skipped_url_count: int = 0
+    failed_urls: list[str] = field(default_factory=list)
+    sitemap_index_count: int = 0
+    failed_sitemap_index_urls: list[str] = field(default_factory=list)
+    failed_sitemap_urls: list[str] = field(default_factory=list)
+
+    @property
+    def failed_url_count(self) -> int:
+        return len(self.failed_urls)
+
+    @property
+    def is_every_sitemap_index_failed(self) -> bool:
+        return self.sitemap_index_count > 0 and len(self.failed_sitemap_index_urls) == self.sitemap_index_count
@@ -0,0 +1,42 @@
+from typing import List, Optional, Sequence, Union
+
+from sightcall_scraping.application.discovery.url_discovery import DiscoveryRun, UrlDiscovery, sitemap_index_url_list
+from sightcall_scraping.application.recording.page_recorder import PageRecorder
+from sightcall_scraping.application.scrape_summary import ScrapeSummary
+from sightcall_scraping.application.work_queue.work_queue_consumer import WORK_QUEUE_BATCH_SIZE
+from sightcall_scraping.domain.models.run_progress import RunProgress
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.ports.work_queue import WorkQueue
+
+
+class EnqueueSitemapUrls:
+    def __init__(self, url_discovery: UrlDiscovery, work_queue: WorkQueue):
+        self._url_discovery = url_discovery
+        self._work_queue = work_queue
+        self._batch: List[Url] = []
+
+    async def execute(
+        self, sitemap_index_urls: Union[str, Sequence[str]], max_urls: Optional[int] = None
+    ) -> ScrapeSummary:
+        summary = ScrapeSummary()
+        run = DiscoveryRun(
+            sitemap_index_url_list(sitemap_index_urls), max_urls, RunProgress(), summary, PageRecorder()
+        )
+        self._batch = []
+        async with self._url_discovery, self._work_queue:
+            try:
+                await self._url_discovery.discover(run, self._add_url)
+                await self._add_batch()
+            finally:
+                await self._work_queue.finish_adding()
+        return summary
+
+    async def _add_url(self, url: Url) -> None:
+        self._batch.append(url)
+        if len(self._batch) >= WORK_QUEUE_BATCH_SIZE:
+            await self._add_batch()
+
+    async def _add_batch(self) -> None:
+        urls, self._batch = self._batch, []
+        if urls:
+            await self._work_queue.add(urls)
@@ -0,0 +1,37 @@
+from contextlib import aclosing
+from typing import Callable, List
+
+from sightcall_scraping.application.page_scraping.page_scraper import PageScraper
+from sightcall_scraping.application.page_scraping.scrape_pipeline import ScrapePipeline
+from sightcall_scraping.application.recording.page_recorder import ScrapedPage
+from sightcall_scraping.application.scrape_summary import ScrapeSummary
+from sightcall_scraping.application.work_queue.work_queue_consumer import CLAIMED_URLS_PER_REQUEST, WorkQueueConsumer
+from sightcall_scraping.domain.ports.metrics_recorder import MetricsRecorder
+from sightcall_scraping.domain.ports.scraped_document_storage import ScrapedDocumentStorage
+from sightcall_scraping.domain.ports.work_queue import WorkQueue
+
+
+class ScrapeQueuedPages:
+    def __init__(self, page_scraper: PageScraper, storage: ScrapedDocumentStorage, work_queue: WorkQueue):
+        self._page_scraper = page_scraper
+        self._metrics_recorder: MetricsRecorder = page_scraper.metrics_recorder
+        self._storage = storage
+        self._work_queue = work_queue
+
+    async def execute(self, on_progress: Callable[[int], None]) -> ScrapeSummary:
+        summary = ScrapeSummary()
+        max_claimed_urls: int = self._page_scraper.limits.max_concurrent_requests * CLAIMED_URLS_PER_REQUEST
+        work_queue_consumer = WorkQueueConsumer(self._work_queue, max_claimed_urls)
+        async with self._storage, self._page_scraper, work_queue_consumer:
+            pipeline = ScrapePipeline(self._page_scraper, work_queue_consumer, summary, on_progress)
+            async with aclosing(pipeline.scraped_batches(work_queue_consumer.put_claimed_urls)) as batches:
+                async for batch in batches:
+                    await self._store(batch)
+                    summary.scraped_document_count += len(batch)
+        return summary
+
+    async def _store(self, batch: List[ScrapedPage]) -> None:
+        with self._metrics_recorder.timer("store_duration_seconds"):
+            await self._storage.save_all([document for _, document in batch])
+        self._metrics_recorder.increment("documents_stored", len(batch))
+        await self._storage.flush()
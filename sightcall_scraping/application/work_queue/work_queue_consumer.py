@@ -0,0 +1,84 @@
+import asyncio
+from types import TracebackType
+from typing import Awaitable, Callable, List, Optional, Self
+
+from sightcall_scraping.application.discovery.url_discovery import UrlSink
+from sightcall_scraping.application.recording.page_recorder import PageRecorder, ScrapedPage
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.ports.work_queue import WorkQueue
+
+POLL_INTERVAL_SECONDS: float = 1.0
+WORK_QUEUE_BATCH_SIZE: int = 100
+CLAIMED_URLS_PER_REQUEST: int = 2
+
+
+class WorkQueueConsumer(PageRecorder):
+    def __init__(
+        self,
+        work_queue: WorkQueue,
+        max_claimed_urls: int,
+        poll_interval_seconds: float = POLL_INTERVAL_SECONDS,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self._work_queue = work_queue
+        self._max_claimed_urls = max(1, max_claimed_urls)
+        self._min_claim_size = max(1, self._max_claimed_urls // 2)
+        self._poll_interval_seconds = poll_interval_seconds
+        self._sleep = sleep
+        self._claimed_count: int = 0
+        self._url_finished = asyncio.Event()
+
+    async def __aenter__(self) -> Self:
+        await self._work_queue.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._work_queue.__aexit__(exc_type, exc_value, traceback)
+
+    @property
+    def is_durable(self) -> bool:
+        return True
+
+    async def put_claimed_urls(self, on_url: UrlSink) -> None:
+        while urls := await self.next_urls():
+            for url in urls:
+                await on_url(url)
+
+    async def next_urls(self) -> List[Url]:
+        while True:
+            self._url_finished.clear()
+            claim_size: int = self._max_claimed_urls - self._claimed_count
+            if claim_size < self._min_claim_size:
+                await self._url_finished.wait()
+                continue
+            urls: List[Url] = await self._work_queue.claim(claim_size)
+            if urls:
+                self._claimed_count += len(urls)
+                return urls
+            if await self._work_queue.is_drained():
+                return []
+            await self._sleep(self._poll_interval_seconds)
+
+    def finish(self) -> None:
+        self._claimed_count -= 1
+        self._url_finished.set()
+
+    async def record_scraped(self, url: Url, document: ScrapedDocument) -> None:
+        self.finish()
+
+    async def record_stored(self, pages: List[ScrapedPage]) -> None:
+        await self._work_queue.complete([url for url, _ in pages])
+
+    async def record_skipped(self, url: Url) -> None:
+        await self._work_queue.complete([url])
+        self.finish()
+
+    async def record_failed(self, url: Url) -> None:
+        await self._work_queue.complete([url])
+        self.finish()
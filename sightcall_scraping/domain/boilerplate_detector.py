@@ -0,0 +1,91 @@
+import math
+import re
+from typing import List
+
+WORD = re.compile(r"\S+")
+DEFAULT_SHINGLE_SIZE: int = 8
+DEFAULT_THRESHOLD: float = 0.5
+DEFAULT_MIN_DOCUMENT_COUNT: int = 3
+DEFAULT_MAX_FREQUENCY_ERROR: float = 0.01
+
+
+class BoilerplateDetector:
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        min_document_count: int = DEFAULT_MIN_DOCUMENT_COUNT,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        max_frequency_error: float = DEFAULT_MAX_FREQUENCY_ERROR,
+    ):
+        self._threshold = threshold
+        self._min_document_count = min_document_count
+        self._shingle_size = shingle_size
+        self._pruning_interval: int = math.ceil(1 / max_frequency_error)
+        self._document_frequencies: dict[int, int] = {}
+        self._max_missed_frequencies: dict[int, int] = {}
+        self._document_count: int = 0
+
+    @property
+    def document_count(self) -> int:
+        return self._document_count
+
+    @property
+    def tracked_shingle_count(self) -> int:
+        return len(self._document_frequencies)
+
+    def learn(self, content: str) -> None:
+        words: List[str] = WORD.findall(content)
+        pruning_round: int = self._document_count // self._pruning_interval + 1
+        for shingle_hash in {self._shingle_hash(words, start) for start in range(len(words) - self._shingle_size + 1)}:
+            self._count_shingle(shingle_hash, pruning_round)
+        self._document_count += 1
+        if self._document_count % self._pruning_interval == 0:
+            self._drop_rare_shingles(pruning_round)
+
+    def remove_boilerplate(self, content: str) -> str:
+        word_spans: List[re.Match[str]] = list(WORD.finditer(content))
+        words: List[str] = [span.group() for span in word_spans]
+        is_boilerplate_word: List[bool] = [False] * len(words)
+        min_frequency: float = max(self._min_document_count, self._threshold * self._document_count)
+        for start in range(len(words) - self._shingle_size + 1):
+            if self._document_frequencies.get(self._shingle_hash(words, start), 0) >= min_frequency:
+                is_boilerplate_word[start : start + self._shingle_size] = [True] * self._shingle_size
+        if not any(is_boilerplate_word):
+            return content
+        return _join_kept_words(content, word_spans, is_boilerplate_word)
+
+    def _count_shingle(self, shingle_hash: int, pruning_round: int) -> None:
+        if shingle_hash in self._document_frequencies:
+            self._document_frequencies[shingle_hash] += 1
+            return
+        self._document_frequencies[shingle_hash] = 1
+        if pruning_round > 1:
+            self._max_missed_frequencies[shingle_hash] = pruning_round - 1
+
+    def _drop_rare_shingles(self, pruning_round: int) -> None:
+        rare_shingle_hashes: List[int] = [
+            shingle_hash
+            for shingle_hash, frequency in self._document_frequencies.items()
+            if frequency + self._max_missed_frequencies.get(shingle_hash, 0) <= pruning_round
+        ]
+        for shingle_hash in rare_shingle_hashes:
+            del self._document_frequencies[shingle_hash]
+            self._max_missed_frequencies.pop(shingle_hash, None)
+
+    def _shingle_hash(self, words: List[str], start: int) -> int:
+        return hash(tuple(words[start : start + self._shingle_size]))
+
+
+def _join_kept_words(content: str, word_spans: List[re.Match[str]], is_removed: List[bool]) -> str:
+    kept_text: List[str] = []
+    previous_kept_index: int = -2
+    for index, span in enumerate(word_spans):
+        if is_removed[index]:
+            continue
+        if kept_text:
+            kept_text.append(
+                content[word_spans[index - 1].end() : span.start()] if previous_kept_index == index - 1 else " "
+            )
+        kept_text.append(span.group())
+        previous_kept_index = index
+    return "".join(kept_text)
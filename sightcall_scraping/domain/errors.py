@@ -0,0 +1,44 @@
+from typing import Optional
+
+
+class FetchError(Exception):
+    def __init__(self, url: str, detail: str):
+        super().__init__(f"Could not fetch {url}: {detail}")
+        self.url = url
+
+
+class ThrottledError(FetchError):
+    def __init__(self, url: str, retry_after_seconds: Optional[float] = None):
+        super().__init__(url, "throttled by server")
+        self.retry_after_seconds = retry_after_seconds
+
+
+class ParseError(Exception):
+    def __init__(self, url: str, detail: str):
+        super().__init__(f"Could not parse {url}: {detail}")
+        self.url = url
+
+
+class InvalidSitemapError(Exception):
+    def __init__(self, detail: str):
+        super().__init__(f"Invalid sitemap: {detail}")
+
+
+class SkippedResponseError(Exception):
+    def __init__(self, url: str, reason: str, detail: str):
+        super().__init__(f"Skipped {url}: {detail}")
+        self.url = url
+        self.reason = reason
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, url: str, remaining_open_seconds: float):
+        super().__init__(f"Circuit open for host of {url}, retrying in {remaining_open_seconds:.1f} seconds")
+        self.url = url
+        self.remaining_open_seconds = remaining_open_seconds
+
+
+class UnknownRunError(Exception):
+    def __init__(self, run_id: str):
+        super().__init__(f"No run with id {run_id} to resume")
+        self.run_id = run_id
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Optional
+
+from sightcall_scraping.domain.models.fetched_response import charset_of
+
+
+class ArchivedResponse:
+    def __init__(self, url: str, body: bytes, fetched_at: datetime, content_type: Optional[str] = None):
+        self._url = url
+        self._body = body
+        self._fetched_at = fetched_at
+        self._content_type = content_type
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def body(self) -> bytes:
+        return self._body
+
+    @property
+    def fetched_at(self) -> datetime:
+        return self._fetched_at
+
+    @property
+    def content_type(self) -> Optional[str]:
+        return self._content_type
+
+    @property
+    def encoding(self) -> str:
+        return charset_of(self._content_type)
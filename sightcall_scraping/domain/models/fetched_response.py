@@ -0,0 +1,55 @@
+import codecs
+from email.message import Message
+from typing import Mapping, Optional
+
+DEFAULT_ENCODING: str = "utf-8"
+
+
+def charset_of(content_type: Optional[str]) -> str:
+    if not content_type:
+        return DEFAULT_ENCODING
+    message = Message()
+    message["Content-Type"] = content_type
+    charset: Optional[str] = message.get_content_charset()
+    if not charset:
+        return DEFAULT_ENCODING
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return DEFAULT_ENCODING
+
+
+class FetchedResponse:
+    def __init__(self, url: str, body: bytes, status_code: int = 200, headers: Optional[Mapping[str, str]] = None):
+        self._url = url
+        self._body = body
+        self._status_code = status_code
+        self._headers: dict[str, str] = {name.lower(): value for name, value in (headers or {}).items()}
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def body(self) -> bytes:
+        return self._body
+
+    @property
+    def status_code(self) -> int:
+        return self._status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._headers
+
+    @property
+    def content_type(self) -> Optional[str]:
+        return self._headers.get("content-type")
+
+    @property
+    def encoding(self) -> str:
+        return charset_of(self.content_type)
+
+    @property
+    def text(self) -> str:
+        return self._body.decode(self.encoding, errors="replace")
@@ -0,0 +1,21 @@
+from typing import Iterable, Optional
+
+from sightcall_scraping.domain.models.url import Url
+
+
+class RunProgress:
+    def __init__(self, completed_urls: Optional[Iterable[str]] = None, unfinished_urls: Optional[list[Url]] = None):
+        self._completed_urls: set[str] = set(completed_urls or [])
+        self._unfinished_urls: list[Url] = unfinished_urls or []
+        self._known_urls: set[str] = self._completed_urls | {url.value for url in self._unfinished_urls}
+
+    @property
+    def completed_urls(self) -> set[str]:
+        return self._completed_urls
+
+    @property
+    def unfinished_urls(self) -> list[Url]:
+        return self._unfinished_urls
+
+    def is_known(self, url: str) -> bool:
+        return url in self._known_urls
@@ -1,8 +1,21 @@
+import hashlib
+from typing import Optional, Sequence
+
+
 class ScrapedDocument:
-    def __init__(self, url: str, title: str, content: str):
+    def __init__(
+        self,
+        url: str,
+        title: str,
+        content: str,
+        duplicate_of: Optional[str] = None,
+        links: Sequence[str] = (),
+    ):
         self._url = url
         self._title = title
         self._content = content
+        self._duplicate_of = duplicate_of
+        self._links = tuple(links)
 
     @property
     def url(self) -> str:
@@ -15,3 +28,18 @@ class ScrapedDocument:
     @property
     def content(self) -> str:
         return self._content
+
+    @property
+    def duplicate_of(self) -> Optional[str]:
+        return self._duplicate_of
+
+    @property
+    def links(self) -> tuple[str, ...]:
+        return self._links
+
+    def with_content(self, content: str) -> "ScrapedDocument":
+        return ScrapedDocument(self._url, self._title, content, self._duplicate_of, self._links)
+
+    @property
+    def content_hash(self) -> str:
+        return hashlib.sha256(f"{self._title}\0{self._content}".encode("utf-8")).hexdigest()
@@ -0,0 +1,15 @@
+from .url import Url
+
+
+class SitemapEntry:
+    def __init__(self, url: Url, is_sitemap: bool):
+        self._url = url
+        self._is_sitemap = is_sitemap
+
+    @property
+    def url(self) -> Url:
+        return self._url
+
+    @property
+    def is_sitemap(self) -> bool:
+        return self._is_sitemap
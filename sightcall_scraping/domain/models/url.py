@@ -1,12 +1,52 @@
+from datetime import datetime
+from typing import Optional
+from urllib.parse import SplitResult, parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_PORTS: dict[str, int] = {"http": 80, "https": 443}
+
+
 class Url:
-    def __init__(self, value: str):
+    def __init__(self, value: str, lastmod: Optional[datetime] = None):
         self._value = value
+        self._lastmod = lastmod
+        self._canonical_value: Optional[str] = None
 
     @property
     def value(self) -> str:
         return self._value
 
+    @property
+    def lastmod(self) -> Optional[datetime]:
+        return self._lastmod
+
+    @property
+    def host(self) -> str:
+        return urlsplit(self._value).netloc.lower()
+
+    @property
+    def canonical_value(self) -> str:
+        if self._canonical_value is None:
+            self._canonical_value = canonicalize(self._value)
+        return self._canonical_value
+
     def __eq__(self, other) -> bool:
         if not isinstance(other, Url):
             return False
-        return self._value == other._value
+        return self.canonical_value == other.canonical_value
+
+    def __hash__(self) -> int:
+        return hash(self.canonical_value)
+
+
+def canonicalize(url: str) -> str:
+    parts: SplitResult = urlsplit(url.strip())
+    scheme: str = parts.scheme.lower()
+    host: str = (parts.hostname or "").lower()
+    try:
+        port: Optional[int] = parts.port
+    except ValueError:
+        port = None
+    netloc: str = host if port is None or DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+    path: str = parts.path.rstrip("/") or "/"
+    query: str = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True), key=lambda pair: pair[0]))
+    return urlunsplit((scheme, netloc, path, query, ""))
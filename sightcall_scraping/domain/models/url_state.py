@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Optional
+
+
+class UrlState:
+    def __init__(self, url: str, lastmod: Optional[datetime], content_hash: str):
+        self._url = url
+        self._lastmod = lastmod
+        self._content_hash = content_hash
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def lastmod(self) -> Optional[datetime]:
+        return self._lastmod
+
+    @property
+    def content_hash(self) -> str:
+        return self._content_hash
+
+    def is_up_to_date_with(self, lastmod: Optional[datetime]) -> bool:
+        return lastmod is not None and self._lastmod is not None and lastmod <= self._lastmod
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, UrlState):
+            return False
+        return (
+            self._url == other._url and self._lastmod == other._lastmod and self._content_hash == other._content_hash
+        )
@@ -1,7 +1,30 @@
 from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import AsyncGenerator, Optional, Self
+
+from sightcall_scraping.domain.models.fetched_response import FetchedResponse
 
 
 class ContentFetcher(ABC):
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
     @abstractmethod
     async def fetch(self, uri: str) -> str:
         pass
+
+    async def fetch_response(self, uri: str) -> FetchedResponse:
+        return FetchedResponse(
+            uri, (await self.fetch(uri)).encode("utf-8"), headers={"Content-Type": "text/html; charset=utf-8"}
+        )
+
+    async def stream(self, uri: str) -> AsyncGenerator[bytes, None]:
+        yield (await self.fetch(uri)).encode("utf-8")
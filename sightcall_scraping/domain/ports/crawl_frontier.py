@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Optional, Self
+
+from sightcall_scraping.domain.models.url import Url
+
+
+class CrawlFrontier(ABC):
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def add(self, urls: list[Url], depth: int) -> int:
+        pass
+
+    @abstractmethod
+    async def depth_of(self, url: Url) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def pop(self, limit: int) -> list[Url]:
+        pass
@@ -7,3 +7,6 @@ class DocumentParser(ABC):
     @abstractmethod
     def to_scraped_document(self, url: str, raw: str) -> ScrapedDocument:
         pass
+
+    def to_scraped_document_from_bytes(self, url: str, body: bytes, encoding: str) -> ScrapedDocument:
+        return self.to_scraped_document(url, body.decode(encoding, errors="replace"))
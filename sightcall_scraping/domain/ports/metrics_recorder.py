@@ -0,0 +1,20 @@
+import time
+from abc import ABC
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class MetricsRecorder(ABC):
+    def increment(self, name: str, amount: float = 1, labels: Optional[dict[str, str]] = None) -> None:
+        pass
+
+    def observe(self, name: str, seconds: float) -> None:
+        pass
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        started_at: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started_at)
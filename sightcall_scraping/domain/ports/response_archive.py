@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import AsyncGenerator, Optional, Self
+
+from sightcall_scraping.domain.models.archived_response import ArchivedResponse
+
+
+class ResponseArchive(ABC):
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def append(self, response: ArchivedResponse) -> None:
+        pass
+
+    @abstractmethod
+    def iter_responses(self) -> AsyncGenerator[ArchivedResponse, None]:
+        pass
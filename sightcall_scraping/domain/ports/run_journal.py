@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Optional, Self
+
+from sightcall_scraping.domain.models.run_progress import RunProgress
+from sightcall_scraping.domain.models.url import Url
+
+
+class RunJournal(ABC):
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def load_progress(self) -> RunProgress:
+        pass
+
+    @abstractmethod
+    async def record_discovered(self, urls: list[Url]) -> None:
+        pass
+
+    @abstractmethod
+    async def record_completed(self, urls: list[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def record_failed(self, url: str) -> None:
+        pass
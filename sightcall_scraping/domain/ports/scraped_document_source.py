@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from typing import AsyncGenerator
+
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+
+
+class ScrapedDocumentSource(ABC):
+    @abstractmethod
+    def iter_documents(self) -> AsyncGenerator[ScrapedDocument, None]:
+        pass
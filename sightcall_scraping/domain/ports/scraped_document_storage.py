@@ -1,9 +1,25 @@
 from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Optional, Self
 
 from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
 
 
 class ScrapedDocumentStorage(ABC):
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+    async def flush(self) -> None:
+        pass
+
     @abstractmethod
     async def save_all(self, documents: list[ScrapedDocument]) -> None:
         pass
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Optional, Self
+
+from sightcall_scraping.domain.models.url_state import UrlState
+
+
+class UrlStateStore(ABC):
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def get(self, url: str) -> Optional[UrlState]:
+        pass
+
+    @abstractmethod
+    async def save_all(self, states: list[UrlState]) -> None:
+        pass
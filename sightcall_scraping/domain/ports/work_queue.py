@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Optional, Self
+
+from sightcall_scraping.domain.models.url import Url
+
+
+class WorkQueue(ABC):
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def add(self, urls: list[Url]) -> int:
+        pass
+
+    @abstractmethod
+    async def finish_adding(self) -> None:
+        pass
+
+    @abstractmethod
+    async def claim(self, limit: int) -> list[Url]:
+        pass
+
+    @abstractmethod
+    async def complete(self, urls: list[Url]) -> None:
+        pass
+
+    @abstractmethod
+    async def is_drained(self) -> bool:
+        pass
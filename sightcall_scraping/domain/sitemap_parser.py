@@ -1,17 +1,120 @@
-from typing import List
+import zlib
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, List, Optional
 from xml.etree import ElementTree as ET
 
+from .errors import InvalidSitemapError
+from .models.sitemap_entry import SitemapEntry
 from .models.url import Url
 
+GZIP_MAGIC_NUMBER: bytes = b"\x1f\x8b"
+GZIP_WINDOW_BITS: int = zlib.MAX_WBITS | 16
+URL_TAG: str = "url"
+SITEMAP_TAG: str = "sitemap"
+LOCATION_TAG: str = "loc"
+LASTMOD_TAG: str = "lastmod"
+
+
+class IncrementalSitemapParser:
+    def __init__(self) -> None:
+        self._xml_parser: ET.XMLPullParser = ET.XMLPullParser(events=("start", "end"))
+        self._root: Optional[ET.Element] = None
+        self._header: bytes = b""
+        self._decompressor: Optional["zlib._Decompress"] = None
+        self._is_compression_detected: bool = False
+
+    def feed(self, chunk: bytes) -> List[SitemapEntry]:
+        with _invalid_sitemap_errors():
+            self._xml_parser.feed(self._decompress(chunk))
+            return list(self._read_entries())
+
+    def close(self) -> List[SitemapEntry]:
+        with _invalid_sitemap_errors():
+            if not self._is_compression_detected:
+                self._detect_compression()
+                header, self._header = self._header, b""
+                self._xml_parser.feed(self._decompress(header))
+            if self._decompressor is not None:
+                self._xml_parser.feed(self._decompressor.flush())
+            self._xml_parser.close()
+            return list(self._read_entries())
+
+    def _decompress(self, chunk: bytes) -> bytes:
+        if not self._is_compression_detected:
+            self._header += chunk
+            if len(self._header) < len(GZIP_MAGIC_NUMBER):
+                return b""
+            self._detect_compression()
+            chunk = self._header
+            self._header = b""
+        if self._decompressor is not None:
+            return self._decompressor.decompress(chunk)
+        return chunk
+
+    def _detect_compression(self) -> None:
+        self._is_compression_detected = True
+        if self._header.startswith(GZIP_MAGIC_NUMBER):
+            self._decompressor = zlib.decompressobj(wbits=GZIP_WINDOW_BITS)
+
+    def _read_entries(self) -> Iterator[SitemapEntry]:
+        for parsed_event in self._xml_parser.read_events():
+            event, element = parsed_event[0], parsed_event[-1]
+            if not isinstance(element, ET.Element):
+                continue
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                continue
+            tag: str = _local_name(element.tag)
+            if tag not in (URL_TAG, SITEMAP_TAG):
+                continue
+            location: Optional[str] = _find_child_text(element, LOCATION_TAG)
+            if location:
+                lastmod: Optional[datetime] = _parse_lastmod(_find_child_text(element, LASTMOD_TAG))
+                yield SitemapEntry(Url(location, lastmod), is_sitemap=tag == SITEMAP_TAG)
+            if self._root is not None:
+                self._root.clear()
+
 
 class SitemapParser:
     def parse(self, sitemap_xml: str) -> List[Url]:
-        root = ET.fromstring(sitemap_xml)
-        namespace = {"ns": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-        if root.tag.endswith("urlset"):
-            locations = root.findall(".//ns:loc", namespace)
-        elif root.tag.endswith("sitemapindex"):
-            locations = root.findall(".//ns:loc", namespace)
-        else:
-            locations = []
-        return [Url(location.text) for location in locations if location.text is not None]
+        return [entry.url for entry in self.iter_entries([sitemap_xml.encode("utf-8")])]
+
+    def iter_entries(self, chunks: Iterable[bytes]) -> Iterator[SitemapEntry]:
+        parser = self.incremental()
+        for chunk in chunks:
+            yield from parser.feed(chunk)
+        yield from parser.close()
+
+    def incremental(self) -> IncrementalSitemapParser:
+        return IncrementalSitemapParser()
+
+
+@contextmanager
+def _invalid_sitemap_errors() -> Iterator[None]:
+    try:
+        yield
+    except (ET.ParseError, zlib.error) as error:
+        raise InvalidSitemapError(str(error)) from error
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _find_child_text(element: ET.Element, tag: str) -> Optional[str]:
+    for child in element:
+        if _local_name(child.tag) == tag:
+            return child.text.strip() if child.text else None
+    return None
+
+
+def _parse_lastmod(lastmod: Optional[str]) -> Optional[datetime]:
+    if not lastmod:
+        return None
+    try:
+        parsed_lastmod = datetime.fromisoformat(lastmod)
+    except ValueError:
+        return None
+    return parsed_lastmod if parsed_lastmod.tzinfo else parsed_lastmod.replace(tzinfo=timezone.utc)
@@ -0,0 +1,50 @@
+from contextlib import AsyncExitStack
+from datetime import datetime, timezone
+from types import TracebackType
+from typing import AsyncGenerator, Optional, Self
+
+from sightcall_scraping.domain.models.archived_response import ArchivedResponse
+from sightcall_scraping.domain.models.fetched_response import FetchedResponse
+from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.domain.ports.response_archive import ResponseArchive
+
+
+class ArchivingContentFetcher(ContentFetcher):
+    def __init__(self, content_fetcher: ContentFetcher, response_archive: ResponseArchive):
+        self._content_fetcher = content_fetcher
+        self._response_archive = response_archive
+        self._resources: Optional[AsyncExitStack] = None
+        self._open_contexts: int = 0
+
+    async def __aenter__(self) -> Self:
+        if self._resources is None:
+            resources = AsyncExitStack()
+            await resources.enter_async_context(self._response_archive)
+            await resources.enter_async_context(self._content_fetcher)
+            self._resources = resources
+        self._open_contexts += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._open_contexts -= 1
+        if self._open_contexts == 0 and self._resources is not None:
+            resources, self._resources = self._resources, None
+            await resources.aclose()
+
+    async def fetch(self, uri: str) -> str:
+        return (await self.fetch_response(uri)).text
+
+    async def fetch_response(self, uri: str) -> FetchedResponse:
+        response: FetchedResponse = await self._content_fetcher.fetch_response(uri)
+        await self._response_archive.append(
+            ArchivedResponse(uri, response.body, datetime.now(timezone.utc), response.content_type)
+        )
+        return response
+
+    def stream(self, uri: str) -> AsyncGenerator[bytes, None]:
+        return self._content_fetcher.stream(uri)
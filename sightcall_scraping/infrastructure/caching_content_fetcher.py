@@ -0,0 +1,78 @@
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from types import TracebackType
+from typing import AsyncGenerator, Optional, Self
+
+from sightcall_scraping.domain.models.fetched_response import FetchedResponse
+from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.infrastructure.http_content_fetcher import ConditionalResponse, HttpContentFetcher
+from sightcall_scraping.infrastructure.sqlite_http_response_cache import CachedResponse, SqliteHttpResponseCache
+
+
+@dataclass
+class CacheReport:
+    hit_count: int = 0
+    miss_count: int = 0
+
+    @property
+    def request_count(self) -> int:
+        return self.hit_count + self.miss_count
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hit_count / self.request_count if self.request_count else 0.0
+
+
+class CachingContentFetcher(ContentFetcher):
+    def __init__(self, content_fetcher: HttpContentFetcher, response_cache: SqliteHttpResponseCache):
+        self._content_fetcher = content_fetcher
+        self._response_cache = response_cache
+        self._resources: Optional[AsyncExitStack] = None
+        self._open_contexts: int = 0
+        self.report = CacheReport()
+
+    async def __aenter__(self) -> Self:
+        if self._resources is None:
+            resources = AsyncExitStack()
+            await resources.enter_async_context(self._response_cache)
+            await resources.enter_async_context(self._content_fetcher)
+            self._resources = resources
+        self._open_contexts += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._open_contexts -= 1
+        if self._open_contexts == 0 and self._resources is not None:
+            resources, self._resources = self._resources, None
+            await resources.aclose()
+
+    async def fetch(self, uri: str) -> str:
+        return (await self.fetch_response(uri)).text
+
+    async def fetch_response(self, uri: str) -> FetchedResponse:
+        async with self:
+            cached: Optional[CachedResponse] = await self._response_cache.get(uri)
+            response: ConditionalResponse = (
+                await self._content_fetcher.fetch_if_modified(uri, cached.etag, cached.last_modified)
+                if cached is not None
+                else await self._content_fetcher.fetch_if_modified(uri)
+            )
+            if cached is not None and response.is_not_modified:
+                self.report.hit_count += 1
+                headers: dict[str, str] = {"Content-Type": cached.content_type} if cached.content_type else {}
+                return FetchedResponse(uri, cached.body, headers=headers)
+            self.report.miss_count += 1
+            fetched: FetchedResponse = response.response or FetchedResponse(uri, b"")
+            if response.etag or response.last_modified:
+                await self._response_cache.put(
+                    uri, CachedResponse(response.etag, response.last_modified, fetched.body, fetched.content_type)
+                )
+            return fetched
+
+    def stream(self, uri: str) -> AsyncGenerator[bytes, None]:
+        return self._content_fetcher.stream(uri)
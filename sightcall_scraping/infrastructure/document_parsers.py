@@ -0,0 +1,16 @@
+from enum import Enum
+
+from sightcall_scraping.domain.ports.document_parser import DocumentParser
+from sightcall_scraping.infrastructure.html_document_parser import HtmlDocumentParser
+from sightcall_scraping.infrastructure.lxml_document_parser import LxmlDocumentParser
+
+
+class ParserEngine(str, Enum):
+    BEAUTIFULSOUP = "beautifulsoup"
+    LXML = "lxml"
+
+
+def create_document_parser(parser_engine: ParserEngine, extract_links: bool = False) -> DocumentParser:
+    if parser_engine == ParserEngine.LXML:
+        return LxmlDocumentParser(extract_links)
+    return HtmlDocumentParser(extract_links)
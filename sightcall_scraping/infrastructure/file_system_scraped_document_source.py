@@ -0,0 +1,21 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import AsyncGenerator
+
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.scraped_document_source import ScrapedDocumentSource
+from sightcall_scraping.infrastructure.scraped_document_records import from_record
+
+
+class FileSystemScrapedDocumentSource(ScrapedDocumentSource):
+    def __init__(self, input_path: Path):
+        self._input_path = input_path
+
+    async def iter_documents(self) -> AsyncGenerator[ScrapedDocument, None]:
+        for record in await asyncio.to_thread(self._read_records):
+            yield from_record(record)
+
+    def _read_records(self) -> list[dict[str, str]]:
+        with open(self._input_path) as f:
+            return json.load(f)
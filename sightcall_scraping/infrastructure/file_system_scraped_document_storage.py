@@ -1,28 +1,102 @@
 import asyncio
 import json
+import os
 from pathlib import Path
+from types import TracebackType
+from typing import Optional, Self, TextIO
 
 from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.metrics_recorder import MetricsRecorder
 from sightcall_scraping.domain.ports.scraped_document_storage import ScrapedDocumentStorage
+from sightcall_scraping.infrastructure.scraped_document_records import to_record
+
+PARTIAL_OUTPUT_SUFFIX: str = ".partial"
+TEMPORARY_OUTPUT_SUFFIX: str = ".tmp"
+JSON_INDENT: int = 4
+
+Record = dict[str, str]
 
 
 class FileSystemScrapedDocumentStorage(ScrapedDocumentStorage):
-    def __init__(self, output_path: Path):
+    def __init__(
+        self, output_path: Path, merge_existing: bool = False, metrics_recorder: Optional[MetricsRecorder] = None
+    ):
         self._output_path = output_path
-        self._documents: list[ScrapedDocument] = []
+        self._merge_existing = merge_existing
+        self._metrics_recorder = metrics_recorder or MetricsRecorder()
+        self._partial_output_path = output_path.with_name(output_path.name + PARTIAL_OUTPUT_SUFFIX)
+        self._partial_file: Optional[TextIO] = None
+
+    async def __aenter__(self) -> Self:
+        await asyncio.to_thread(self._open_partial_output)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        written_byte_count: int = await asyncio.to_thread(self._write_output)
+        self._metrics_recorder.increment("bytes_written", written_byte_count)
 
     async def save_all(self, documents: list[ScrapedDocument]) -> None:
-        self._documents.extend(documents)
-        await asyncio.to_thread(self._write_to_file)
-
-    def _write_to_file(self) -> None:
-        with open(self._output_path, "w") as f:
-            json.dump([self._to_dict(doc) for doc in self._documents], f, indent=4)
-
-    @staticmethod
-    def _to_dict(document: ScrapedDocument) -> dict:
-        return {
-            "url": document.url,
-            "title": document.title,
-            "content": document.content,
-        }
+        lines: str = "".join(json.dumps(to_record(document), ensure_ascii=False) + "\n" for document in documents)
+        await asyncio.to_thread(self._append_to_partial_output, lines)
+        self._metrics_recorder.increment("bytes_written", len(lines.encode("utf-8")))
+
+    async def flush(self) -> None:
+        await asyncio.to_thread(self._flush_partial_output)
+
+    def _open_partial_output(self) -> None:
+        is_resuming_partial_output: bool = self._merge_existing and self._partial_output_path.exists()
+        if is_resuming_partial_output:
+            _drop_partial_last_line(self._partial_output_path)
+        self._partial_file = open(
+            self._partial_output_path, "a" if is_resuming_partial_output else "w", encoding="utf-8"
+        )
+
+    def _append_to_partial_output(self, lines: str) -> None:
+        if self._partial_file is None:
+            raise RuntimeError("FileSystemScrapedDocumentStorage must be entered before saving documents")
+        self._partial_file.write(lines)
+
+    def _flush_partial_output(self) -> None:
+        if self._partial_file is not None:
+            self._partial_file.flush()
+            os.fsync(self._partial_file.fileno())
+
+    def _write_output(self) -> int:
+        if self._partial_file is not None:
+            self._partial_file.close()
+            self._partial_file = None
+        records: dict[str, Record] = self._read_existing_records() if self._merge_existing else {}
+        records.update((record["url"], record) for record in _read_json_lines(self._partial_output_path))
+        temporary_path: Path = self._output_path.with_name(self._output_path.name + TEMPORARY_OUTPUT_SUFFIX)
+        with open(temporary_path, "w") as f:
+            json.dump(list(records.values()), f, indent=JSON_INDENT)
+        written_byte_count: int = temporary_path.stat().st_size
+        temporary_path.replace(self._output_path)
+        self._partial_output_path.unlink()
+        return written_byte_count
+
+    def _read_existing_records(self) -> dict[str, Record]:
+        if not self._output_path.exists():
+            return {}
+        with open(self._output_path) as f:
+            return {record["url"]: record for record in json.load(f)}
+
+
+def _read_json_lines(path: Path) -> list[Record]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.endswith("\n")]
+
+
+def _drop_partial_last_line(path: Path) -> None:
+    complete_lines_size: int = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            complete_lines_size += len(line)
+    os.truncate(path, complete_lines_size)
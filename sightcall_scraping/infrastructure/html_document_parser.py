@@ -1,15 +1,43 @@
 import re
+from typing import Iterable, List
+from urllib.parse import urldefrag, urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
 from sightcall_scraping.domain.ports.document_parser import DocumentParser
 
+WHITESPACE_BEFORE_PUNCTUATION = re.compile(r"\s+([!.,;:?])")
+CRAWLABLE_SCHEMES: tuple[str, ...] = ("http://", "https://")
+
+
+def remove_whitespace_before_punctuation(text: str) -> str:
+    return WHITESPACE_BEFORE_PUNCTUATION.sub(r"\1", text)
+
+
+def absolute_links(page_url: str, hrefs: Iterable[str]) -> List[str]:
+    links = (urldefrag(urljoin(page_url, href.strip())).url for href in hrefs)
+    return list(dict.fromkeys(link for link in links if link.lower().startswith(CRAWLABLE_SCHEMES)))
+
 
 class HtmlDocumentParser(DocumentParser):
+    def __init__(self, extract_links: bool = False) -> None:
+        self._extract_links = extract_links
+
     def to_scraped_document(self, url: str, html: str) -> ScrapedDocument:
-        soup = BeautifulSoup(html, "html.parser")
+        return self._to_scraped_document(url, BeautifulSoup(html, "html.parser"))
+
+    def to_scraped_document_from_bytes(self, url: str, body: bytes, encoding: str) -> ScrapedDocument:
+        return self._to_scraped_document(url, BeautifulSoup(body, "html.parser", from_encoding=encoding))
+
+    def _to_scraped_document(self, url: str, soup: BeautifulSoup) -> ScrapedDocument:
         title = soup.title.string.strip() if soup.title and soup.title.string else ""
         body = soup.body.get_text(separator=" ", strip=True) if soup.body else ""
-        body = re.sub(r"\s+([!.,;:?])", r"\1", body)
-        return ScrapedDocument(url=url, title=title, content=body)
+        body = remove_whitespace_before_punctuation(body)
+        return ScrapedDocument(url=url, title=title, content=body, links=self._links_of(url, soup))
+
+    def _links_of(self, url: str, soup: BeautifulSoup) -> List[str]:
+        if not self._extract_links:
+            return []
+        anchors = (anchor for anchor in soup.find_all("a", href=True) if isinstance(anchor, Tag))
+        return absolute_links(url, (str(anchor["href"]) for anchor in anchors))
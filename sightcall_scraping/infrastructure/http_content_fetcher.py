@@ -1,15 +1,209 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import TracebackType
+from typing import AsyncGenerator, Optional, Self
+from urllib.parse import urlsplit
+
 import httpx
 
+from sightcall_scraping.domain.errors import FetchError, SkippedResponseError, ThrottledError
+from sightcall_scraping.domain.models.fetched_response import FetchedResponse
 from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.domain.ports.metrics_recorder import MetricsRecorder
 
 USER_AGENT: str = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
 )
+DEFAULT_MAX_CONNECTIONS: int = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+DEFAULT_MAX_CONNECTIONS_PER_HOST: int = 10
+DEFAULT_TIMEOUT_SECONDS: float = 30.0
+DEFAULT_CONNECT_TIMEOUT_SECONDS: float = 10.0
+KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+THROTTLING_STATUS_CODES: frozenset[int] = frozenset({httpx.codes.TOO_MANY_REQUESTS, httpx.codes.SERVICE_UNAVAILABLE})
+DEFAULT_MAX_BODY_BYTES: int = 10 * 1024 * 1024
+HTML_CONTENT_TYPES: frozenset[str] = frozenset({"text/html", "application/xhtml+xml"})
+UNSUPPORTED_CONTENT_TYPE: str = "content_type"
+BODY_TOO_LARGE: str = "too_large"
+
+
+@dataclass(frozen=True)
+class ConditionalResponse:
+    is_not_modified: bool
+    response: Optional[FetchedResponse] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 class HttpContentFetcher(ContentFetcher):
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        http2: bool = False,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        connect_timeout_seconds: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        metrics_recorder: Optional[MetricsRecorder] = None,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    ):
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        )
+        self._timeout = httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds)
+        self._max_connections_per_host = max_connections_per_host
+        self._http2 = http2
+        self._transport = transport
+        self._metrics_recorder = metrics_recorder or MetricsRecorder()
+        self._max_body_bytes = max_body_bytes
+        self._client: Optional[httpx.AsyncClient] = None
+        self._open_contexts: int = 0
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> Self:
+        self._acquire_client()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._release_client()
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None
+
     async def fetch(self, uri: str) -> str:
-        async with httpx.AsyncClient(headers={"User-Agent": USER_AGENT}) as client:
-            response = await client.get(uri)
-            response.raise_for_status()
-            return response.text
+        return (await self.fetch_response(uri)).text
+
+    async def fetch_response(self, uri: str) -> FetchedResponse:
+        return await self._get(uri)
+
+    async def fetch_if_modified(
+        self, uri: str, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> ConditionalResponse:
+        headers: dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        response: FetchedResponse = await self._get(uri, headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return ConditionalResponse(is_not_modified=True)
+        return ConditionalResponse(
+            is_not_modified=False,
+            response=response,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+
+    async def stream(self, uri: str) -> AsyncGenerator[bytes, None]:
+        client: httpx.AsyncClient = self._acquire_client()
+        try:
+            async with self._host_semaphore(uri), client.stream("GET", uri) as response:
+                self._record_response(response)
+                _raise_for_status(response)
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+                self._metrics_recorder.increment("bytes_downloaded", response.num_bytes_downloaded)
+        except httpx.HTTPError as error:
+            raise FetchError(uri, str(error)) from error
+        finally:
+            await self._release_client()
+
+    async def _get(self, uri: str, headers: Optional[dict[str, str]] = None) -> FetchedResponse:
+        client: httpx.AsyncClient = self._acquire_client()
+        try:
+            async with self._host_semaphore(uri), client.stream("GET", uri, headers=headers) as response:
+                self._record_response(response)
+                try:
+                    body: bytes = b""
+                    if response.status_code != httpx.codes.NOT_MODIFIED:
+                        _raise_for_status(response)
+                        self._raise_if_not_worth_reading(uri, response)
+                        body = await self._read_body(uri, response)
+                    return FetchedResponse(str(response.url), body, response.status_code, response.headers)
+                finally:
+                    self._metrics_recorder.increment("bytes_downloaded", response.num_bytes_downloaded)
+        except httpx.HTTPError as error:
+            raise FetchError(uri, str(error)) from error
+        finally:
+            await self._release_client()
+
+    def _raise_if_not_worth_reading(self, uri: str, response: httpx.Response) -> None:
+        content_type: str = response.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+        if content_type and content_type not in HTML_CONTENT_TYPES:
+            raise SkippedResponseError(uri, UNSUPPORTED_CONTENT_TYPE, f"content type {content_type} is not HTML")
+        content_length: str = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > self._max_body_bytes:
+            raise SkippedResponseError(
+                uri, BODY_TOO_LARGE, f"{content_length} bytes is over the {self._max_body_bytes} bytes cap"
+            )
+
+    async def _read_body(self, uri: str, response: httpx.Response) -> bytes:
+        chunks: list[bytes] = []
+        size: int = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self._max_body_bytes:
+                raise SkippedResponseError(uri, BODY_TOO_LARGE, f"body is over the {self._max_body_bytes} bytes cap")
+        return b"".join(chunks)
+
+    def _record_response(self, response: httpx.Response) -> None:
+        self._metrics_recorder.increment("http_responses", labels={"status": str(response.status_code)})
+
+    def _acquire_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = self._create_client()
+        self._open_contexts += 1
+        return self._client
+
+    async def _release_client(self) -> None:
+        self._open_contexts -= 1
+        if self._open_contexts == 0 and self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    def _host_semaphore(self, uri: str) -> asyncio.Semaphore:
+        host: str = urlsplit(uri).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self._max_connections_per_host)
+        return self._host_semaphores[host]
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            limits=self._limits,
+            timeout=self._timeout,
+            http2=self._http2,
+            transport=self._transport,
+        )
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    if response.status_code in THROTTLING_STATUS_CODES:
+        raise ThrottledError(str(response.request.url), _parse_retry_after(response.headers.get("Retry-After")))
+    response.raise_for_status()
+
+
+def _parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+    if not retry_after:
+        return None
+    if retry_after.strip().isdigit():
+        return float(retry_after)
+    try:
+        retry_at: datetime = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,109 @@
+import bisect
+import math
+from typing import Optional
+
+from sightcall_scraping.domain.ports.metrics_recorder import MetricsRecorder
+
+LATENCY_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    math.inf,
+)
+REPORTED_QUANTILES: dict[str, float] = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+
+CounterKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class Histogram:
+    def __init__(self, bucket_bounds: tuple[float, ...] = LATENCY_BUCKETS_SECONDS):
+        self._bucket_bounds = bucket_bounds
+        self._bucket_counts: list[int] = [0] * len(bucket_bounds)
+        self._count: int = 0
+        self._sum: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def cumulative_buckets(self) -> list[tuple[float, int]]:
+        cumulative_counts: list[int] = []
+        for bucket_count in self._bucket_counts:
+            cumulative_counts.append((cumulative_counts[-1] if cumulative_counts else 0) + bucket_count)
+        return list(zip(self._bucket_bounds, cumulative_counts))
+
+    def observe(self, value: float) -> None:
+        self._bucket_counts[bisect.bisect_left(self._bucket_bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+
+    def quantile(self, quantile: float) -> float:
+        if self._count == 0:
+            return 0.0
+        rank: float = quantile * self._count
+        lower_bound, previous_count = 0.0, 0
+        for upper_bound, cumulative_count in self.cumulative_buckets:
+            if cumulative_count >= rank:
+                if math.isinf(upper_bound):
+                    return lower_bound
+                bucket_count: int = cumulative_count - previous_count
+                return lower_bound + (upper_bound - lower_bound) * (rank - previous_count) / bucket_count
+            lower_bound, previous_count = upper_bound, cumulative_count
+        return lower_bound
+
+
+class InMemoryMetricsRecorder(MetricsRecorder):
+    def __init__(self):
+        self._counters: dict[CounterKey, float] = {}
+        self._histograms: dict[str, Histogram] = {}
+
+    @property
+    def counters(self) -> dict[CounterKey, float]:
+        return dict(self._counters)
+
+    @property
+    def histograms(self) -> dict[str, Histogram]:
+        return dict(self._histograms)
+
+    def increment(self, name: str, amount: float = 1, labels: Optional[dict[str, str]] = None) -> None:
+        key: CounterKey = (name, tuple(sorted((labels or {}).items())))
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, seconds: float) -> None:
+        self._histograms.setdefault(name, Histogram()).observe(seconds)
+
+    def counter_value(self, name: str, labels: Optional[dict[str, str]] = None) -> float:
+        return self._counters.get((name, tuple(sorted((labels or {}).items()))), 0)
+
+    def to_report(self) -> dict[str, object]:
+        return {
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ],
+            "histograms": {
+                name: {
+                    "count": histogram.count,
+                    "sum_seconds": histogram.sum,
+                    **{label: histogram.quantile(quantile) for label, quantile in REPORTED_QUANTILES.items()},
+                }
+                for name, histogram in sorted(self._histograms.items())
+            },
+        }
@@ -0,0 +1,20 @@
+import json
+import textwrap
+from pathlib import Path
+
+JSON_INDENT: int = 4
+
+
+def convert_json_lines_to_json_array(json_lines_path: Path, json_path: Path) -> int:
+    converted_record_count = 0
+    with open(json_lines_path, encoding="utf-8") as source, open(json_path, "w") as target:
+        target.write("[")
+        for line in source:
+            if not line.strip():
+                continue
+            separator = ",\n" if converted_record_count else "\n"
+            record_json = json.dumps(json.loads(line), indent=JSON_INDENT)
+            target.write(separator + textwrap.indent(record_json, " " * JSON_INDENT))
+            converted_record_count += 1
+        target.write("\n]" if converted_record_count else "]")
+    return converted_record_count
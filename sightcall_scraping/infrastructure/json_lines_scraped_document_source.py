@@ -0,0 +1,25 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import AsyncGenerator, TextIO
+
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.scraped_document_source import ScrapedDocumentSource
+from sightcall_scraping.infrastructure.scraped_document_records import from_record
+
+READ_BATCH_SIZE_BYTES: int = 1024 * 1024
+
+
+class JsonLinesScrapedDocumentSource(ScrapedDocumentSource):
+    def __init__(self, input_path: Path):
+        self._input_path = input_path
+
+    async def iter_documents(self) -> AsyncGenerator[ScrapedDocument, None]:
+        file: TextIO = await asyncio.to_thread(self._input_path.open, encoding="utf-8")
+        try:
+            while lines := await asyncio.to_thread(file.readlines, READ_BATCH_SIZE_BYTES):
+                for line in lines:
+                    if line.strip() and line.endswith("\n"):
+                        yield from_record(json.loads(line))
+        finally:
+            await asyncio.to_thread(file.close)
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Self, TextIO
+
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.metrics_recorder import MetricsRecorder
+from sightcall_scraping.domain.ports.scraped_document_storage import ScrapedDocumentStorage
+from sightcall_scraping.infrastructure.scraped_document_records import to_record
+
+DEFAULT_FLUSH_BATCH_SIZE: int = 100
+PARTIAL_OUTPUT_SUFFIX: str = ".partial"
+
+
+class JsonLinesScrapedDocumentStorage(ScrapedDocumentStorage):
+    def __init__(
+        self,
+        output_path: Path,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        merge_existing: bool = False,
+        append_existing: bool = False,
+        metrics_recorder: Optional[MetricsRecorder] = None,
+    ):
+        self._output_path = output_path
+        self._flush_batch_size = flush_batch_size
+        self._merge_existing = merge_existing
+        self._append_existing = append_existing
+        self._metrics_recorder = metrics_recorder or MetricsRecorder()
+        self._partial_output_path = output_path.with_name(output_path.name + PARTIAL_OUTPUT_SUFFIX)
+        self._file: Optional[TextIO] = None
+        self._unflushed_document_count: int = 0
+        self._saved_urls: set[str] = set()
+
+    async def __aenter__(self) -> Self:
+        if self._append_existing and self._output_path.exists():
+            self._saved_urls.update(await asyncio.to_thread(self._drop_partial_last_line_and_read_urls))
+        await asyncio.to_thread(self._open)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._merge_existing:
+            await asyncio.to_thread(self._carry_over_existing_documents)
+        await asyncio.to_thread(self._close)
+        if self._merge_existing:
+            await asyncio.to_thread(self._partial_output_path.replace, self._output_path)
+
+    async def save_all(self, documents: list[ScrapedDocument]) -> None:
+        lines: str = "".join(json.dumps(to_record(document), ensure_ascii=False) + "\n" for document in documents)
+        self._saved_urls.update(document.url for document in documents)
+        await asyncio.to_thread(self._append, lines, len(documents))
+        self._metrics_recorder.increment("bytes_written", len(lines.encode("utf-8")))
+
+    async def flush(self) -> None:
+        await asyncio.to_thread(self._flush)
+
+    def _drop_partial_last_line_and_read_urls(self) -> set[str]:
+        urls: set[str] = set()
+        complete_lines_size: int = 0
+        with open(self._output_path, "rb") as file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                urls.add(json.loads(line)["url"])
+                complete_lines_size += len(line)
+        os.truncate(self._output_path, complete_lines_size)
+        return urls
+
+    def _open(self) -> TextIO:
+        if self._file is None:
+            path: Path = self._partial_output_path if self._merge_existing else self._output_path
+            self._file = open(path, "a" if self._append_existing else "w", encoding="utf-8")
+        return self._file
+
+    def _flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unflushed_document_count = 0
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._unflushed_document_count = 0
+
+    def _carry_over_existing_documents(self) -> None:
+        if not self._output_path.exists():
+            return
+        file: TextIO = self._open()
+        with open(self._output_path, encoding="utf-8") as existing_file:
+            for line in existing_file:
+                if line.endswith("\n") and json.loads(line)["url"] not in self._saved_urls:
+                    file.write(line)
+        file.flush()
+        os.fsync(file.fileno())
+
+    def _append(self, lines: str, document_count: int) -> None:
+        file: TextIO = self._open()
+        file.write(lines)
+        self._unflushed_document_count += document_count
+        if self._unflushed_document_count >= self._flush_batch_size:
+            file.flush()
+            self._unflushed_document_count = 0
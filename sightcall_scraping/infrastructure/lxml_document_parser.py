@@ -0,0 +1,100 @@
+import re
+from typing import Iterator, List, Optional
+
+from lxml import etree
+from lxml import html as lxml_html
+
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.document_parser import DocumentParser
+from sightcall_scraping.infrastructure.html_document_parser import (
+    absolute_links,
+    remove_whitespace_before_punctuation,
+)
+
+NON_TEXT_TAGS: frozenset[str] = frozenset({"script", "style", "template"})
+BODY_TAG = re.compile(r"<body[\s/>]", re.IGNORECASE)
+BODY_TAG_BYTES = re.compile(rb"<body[\s/>]", re.IGNORECASE)
+
+
+class LxmlDocumentParser(DocumentParser):
+    def __init__(self, extract_links: bool = False) -> None:
+        self._extract_links = extract_links
+        self._parser = lxml_html.HTMLParser(remove_comments=True, remove_pis=True)
+        self._parsers_by_encoding: dict[str, lxml_html.HTMLParser] = {}
+
+    def __reduce__(self) -> tuple[type["LxmlDocumentParser"], tuple[bool]]:
+        return LxmlDocumentParser, (self._extract_links,)
+
+    def to_scraped_document(self, url: str, html: str) -> ScrapedDocument:
+        return self._to_scraped_document(url, self._parse(html), BODY_TAG.search(html) is not None)
+
+    def to_scraped_document_from_bytes(self, url: str, body: bytes, encoding: str) -> ScrapedDocument:
+        parser: Optional[lxml_html.HTMLParser] = self._parser_for(encoding)
+        if parser is None or not _is_ascii_compatible(encoding):
+            return super().to_scraped_document_from_bytes(url, body, encoding)
+        return self._to_scraped_document(url, self._parse_bytes(body, parser), BODY_TAG_BYTES.search(body) is not None)
+
+    def _to_scraped_document(
+        self, url: str, root: Optional[lxml_html.HtmlElement], has_body_tag: bool
+    ) -> ScrapedDocument:
+        if root is None:
+            return ScrapedDocument(url=url, title="", content="")
+        title_element = root.find(".//title")
+        title = title_element.text.strip() if title_element is not None and title_element.text else ""
+        body = root.find("body") if has_body_tag else None
+        content = " ".join(self._stripped_strings(body)) if body is not None else ""
+        return ScrapedDocument(
+            url=url,
+            title=title,
+            content=remove_whitespace_before_punctuation(content),
+            links=self._links_of(url, root),
+        )
+
+    def _links_of(self, url: str, root: lxml_html.HtmlElement) -> List[str]:
+        if not self._extract_links:
+            return []
+        return absolute_links(url, (href for anchor in root.iter("a") if (href := anchor.get("href")) is not None))
+
+    def _parse(self, html: str) -> Optional[lxml_html.HtmlElement]:
+        if not html.strip():
+            return None
+        try:
+            return lxml_html.document_fromstring(html, parser=self._parser)
+        except ValueError:
+            return lxml_html.document_fromstring(html.encode("utf-8"), parser=self._parser)
+        except etree.ParserError:
+            return None
+
+    def _parse_bytes(self, body: bytes, parser: lxml_html.HTMLParser) -> Optional[lxml_html.HtmlElement]:
+        if not body.strip():
+            return None
+        try:
+            return lxml_html.document_fromstring(body, parser=parser)
+        except etree.ParserError:
+            return None
+
+    def _parser_for(self, encoding: str) -> Optional[lxml_html.HTMLParser]:
+        if encoding not in self._parsers_by_encoding:
+            try:
+                self._parsers_by_encoding[encoding] = lxml_html.HTMLParser(
+                    encoding=encoding, remove_comments=True, remove_pis=True
+                )
+            except LookupError:
+                return None
+        return self._parsers_by_encoding[encoding]
+
+    def _stripped_strings(self, element: lxml_html.HtmlElement) -> Iterator[str]:
+        if element.tag not in NON_TEXT_TAGS and element.text:
+            stripped_text = element.text.strip()
+            if stripped_text:
+                yield stripped_text
+        for child in element:
+            yield from self._stripped_strings(child)
+            if child.tail:
+                stripped_tail = child.tail.strip()
+                if stripped_tail:
+                    yield stripped_tail
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    return "<body>".encode(encoding, errors="ignore") == b"<body>"
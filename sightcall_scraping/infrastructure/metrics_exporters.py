@@ -0,0 +1,51 @@
+import json
+import math
+from pathlib import Path
+
+from sightcall_scraping.infrastructure.in_memory_metrics_recorder import InMemoryMetricsRecorder
+
+PROMETHEUS_METRIC_PREFIX: str = "sightcall_scraper_"
+
+
+def write_json_report(report: dict[str, object], report_path: Path) -> None:
+    _write_atomically(report_path, json.dumps(report, indent=4))
+
+
+def write_prometheus_textfile(metrics_recorder: InMemoryMetricsRecorder, textfile_path: Path) -> None:
+    _write_atomically(textfile_path, to_prometheus_text(metrics_recorder))
+
+
+def to_prometheus_text(metrics_recorder: InMemoryMetricsRecorder) -> str:
+    lines: list[str] = []
+    typed_counters: set[str] = set()
+    for (name, labels), value in sorted(metrics_recorder.counters.items()):
+        metric_name: str = f"{PROMETHEUS_METRIC_PREFIX}{name}_total"
+        if metric_name not in typed_counters:
+            typed_counters.add(metric_name)
+            lines.append(f"# TYPE {metric_name} counter")
+        lines.append(f"{metric_name}{_format_labels(dict(labels))} {value:g}")
+    for name, histogram in sorted(metrics_recorder.histograms.items()):
+        metric_name = PROMETHEUS_METRIC_PREFIX + name
+        lines.append(f"# TYPE {metric_name} histogram")
+        for upper_bound, cumulative_count in histogram.cumulative_buckets:
+            bound: str = "+Inf" if math.isinf(upper_bound) else f"{upper_bound:g}"
+            lines.append(f'{metric_name}_bucket{{le="{bound}"}} {cumulative_count}')
+        lines.append(f"{metric_name}_sum {histogram.sum:g}")
+        lines.append(f"{metric_name}_count {histogram.count}")
+    return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped_labels = (
+        f'{name}="{value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")}"'
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(escaped_labels) + "}"
+
+
+def _write_atomically(path: Path, text: str) -> None:
+    temporary_path: Path = path.with_name(path.name + ".tmp")
+    temporary_path.write_text(text, encoding="utf-8")
+    temporary_path.replace(path)
@@ -0,0 +1,18 @@
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+
+
+def to_record(document: ScrapedDocument) -> dict[str, str]:
+    record: dict[str, str] = {
+        "url": document.url,
+        "title": document.title,
+        "content": document.content,
+    }
+    if document.duplicate_of is not None:
+        record["duplicate_of"] = document.duplicate_of
+    return record
+
+
+def from_record(record: dict[str, str]) -> ScrapedDocument:
+    return ScrapedDocument(
+        url=record["url"], title=record["title"], content=record["content"], duplicate_of=record.get("duplicate_of")
+    )
@@ -0,0 +1,85 @@
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Self
+
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.ports.crawl_frontier import CrawlFrontier
+from sightcall_scraping.infrastructure.sqlite_database import SqliteDatabase
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS frontier (
+    canonical_url TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    lastmod TEXT,
+    depth INTEGER NOT NULL,
+    is_popped INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS pending_frontier_urls ON frontier (depth) WHERE is_popped = 0;
+"""
+INSERT_URL: str = "INSERT OR IGNORE INTO frontier (canonical_url, url, lastmod, depth) VALUES (?, ?, ?, ?)"
+SELECT_DEPTH: str = "SELECT depth FROM frontier WHERE canonical_url = ?"
+POP_URLS: str = """
+UPDATE frontier SET is_popped = 1
+WHERE rowid IN (SELECT rowid FROM frontier WHERE is_popped = 0 ORDER BY depth, rowid LIMIT ?)
+RETURNING url, lastmod, depth, rowid
+"""
+CLEAR_FRONTIER: str = "DELETE FROM frontier"
+REQUEUE_POPPED_URLS: str = "UPDATE frontier SET is_popped = 0 WHERE is_popped = 1"
+
+
+class SqliteCrawlFrontier(CrawlFrontier):
+    def __init__(self, database_path: Path, resume: bool = False):
+        self._database = SqliteDatabase(database_path, SCHEMA, "SqliteCrawlFrontier")
+        self._resume = resume
+
+    async def __aenter__(self) -> Self:
+        await self._database.__aenter__()
+        await self._database.run(self._start_crawl)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._database.__aexit__(exc_type, exc_value, traceback)
+
+    async def add(self, urls: list[Url], depth: int) -> int:
+        return await self._database.run(lambda connection: _add(connection, urls, depth))
+
+    async def depth_of(self, url: Url) -> Optional[int]:
+        row = await self._database.run(
+            lambda connection: connection.execute(SELECT_DEPTH, (url.canonical_value,)).fetchone()
+        )
+        return row[0] if row is not None else None
+
+    async def pop(self, limit: int) -> list[Url]:
+        return await self._database.run(lambda connection: _pop(connection, limit))
+
+    def _start_crawl(self, connection: sqlite3.Connection) -> None:
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with connection:
+            connection.execute(REQUEUE_POPPED_URLS if self._resume else CLEAR_FRONTIER)
+
+
+def _add(connection: sqlite3.Connection, urls: list[Url], depth: int) -> int:
+    with connection:
+        before: int = connection.total_changes
+        connection.executemany(
+            INSERT_URL,
+            [
+                (url.canonical_value, url.value, url.lastmod.isoformat() if url.lastmod else None, depth)
+                for url in urls
+            ],
+        )
+        return connection.total_changes - before
+
+
+def _pop(connection: sqlite3.Connection, limit: int) -> list[Url]:
+    with connection:
+        rows = connection.execute(POP_URLS, (limit,)).fetchall()
+    rows.sort(key=lambda row: (row[2], row[3]))
+    return [Url(url, datetime.fromisoformat(lastmod) if lastmod else None) for url, lastmod, _, _ in rows]
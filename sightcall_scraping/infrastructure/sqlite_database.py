@@ -0,0 +1,51 @@
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Callable, Optional, Self, TypeVar
+
+T = TypeVar("T")
+
+
+class SqliteDatabase:
+    def __init__(self, database_path: Path, schema: str, name: str):
+        self._database_path = database_path
+        self._schema = schema
+        self._name = name
+        self._connection: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def __aenter__(self) -> Self:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self._name)
+        self._connection = await asyncio.get_running_loop().run_in_executor(self._executor, self._connect)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._executor is None:
+            return
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._close)
+        self._executor.shutdown()
+        self._executor = None
+
+    async def run(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        if self._connection is None or self._executor is None:
+            raise RuntimeError(f"{self._name} must be used as an async context manager")
+        connection: sqlite3.Connection = self._connection
+        return await asyncio.get_running_loop().run_in_executor(self._executor, lambda: func(connection))
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._database_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(self._schema)
+        return connection
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,116 @@
+import sqlite3
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Self
+
+from sightcall_scraping.infrastructure.sqlite_database import SqliteDatabase
+
+DEFAULT_MAX_CACHE_SIZE_BYTES: int = 512 * 1024 * 1024
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS http_responses (
+    uri TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    content_type TEXT,
+    size INTEGER NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS http_responses_by_last_used ON http_responses (last_used);
+"""
+SELECT_RESPONSE: str = "SELECT etag, last_modified, body, content_type FROM http_responses WHERE uri = ?"
+SELECT_SIZE: str = "SELECT size FROM http_responses WHERE uri = ?"
+SELECT_LAST_USED: str = "SELECT COALESCE(MAX(last_used), 0) FROM http_responses"
+TOUCH_RESPONSE: str = "UPDATE http_responses SET last_used = ? WHERE uri = ?"
+UPSERT_RESPONSE: str = """
+INSERT INTO http_responses (uri, etag, last_modified, body, content_type, size, last_used)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (uri) DO UPDATE SET
+    etag = excluded.etag,
+    last_modified = excluded.last_modified,
+    body = excluded.body,
+    content_type = excluded.content_type,
+    size = excluded.size,
+    last_used = excluded.last_used
+"""
+SELECT_LEAST_RECENTLY_USED: str = "SELECT uri, size FROM http_responses ORDER BY last_used"
+DELETE_RESPONSE: str = "DELETE FROM http_responses WHERE uri = ?"
+SELECT_TOTAL_SIZE: str = "SELECT COALESCE(SUM(size), 0) FROM http_responses"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    content_type: Optional[str]
+
+
+class SqliteHttpResponseCache:
+    def __init__(self, database_path: Path, max_size_bytes: int = DEFAULT_MAX_CACHE_SIZE_BYTES):
+        self._database = SqliteDatabase(database_path, SCHEMA, "SqliteHttpResponseCache")
+        self._max_size_bytes = max_size_bytes
+        self._last_used: int = 0
+        self._total_size_bytes: int = 0
+
+    async def __aenter__(self) -> Self:
+        await self._database.__aenter__()
+        self._last_used = await self._database.run(self._open_cache)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._database.__aexit__(exc_type, exc_value, traceback)
+
+    async def get(self, uri: str) -> Optional[CachedResponse]:
+        return await self._database.run(lambda connection: self._get(connection, uri))
+
+    async def put(self, uri: str, response: CachedResponse) -> None:
+        await self._database.run(lambda connection: self._put(connection, uri, response))
+
+    async def total_size_bytes(self) -> int:
+        return await self._database.run(lambda connection: connection.execute(SELECT_TOTAL_SIZE).fetchone()[0])
+
+    def _open_cache(self, connection: sqlite3.Connection) -> int:
+        self._total_size_bytes = connection.execute(SELECT_TOTAL_SIZE).fetchone()[0]
+        return connection.execute(SELECT_LAST_USED).fetchone()[0]
+
+    def _get(self, connection: sqlite3.Connection, uri: str) -> Optional[CachedResponse]:
+        row = connection.execute(SELECT_RESPONSE, (uri,)).fetchone()
+        if row is None:
+            return None
+        with connection:
+            connection.execute(TOUCH_RESPONSE, (self._next_use(), uri))
+        etag, last_modified, body, content_type = row
+        return CachedResponse(etag, last_modified, zlib.decompress(body), content_type)
+
+    def _put(self, connection: sqlite3.Connection, uri: str, response: CachedResponse) -> None:
+        body: bytes = zlib.compress(response.body)
+        with connection:
+            replaced_row = connection.execute(SELECT_SIZE, (uri,)).fetchone()
+            connection.execute(
+                UPSERT_RESPONSE,
+                (uri, response.etag, response.last_modified, body, response.content_type, len(body), self._next_use()),
+            )
+            self._total_size_bytes += len(body) - (replaced_row[0] if replaced_row else 0)
+            if self._total_size_bytes > self._max_size_bytes:
+                self._evict_least_recently_used(connection)
+
+    def _evict_least_recently_used(self, connection: sqlite3.Connection) -> None:
+        evicted_uris: list[tuple[str]] = []
+        for uri, size in connection.execute(SELECT_LEAST_RECENTLY_USED):
+            if self._total_size_bytes <= self._max_size_bytes:
+                break
+            evicted_uris.append((uri,))
+            self._total_size_bytes -= size
+        connection.executemany(DELETE_RESPONSE, evicted_uris)
+
+    def _next_use(self) -> int:
+        self._last_used += 1
+        return self._last_used
@@ -0,0 +1,114 @@
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Self
+
+from sightcall_scraping.domain.errors import UnknownRunError
+from sightcall_scraping.domain.models.run_progress import RunProgress
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.ports.run_journal import RunJournal
+from sightcall_scraping.infrastructure.sqlite_database import SqliteDatabase
+
+KEPT_RUN_COUNT: int = 10
+DISCOVERED: str = "discovered"
+COMPLETED: str = "completed"
+FAILED: str = "failed"
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS run_urls (
+    run_id TEXT NOT NULL REFERENCES runs (run_id),
+    url TEXT NOT NULL,
+    lastmod TEXT,
+    status TEXT NOT NULL,
+    PRIMARY KEY (run_id, url)
+);
+"""
+SELECT_RUN: str = "SELECT 1 FROM runs WHERE run_id = ?"
+INSERT_RUN: str = "INSERT INTO runs (run_id) VALUES (?)"
+SELECT_RUN_URLS: str = "SELECT url, lastmod, status FROM run_urls WHERE run_id = ? ORDER BY rowid"
+INSERT_DISCOVERED_URL: str = "INSERT OR IGNORE INTO run_urls (run_id, url, lastmod, status) VALUES (?, ?, ?, ?)"
+UPDATE_URL_STATUS: str = "UPDATE run_urls SET status = ? WHERE run_id = ? AND url = ?"
+LATEST_RUN_IDS: str = "SELECT run_id FROM runs ORDER BY rowid DESC LIMIT ?"
+DELETE_OLD_RUN_URLS: str = f"DELETE FROM run_urls WHERE run_id NOT IN ({LATEST_RUN_IDS})"
+DELETE_OLD_RUNS: str = f"DELETE FROM runs WHERE run_id NOT IN ({LATEST_RUN_IDS})"
+
+
+class SqliteRunJournal(RunJournal):
+    def __init__(self, database_path: Path, run_id: str, resume: bool = False, kept_run_count: int = KEPT_RUN_COUNT):
+        self._database = SqliteDatabase(database_path, SCHEMA, "SqliteRunJournal")
+        self._run_id = run_id
+        self._resume = resume
+        self._kept_run_count = kept_run_count
+
+    @property
+    def run_id(self) -> str:
+        return self._run_id
+
+    async def __aenter__(self) -> Self:
+        await self._database.__aenter__()
+        try:
+            await self._database.run(self._start_run)
+        except BaseException:
+            await self._database.__aexit__(None, None, None)
+            raise
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._database.__aexit__(exc_type, exc_value, traceback)
+
+    async def load_progress(self) -> RunProgress:
+        return await self._database.run(self._load_progress)
+
+    async def record_discovered(self, urls: list[Url]) -> None:
+        parameters: list[tuple[Optional[str], ...]] = [
+            (self._run_id, url.value, url.lastmod.isoformat() if url.lastmod else None, DISCOVERED) for url in urls
+        ]
+        await self._database.run(lambda connection: _commit(connection, INSERT_DISCOVERED_URL, parameters))
+
+    async def record_completed(self, urls: list[str]) -> None:
+        await self._database.run(
+            lambda connection: _commit(connection, UPDATE_URL_STATUS, [(COMPLETED, self._run_id, url) for url in urls])
+        )
+
+    async def record_failed(self, url: str) -> None:
+        await self._database.run(
+            lambda connection: _commit(connection, UPDATE_URL_STATUS, [(FAILED, self._run_id, url)])
+        )
+
+    def _start_run(self, connection: sqlite3.Connection) -> None:
+        connection.execute("PRAGMA synchronous=NORMAL")
+        is_known_run: bool = connection.execute(SELECT_RUN, (self._run_id,)).fetchone() is not None
+        if self._resume and not is_known_run:
+            raise UnknownRunError(self._run_id)
+        if not is_known_run:
+            _commit(connection, INSERT_RUN, [(self._run_id,)])
+            self._delete_old_runs(connection)
+
+    def _delete_old_runs(self, connection: sqlite3.Connection) -> None:
+        with connection:
+            connection.execute(DELETE_OLD_RUN_URLS, (self._kept_run_count,))
+            connection.execute(DELETE_OLD_RUNS, (self._kept_run_count,))
+
+    def _load_progress(self, connection: sqlite3.Connection) -> RunProgress:
+        completed_urls: list[str] = []
+        unfinished_urls: list[Url] = []
+        for url, lastmod, status in connection.execute(SELECT_RUN_URLS, (self._run_id,)):
+            if status == COMPLETED:
+                completed_urls.append(url)
+            else:
+                unfinished_urls.append(Url(url, datetime.fromisoformat(lastmod) if lastmod else None))
+        return RunProgress(completed_urls, unfinished_urls)
+
+
+def _commit(connection: sqlite3.Connection, statement: str, parameters: list[tuple[Optional[str], ...]]) -> None:
+    with connection:
+        connection.executemany(statement, parameters)
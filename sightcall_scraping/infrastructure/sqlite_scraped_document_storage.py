@@ -0,0 +1,116 @@
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import AsyncGenerator, Optional, Self
+
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.scraped_document_source import ScrapedDocumentSource
+from sightcall_scraping.domain.ports.scraped_document_storage import ScrapedDocumentStorage
+from sightcall_scraping.infrastructure.sqlite_database import SqliteDatabase
+
+DEFAULT_SEARCH_LIMIT: int = 10
+READ_BATCH_SIZE: int = 500
+SNIPPET_TOKEN_COUNT: int = 16
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    duplicate_of TEXT,
+    scraped_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, content, content = 'documents', content_rowid = 'id', tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS documents_after_insert AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_after_delete AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts (documents_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_after_update AFTER UPDATE OF title, content ON documents BEGIN
+    INSERT INTO documents_fts (documents_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    INSERT INTO documents_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+"""
+UPSERT_DOCUMENT: str = """
+INSERT INTO documents (url, title, content, duplicate_of) VALUES (?, ?, ?, ?)
+ON CONFLICT (url) DO UPDATE SET
+    title = excluded.title,
+    content = excluded.content,
+    duplicate_of = excluded.duplicate_of,
+    scraped_at = CURRENT_TIMESTAMP
+WHERE title IS NOT excluded.title OR content IS NOT excluded.content OR duplicate_of IS NOT excluded.duplicate_of
+"""
+SELECT_DOCUMENTS_AFTER: str = """
+SELECT id, url, title, content, duplicate_of FROM documents WHERE id > ? ORDER BY id LIMIT ?
+"""
+SEARCH_DOCUMENTS: str = f"""
+SELECT documents.url, documents.title, snippet(documents_fts, 1, '[', ']', '…', {SNIPPET_TOKEN_COUNT})
+FROM documents_fts JOIN documents ON documents.id = documents_fts.rowid
+WHERE documents_fts MATCH ?
+ORDER BY bm25(documents_fts, 10.0, 1.0)
+LIMIT ?
+"""
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    url: str
+    title: str
+    snippet: str
+
+
+class SqliteScrapedDocumentStorage(ScrapedDocumentStorage, ScrapedDocumentSource):
+    def __init__(self, database_path: Path):
+        self._database_path = database_path
+        self._database = SqliteDatabase(database_path, SCHEMA, "SqliteScrapedDocumentStorage")
+
+    async def __aenter__(self) -> Self:
+        await self._database.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._database.__aexit__(exc_type, exc_value, traceback)
+
+    async def save_all(self, documents: list[ScrapedDocument]) -> None:
+        await self._database.run(lambda connection: _save_all(connection, documents))
+
+    async def search(self, terms: str, limit: int = DEFAULT_SEARCH_LIMIT) -> list[SearchResult]:
+        return await self._database.run(lambda connection: _search(connection, terms, limit))
+
+    async def iter_documents(self) -> AsyncGenerator[ScrapedDocument, None]:
+        async with SqliteDatabase(self._database_path, SCHEMA, "SqliteScrapedDocumentSource") as database:
+            last_id: int = 0
+            while rows := await database.run(
+                lambda connection: connection.execute(SELECT_DOCUMENTS_AFTER, (last_id, READ_BATCH_SIZE)).fetchall()
+            ):
+                for _, url, title, content, duplicate_of in rows:
+                    yield ScrapedDocument(url=url, title=title, content=content, duplicate_of=duplicate_of)
+                last_id = rows[-1][0]
+
+
+def _save_all(connection: sqlite3.Connection, documents: list[ScrapedDocument]) -> None:
+    with connection:
+        connection.executemany(
+            UPSERT_DOCUMENT,
+            [(document.url, document.title, document.content, document.duplicate_of) for document in documents],
+        )
+
+
+def _search(connection: sqlite3.Connection, terms: str, limit: int) -> list[SearchResult]:
+    if not terms.split():
+        return []
+    rows = connection.execute(SEARCH_DOCUMENTS, (to_match_expression(terms), limit)).fetchall()
+    return [SearchResult(url, title, snippet) for url, title, snippet in rows]
+
+
+def to_match_expression(terms: str) -> str:
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms.split())
@@ -0,0 +1,68 @@
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Self
+
+from sightcall_scraping.domain.models.url_state import UrlState
+from sightcall_scraping.domain.ports.url_state_store import UrlStateStore
+from sightcall_scraping.infrastructure.sqlite_database import SqliteDatabase
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS url_states (
+    url TEXT PRIMARY KEY,
+    lastmod TEXT,
+    content_hash TEXT NOT NULL,
+    scraped_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+UPSERT_STATE: str = """
+INSERT INTO url_states (url, lastmod, content_hash) VALUES (?, ?, ?)
+ON CONFLICT (url) DO UPDATE SET
+    lastmod = excluded.lastmod,
+    content_hash = excluded.content_hash,
+    scraped_at = CURRENT_TIMESTAMP
+"""
+SELECT_STATE: str = "SELECT url, lastmod, content_hash FROM url_states WHERE url = ?"
+
+
+class SqliteUrlStateStore(UrlStateStore):
+    def __init__(self, database_path: Path):
+        self._database = SqliteDatabase(database_path, SCHEMA, "SqliteUrlStateStore")
+
+    async def __aenter__(self) -> Self:
+        await self._database.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self._database.__aexit__(exc_type, exc_value, traceback)
+
+    async def get(self, url: str) -> Optional[UrlState]:
+        return await self._database.run(lambda connection: _get(connection, url))
+
+    async def save_all(self, states: list[UrlState]) -> None:
+        await self._database.run(lambda connection: _save_all(connection, states))
+
+
+def _get(connection: sqlite3.Connection, url: str) -> Optional[UrlState]:
+    row = connection.execute(SELECT_STATE, (url,)).fetchone()
+    if row is None:
+        return None
+    url, lastmod, content_hash = row
+    return UrlState(url, datetime.fromisoformat(lastmod) if lastmod else None, content_hash)
+
+
+def _save_all(connection: sqlite3.Connection, states: list[UrlState]) -> None:
+    with connection:
+        connection.executemany(
+            UPSERT_STATE,
+            [
+                (state.url, state.lastmod.isoformat() if state.lastmod else None, state.content_hash)
+                for state in states
+            ],
+        )
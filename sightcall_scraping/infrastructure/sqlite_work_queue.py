@@ -0,0 +1,156 @@
+import asyncio
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Callable, Optional, Self
+
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.ports.work_queue import WorkQueue
+from sightcall_scraping.infrastructure.sqlite_database import SqliteDatabase
+
+DEFAULT_LEASE_SECONDS: float = 600.0
+LEASE_RENEWALS_PER_LEASE: int = 3
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS work_items (
+    canonical_url TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    lastmod TEXT,
+    -- 0: pending, 1: leased by a worker, 2: done.
+    status INTEGER NOT NULL DEFAULT 0,
+    leased_by TEXT,
+    lease_expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS unfinished_work_items ON work_items (status, lease_expires_at) WHERE status < 2;
+CREATE TABLE IF NOT EXISTS work_queue_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+INSERT_URL: str = "INSERT OR IGNORE INTO work_items (canonical_url, url, lastmod) VALUES (?, ?, ?)"
+CLAIM_URLS: str = """
+UPDATE work_items SET status = 1, leased_by = ?, lease_expires_at = ?
+WHERE rowid IN (
+    SELECT rowid FROM work_items
+    WHERE status = 0 OR (status = 1 AND lease_expires_at < ?)
+    ORDER BY rowid LIMIT ?
+)
+RETURNING url, lastmod, rowid
+"""
+RENEW_LEASES: str = "UPDATE work_items SET lease_expires_at = ? WHERE status = 1 AND leased_by = ?"
+COMPLETE_URL: str = (
+    "UPDATE work_items SET status = 2, leased_by = NULL, lease_expires_at = NULL WHERE canonical_url = ?"
+)
+SELECT_IS_ADDING_FINISHED: str = "SELECT EXISTS (SELECT 1 FROM work_queue_state WHERE key = 'adding_finished')"
+FINISH_ADDING: str = "INSERT OR REPLACE INTO work_queue_state (key, value) VALUES ('adding_finished', '1')"
+SELECT_HAS_WORK_LEFT: str = """
+SELECT EXISTS (
+    SELECT 1 FROM work_items
+    WHERE status = 0 OR (status = 1 AND (lease_expires_at < ? OR leased_by != ?))
+)
+"""
+CLEAR_QUEUE: tuple[str, ...] = ("DELETE FROM work_items", "DELETE FROM work_queue_state")
+
+
+class SqliteWorkQueue(WorkQueue):
+    def __init__(
+        self,
+        database_path: Path,
+        worker_id: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        clear_existing: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._database = SqliteDatabase(database_path, SCHEMA, "SqliteWorkQueue")
+        self._worker_id = worker_id
+        self._lease_seconds = lease_seconds
+        self._clear_existing = clear_existing
+        self._clock = clock
+        self._lease_renewal: Optional[asyncio.Task[None]] = None
+
+    async def __aenter__(self) -> Self:
+        await self._database.__aenter__()
+        if self._clear_existing:
+            await self._database.run(_clear)
+        self._lease_renewal = asyncio.create_task(self._renew_leases())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._lease_renewal is not None:
+            self._lease_renewal.cancel()
+            await asyncio.gather(self._lease_renewal, return_exceptions=True)
+        await self._database.__aexit__(exc_type, exc_value, traceback)
+
+    async def add(self, urls: list[Url]) -> int:
+        return await self._database.run(lambda connection: _add(connection, urls))
+
+    async def finish_adding(self) -> None:
+        await self._database.run(lambda connection: _write(connection, FINISH_ADDING))
+
+    async def claim(self, limit: int) -> list[Url]:
+        now: float = self._clock()
+        return await self._database.run(
+            lambda connection: _claim(connection, self._worker_id, now + self._lease_seconds, now, limit)
+        )
+
+    async def complete(self, urls: list[Url]) -> None:
+        await self._database.run(lambda connection: _complete(connection, urls))
+
+    async def is_drained(self) -> bool:
+        now: float = self._clock()
+        return await self._database.run(lambda connection: _is_drained(connection, self._worker_id, now))
+
+    async def _renew_leases(self) -> None:
+        while True:
+            await asyncio.sleep(self._lease_seconds / LEASE_RENEWALS_PER_LEASE)
+            lease_expires_at: float = self._clock() + self._lease_seconds
+            await self._database.run(
+                lambda connection: _write(connection, RENEW_LEASES, (lease_expires_at, self._worker_id))
+            )
+
+
+def _clear(connection: sqlite3.Connection) -> None:
+    with connection:
+        for statement in CLEAR_QUEUE:
+            connection.execute(statement)
+
+
+def _write(connection: sqlite3.Connection, statement: str, parameters: tuple[object, ...] = ()) -> None:
+    with connection:
+        connection.execute(statement, parameters)
+
+
+def _add(connection: sqlite3.Connection, urls: list[Url]) -> int:
+    with connection:
+        before: int = connection.total_changes
+        connection.executemany(
+            INSERT_URL,
+            [(url.canonical_value, url.value, url.lastmod.isoformat() if url.lastmod else None) for url in urls],
+        )
+        return connection.total_changes - before
+
+
+def _claim(
+    connection: sqlite3.Connection, worker_id: str, lease_expires_at: float, now: float, limit: int
+) -> list[Url]:
+    with connection:
+        rows = connection.execute(CLAIM_URLS, (worker_id, lease_expires_at, now, limit)).fetchall()
+    rows.sort(key=lambda row: row[2])
+    return [Url(url, datetime.fromisoformat(lastmod) if lastmod else None) for url, lastmod, _ in rows]
+
+
+def _complete(connection: sqlite3.Connection, urls: list[Url]) -> None:
+    with connection:
+        connection.executemany(COMPLETE_URL, [(url.canonical_value,) for url in urls])
+
+
+def _is_drained(connection: sqlite3.Connection, worker_id: str, now: float) -> bool:
+    is_adding_finished: bool = bool(connection.execute(SELECT_IS_ADDING_FINISHED).fetchone()[0])
+    has_work_left: bool = bool(connection.execute(SELECT_HAS_WORK_LEFT, (now, worker_id)).fetchone()[0])
+    return is_adding_finished and not has_work_left
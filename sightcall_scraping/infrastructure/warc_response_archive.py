@@ -0,0 +1,105 @@
+import asyncio
+import gzip
+import itertools
+import uuid
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from types import TracebackType
+from typing import AsyncGenerator, BinaryIO, Generator, Optional, Self
+
+from sightcall_scraping.domain.models.archived_response import ArchivedResponse
+from sightcall_scraping.domain.ports.response_archive import ResponseArchive
+
+WARC_VERSION: str = "WARC/1.1"
+RECORD_SEPARATOR: bytes = b"\r\n\r\n"
+READ_BATCH_SIZE: int = 100
+DEFAULT_CONTENT_TYPE: str = "text/html; charset=utf-8"
+
+
+class WarcResponseArchive(ResponseArchive):
+    def __init__(self, archive_path: Path, append_existing: bool = False):
+        self._archive_path = archive_path
+        self._append_existing = append_existing
+        self._file: Optional[BinaryIO] = None
+        self._write_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        async with self._write_lock:
+            await asyncio.to_thread(self._close)
+
+    async def append(self, response: ArchivedResponse) -> None:
+        record: bytes = await asyncio.to_thread(_encode_record, response)
+        async with self._write_lock:
+            await asyncio.to_thread(self._write, record)
+
+    async def iter_responses(self) -> AsyncGenerator[ArchivedResponse, None]:
+        records: Generator[ArchivedResponse, None, None] = _read_records(self._archive_path)
+        try:
+            while batch := await asyncio.to_thread(lambda: list(itertools.islice(records, READ_BATCH_SIZE))):
+                for response in batch:
+                    yield response
+        finally:
+            records.close()
+
+    def _write(self, record: bytes) -> None:
+        if self._file is None:
+            self._file = open(self._archive_path, "ab" if self._append_existing else "wb")
+        self._file.write(record)
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _encode_record(response: ArchivedResponse) -> bytes:
+    payload: bytes = response.body
+    header: str = (
+        f"{WARC_VERSION}\r\n"
+        "WARC-Type: resource\r\n"
+        f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>\r\n"
+        f"WARC-Date: {response.fetched_at.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}\r\n"
+        f"WARC-Target-URI: {response.url}\r\n"
+        f"Content-Type: {response.content_type or DEFAULT_CONTENT_TYPE}\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        "\r\n"
+    )
+    return gzip.compress(header.encode("utf-8") + payload + RECORD_SEPARATOR)
+
+
+def _read_records(archive_path: Path) -> Generator[ArchivedResponse, None, None]:
+    with gzip.open(archive_path, "rb") as file:
+        try:
+            while (response := _read_record(file)) is not None:
+                yield response
+        except (EOFError, zlib.error):
+            return
+
+
+def _read_record(file: gzip.GzipFile) -> Optional[ArchivedResponse]:
+    version_line: bytes = file.readline()
+    if not version_line:
+        return None
+    headers: dict[str, str] = {}
+    while (line := file.readline().rstrip(b"\r\n")) != b"":
+        name, _, value = line.decode("utf-8").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    content_length: int = int(headers["content-length"])
+    payload: bytes = file.read(content_length)
+    if len(payload) < content_length or file.read(len(RECORD_SEPARATOR)) != RECORD_SEPARATOR:
+        raise EOFError("Truncated WARC record")
+    return ArchivedResponse(
+        url=headers["warc-target-uri"],
+        body=payload,
+        fetched_at=datetime.strptime(headers["warc-date"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc),
+        content_type=headers.get("content-type"),
+    )
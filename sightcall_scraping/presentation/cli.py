@@ -1,44 +1,32 @@
-import asyncio
-from pathlib import Path
-from typing import Optional
+from typing import List
 
-import rich
+import click
 import typer
+from typer.core import TyperGroup
 
-from sightcall_scraping.application.scrape_sightcall_website import ScrapeSightCallWebsite
-from sightcall_scraping.infrastructure.file_system_scraped_document_storage import FileSystemScrapedDocumentStorage
-from sightcall_scraping.infrastructure.html_document_parser import HtmlDocumentParser
-from sightcall_scraping.infrastructure.http_content_fetcher import HttpContentFetcher
+from sightcall_scraping.presentation.document_commands import convert, reparse, search, strip_boilerplate
+from sightcall_scraping.presentation.scrape_command import scrape
+from sightcall_scraping.presentation.work_queue_commands import enqueue, merge, worker
 
-app = typer.Typer()
+DEFAULT_COMMAND = "scrape"
 
-SIGHTCALL_SITEMAP_INDEX_URL = "https://sightcall.com/sitemap_index.xml"
-DEFAULT_OUTPUT_FILE = "data.json"
 
+class DefaultCommandGroup(TyperGroup):
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        if not args or (args[0] not in self.commands and args[0] not in ctx.help_option_names):
+            args = [DEFAULT_COMMAND, *args]
+        return super().parse_args(ctx, args)
 
-@app.command()
-def scrape(
-    max_urls: Optional[int] = typer.Option(None, help="Maximum number of URLs to scrape."),
-    output_file: Path = typer.Option(DEFAULT_OUTPUT_FILE, help="File to write scraped documents to."),
-) -> None:
-    scrape_website_use_case = ScrapeSightCallWebsite(
-        content_fetcher=HttpContentFetcher(),
-        document_parser=HtmlDocumentParser(),
-        storage=FileSystemScrapedDocumentStorage(output_file),
-    )
-
-    def on_progress(document_count: int) -> None:
-        rich.print(f"Scraped {document_count} documents so far...")
-
-    scraped_documents = asyncio.run(
-        scrape_website_use_case.execute(
-            SIGHTCALL_SITEMAP_INDEX_URL,
-            on_progress,
-            max_urls=max_urls,
-        )
-    )
-    rich.print(f"Scraped {len(scraped_documents)} documents to {output_file} successfully!")
 
+app = typer.Typer(cls=DefaultCommandGroup)
+app.command()(scrape)
+app.command()(enqueue)
+app.command()(worker)
+app.command()(merge)
+app.command()(convert)
+app.command(name="strip-boilerplate")(strip_boilerplate)
+app.command()(reparse)
+app.command()(search)
 
 if __name__ == "__main__":
     app()
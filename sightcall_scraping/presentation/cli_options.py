@@ -0,0 +1,115 @@
+from enum import Enum
+from pathlib import Path
+from typing import Annotated, List, Optional
+
+import typer
+
+from sightcall_scraping.infrastructure.document_parsers import ParserEngine
+
+SIGHTCALL_SITEMAP_INDEX_URL = "https://sightcall.com/sitemap_index.xml"
+DEFAULT_OUTPUT_FILE = "data.json"
+DEFAULT_DATABASE_FILE = "data.sqlite"
+DEFAULT_QUEUE_FILE = ".scraper_queue.sqlite"
+REPORT_FILE_SUFFIX = ".report.json"
+BYTES_PER_MB = 1024 * 1024
+
+
+class OutputFormat(str, Enum):
+    JSON = "json"
+    JSONL = "jsonl"
+    SQLITE = "sqlite"
+
+
+class DedupIndex(str, Enum):
+    EXACT = "exact"
+    BLOOM = "bloom"
+
+
+class NearDuplicateHandling(str, Enum):
+    KEEP = "keep"
+    LINK = "link"
+    DROP = "drop"
+
+
+SitemapIndexUrlsOption = Annotated[
+    Optional[List[str]],
+    typer.Option(
+        "--sitemap-index-url",
+        help=f"Sitemap index of a site to scrape. Repeat it to scrape several sites in one run. "
+        f"Defaults to {SIGHTCALL_SITEMAP_INDEX_URL}.",
+    ),
+]
+SitesFileOption = Annotated[
+    Optional[Path],
+    typer.Option(help="Text file listing sitemap index URLs to scrape, one per line, with `#` comments."),
+]
+MaxUrlsOption = Annotated[Optional[int], typer.Option(help="Maximum number of URLs to scrape, all sites together.")]
+OutputFileOption = Annotated[
+    Optional[Path],
+    typer.Option(
+        help=f"File to write scraped documents to. Defaults to {DEFAULT_OUTPUT_FILE}, or {DEFAULT_DATABASE_FILE}."
+    ),
+]
+OutputFormatOption = Annotated[
+    OutputFormat,
+    typer.Option(
+        "--format",
+        help="Output format: a JSON array, JSON lines streamed as pages finish, "
+        "or a SQLite database with a full-text index for `search`.",
+    ),
+]
+MaxConnectionsOption = Annotated[int, typer.Option(help="Size of the HTTP connection pool.")]
+MaxConnectionsPerHostOption = Annotated[
+    int, typer.Option(help="Maximum number of simultaneous connections to a single host.")
+]
+MinConcurrencyOption = Annotated[
+    int, typer.Option(help="Lowest number of in-flight page requests to a host when it pushes back.")
+]
+MaxConcurrencyOption = Annotated[
+    int, typer.Option(help="Highest number of in-flight page requests, all sites together.")
+]
+MaxConcurrencyPerHostOption = Annotated[
+    Optional[int],
+    typer.Option(
+        help="Highest number of in-flight page requests to a host while it stays healthy. "
+        "Defaults to --max-concurrency."
+    ),
+]
+MaxRpsOption = Annotated[Optional[float], typer.Option(help="Cap on page requests started per second, for each host.")]
+Http2Option = Annotated[bool, typer.Option(help="Multiplex requests over HTTP/2 (requires the `http2` extra).")]
+TimeoutOption = Annotated[float, typer.Option(help="HTTP timeout in seconds.")]
+MaxPageSizeMbOption = Annotated[
+    float, typer.Option(help="Pages larger than this are skipped, without being downloaded.")
+]
+ParserOption = Annotated[
+    ParserEngine, typer.Option("--parser", help="HTML extraction engine. lxml is faster, with the same output.")
+]
+ParseWorkersOption = Annotated[
+    int, typer.Option(help="Number of processes parsing HTML in parallel. 0 parses in a background thread instead.")
+]
+DedupOption = Annotated[
+    DedupIndex,
+    typer.Option(
+        help="How discovered URLs are deduplicated: an exact set, or a fixed-size Bloom filter for huge sitemaps."
+    ),
+]
+BloomCapacityOption = Annotated[
+    int, typer.Option(help="Number of URLs the Bloom filter is sized for (0.1% false positives).")
+]
+QueueFileOption = Annotated[
+    Path, typer.Option(help="SQLite database of the pages shared out to the workers. More can join with `worker`.")
+]
+ReportFileOption = Annotated[
+    Optional[Path],
+    typer.Option(
+        help=f"JSON file the run summary and per-stage metrics are written to. Defaults to the output file plus "
+        f"{REPORT_FILE_SUFFIX}."
+    ),
+]
+StripBoilerplateOption = Annotated[
+    bool,
+    typer.Option(help="Once scraped, remove the text repeated across pages (menus, footers) from the output file."),
+]
+BoilerplateThresholdOption = Annotated[
+    float, typer.Option(help="Share of documents a passage must appear in to count as boilerplate.")
+]
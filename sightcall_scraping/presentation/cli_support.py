@@ -0,0 +1,91 @@
+import time
+import uuid
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import rich
+
+from sightcall_scraping.application.discovery.seen_url_index import (
+    BloomFilterSeenUrlIndex,
+    ExactSeenUrlIndex,
+    SeenUrlIndex,
+)
+from sightcall_scraping.application.merge_scraped_documents import MergeReport
+from sightcall_scraping.application.scrape_summary import ScrapeSummary
+from sightcall_scraping.presentation.cli_options import SIGHTCALL_SITEMAP_INDEX_URL, DedupIndex
+
+PROGRESS_INTERVAL_SECONDS = 5.0
+
+
+def read_sites_file(sites_file: Path) -> List[str]:
+    lines = (line.split("#", 1)[0].strip() for line in sites_file.read_text(encoding="utf-8").splitlines())
+    return [line for line in lines if line]
+
+
+def sitemap_index_urls_to_scrape(sitemap_index_urls: Optional[List[str]], sites_file: Optional[Path]) -> List[str]:
+    urls: List[str] = list(sitemap_index_urls or [])
+    if sites_file is not None:
+        urls.extend(read_sites_file(sites_file))
+    return urls or [SIGHTCALL_SITEMAP_INDEX_URL]
+
+
+def seen_url_index_factory(dedup_index: DedupIndex, bloom_capacity: int) -> Callable[[], SeenUrlIndex]:
+    if dedup_index == DedupIndex.BLOOM:
+        return lambda: BloomFilterSeenUrlIndex(bloom_capacity)
+    return ExactSeenUrlIndex
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def throttled(
+    on_progress: Callable[[int], None], interval_seconds: float, clock: Callable[[], float] = time.monotonic
+) -> Callable[[int], None]:
+    last_call: Optional[float] = None
+
+    def call_at_most_every_interval(document_count: int) -> None:
+        nonlocal last_call
+        now: float = clock()
+        if last_call is None or now - last_call >= interval_seconds:
+            last_call = now
+            on_progress(document_count)
+
+    return call_at_most_every_interval
+
+
+def print_progress(verb: str) -> Callable[[int], None]:
+    def on_progress(document_count: int) -> None:
+        rich.print(f"{verb} {document_count} documents so far...")
+
+    return throttled(on_progress, PROGRESS_INTERVAL_SECONDS)
+
+
+def print_unreachable_sitemap_indexes(summary: ScrapeSummary) -> None:
+    rich.print(
+        f"[red]Could not fetch any sitemap index ({', '.join(summary.failed_sitemap_index_urls)}): "
+        f"only {summary.scraped_document_count} documents were scraped.[/red]"
+    )
+
+
+def print_failed_sitemaps(summary: ScrapeSummary) -> None:
+    failed_sitemap_count: int = len(summary.failed_sitemap_index_urls) + len(summary.failed_sitemap_urls)
+    if failed_sitemap_count and not summary.is_every_sitemap_index_failed:
+        rich.print(f"[yellow]{failed_sitemap_count} sitemaps could not be fetched.[/yellow]")
+
+
+def print_merge_report(report: MergeReport, output_file: Path) -> None:
+    rich.print(f"Merged {report.merged_document_count} documents to {output_file} successfully!")
+    if report.duplicate_document_count:
+        rich.print(f"Dropped {report.duplicate_document_count} pages scraped by two workers.")
+
+
+def run_report(started_at: datetime, finished_at: datetime, summary: ScrapeSummary) -> dict[str, object]:
+    return {
+        "started_at": started_at.isoformat(),
+        "finished_at": finished_at.isoformat(),
+        "duration_seconds": (finished_at - started_at).total_seconds(),
+        "summary": {**asdict(summary), "failed_url_count": summary.failed_url_count},
+    }
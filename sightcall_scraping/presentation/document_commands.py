@@ -0,0 +1,121 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import Optional
+
+import rich
+import typer
+from rich.markup import escape
+
+from sightcall_scraping.application.page_scraping.concurrency_limits import MAX_CONCURRENT_PARSES
+from sightcall_scraping.application.reparse_archived_responses import ReparseArchivedResponses
+from sightcall_scraping.domain.boilerplate_detector import (
+    DEFAULT_MIN_DOCUMENT_COUNT,
+    DEFAULT_SHINGLE_SIZE,
+    DEFAULT_THRESHOLD,
+    BoilerplateDetector,
+)
+from sightcall_scraping.infrastructure.document_parsers import ParserEngine, create_document_parser
+from sightcall_scraping.infrastructure.json_lines_conversion import convert_json_lines_to_json_array
+from sightcall_scraping.infrastructure.sqlite_scraped_document_storage import (
+    DEFAULT_SEARCH_LIMIT,
+    SearchResult,
+    SqliteScrapedDocumentStorage,
+)
+from sightcall_scraping.infrastructure.warc_response_archive import WarcResponseArchive
+from sightcall_scraping.presentation.cli_options import (
+    DEFAULT_DATABASE_FILE,
+    DEFAULT_OUTPUT_FILE,
+    OutputFileOption,
+    OutputFormat,
+    OutputFormatOption,
+    ParserOption,
+)
+from sightcall_scraping.presentation.cli_support import print_progress
+from sightcall_scraping.presentation.document_files import (
+    create_storage,
+    default_output_file,
+    print_boilerplate_report,
+    remove_boilerplate,
+)
+from sightcall_scraping.presentation.scraping_options import parse_executor
+
+
+def convert(
+    json_lines_file: Path = typer.Argument(..., help="JSON lines file written by `scrape --format jsonl`."),
+    output_file: Path = typer.Option(DEFAULT_OUTPUT_FILE, help="JSON array file to write."),
+) -> None:
+    converted_document_count = convert_json_lines_to_json_array(json_lines_file, output_file)
+    rich.print(f"Converted {converted_document_count} documents to {output_file} successfully!")
+
+
+def strip_boilerplate(
+    input_file: Path = typer.Argument(..., help="File written by `scrape`."),
+    output_file: Optional[Path] = typer.Option(
+        None, help="File to write the stripped documents to. Defaults to in place."
+    ),
+    file_format: OutputFormat = typer.Option(
+        OutputFormat.JSON, "--format", help="Format of the input and output files."
+    ),
+    threshold: float = typer.Option(
+        DEFAULT_THRESHOLD, help="Share of documents a passage must appear in to count as boilerplate."
+    ),
+    min_documents: int = typer.Option(
+        DEFAULT_MIN_DOCUMENT_COUNT, help="Fewest documents a passage must appear in, whatever the corpus size."
+    ),
+    shingle_size: int = typer.Option(
+        DEFAULT_SHINGLE_SIZE, help="Number of consecutive words compared across documents."
+    ),
+) -> None:
+    boilerplate_detector = BoilerplateDetector(threshold, min_documents, shingle_size)
+    report = remove_boilerplate(file_format, input_file, output_file or input_file, boilerplate_detector)
+    print_boilerplate_report(report)
+
+
+def reparse(
+    archive: Path = typer.Option(..., help="Archive written by `scrape --archive-file`."),
+    output_file: OutputFileOption = None,
+    output_format: OutputFormatOption = OutputFormat.JSON,
+    parser_engine: ParserOption = ParserEngine.BEAUTIFULSOUP,
+    parse_workers: int = typer.Option(
+        os.cpu_count() or 1, help="Number of processes parsing HTML in parallel. 0 parses in a background thread."
+    ),
+) -> None:
+    if not archive.exists():
+        rich.print(f"[red]{archive} does not exist: scrape with `--archive-file` first.[/red]")
+        raise typer.Exit(code=1)
+    output_file = output_file or default_output_file(output_format)
+    with parse_executor(parse_workers) as executor:
+        reparse_use_case = ReparseArchivedResponses(
+            WarcResponseArchive(archive),
+            create_document_parser(parser_engine),
+            create_storage(output_format, output_file),
+            parse_executor=executor,
+            max_concurrent_parses=parse_workers or MAX_CONCURRENT_PARSES,
+        )
+        summary = asyncio.run(reparse_use_case.execute(print_progress("Parsed")))
+    rich.print(f"Parsed {summary.reparsed_document_count} archived pages to {output_file} successfully!")
+    if summary.superseded_response_count:
+        rich.print(f"Skipped {summary.superseded_response_count} older copies of pages archived again later.")
+    if summary.failed_urls:
+        rich.print(f"[yellow]{len(summary.failed_urls)} archived pages could not be parsed.[/yellow]")
+
+
+def search(
+    terms: str = typer.Argument(..., help="Words that must all appear in the title or content of a document."),
+    database_file: Path = typer.Option(DEFAULT_DATABASE_FILE, help="Database written by `scrape --format sqlite`."),
+    limit: int = typer.Option(DEFAULT_SEARCH_LIMIT, help="Maximum number of documents to show."),
+) -> None:
+    if not database_file.exists():
+        rich.print(f"[red]{database_file} does not exist: scrape with `--format sqlite` first.[/red]")
+        raise typer.Exit(code=1)
+
+    async def run() -> list[SearchResult]:
+        async with SqliteScrapedDocumentStorage(database_file) as storage:
+            return await storage.search(terms, limit)
+
+    results = asyncio.run(run())
+    for result in results:
+        rich.print(f"[bold]{escape(result.title)}[/bold] {escape(result.url)}")
+        rich.print(f"  {escape(result.snippet)}")
+    rich.print(f"{len(results)} documents found.")
@@ -0,0 +1,89 @@
+import asyncio
+from pathlib import Path
+from typing import List, Optional
+
+import rich
+
+from sightcall_scraping.application.merge_scraped_documents import MergeReport, MergeScrapedDocuments
+from sightcall_scraping.application.remove_boilerplate import BoilerplateReport, RemoveBoilerplate
+from sightcall_scraping.domain.boilerplate_detector import BoilerplateDetector
+from sightcall_scraping.domain.ports.metrics_recorder import MetricsRecorder
+from sightcall_scraping.domain.ports.scraped_document_source import ScrapedDocumentSource
+from sightcall_scraping.domain.ports.scraped_document_storage import ScrapedDocumentStorage
+from sightcall_scraping.infrastructure.file_system_scraped_document_source import FileSystemScrapedDocumentSource
+from sightcall_scraping.infrastructure.file_system_scraped_document_storage import FileSystemScrapedDocumentStorage
+from sightcall_scraping.infrastructure.json_lines_scraped_document_source import JsonLinesScrapedDocumentSource
+from sightcall_scraping.infrastructure.json_lines_scraped_document_storage import JsonLinesScrapedDocumentStorage
+from sightcall_scraping.infrastructure.sqlite_scraped_document_storage import SqliteScrapedDocumentStorage
+from sightcall_scraping.presentation.cli_options import DEFAULT_DATABASE_FILE, DEFAULT_OUTPUT_FILE, OutputFormat
+
+
+def default_output_file(output_format: OutputFormat) -> Path:
+    return Path(DEFAULT_DATABASE_FILE if output_format == OutputFormat.SQLITE else DEFAULT_OUTPUT_FILE)
+
+
+def sidecar_file(output_file: Path, suffix: str) -> Path:
+    return output_file.with_name(output_file.name + suffix)
+
+
+def create_storage(
+    output_format: OutputFormat,
+    output_file: Path,
+    merge_existing: bool = False,
+    resume: bool = False,
+    metrics_recorder: Optional[MetricsRecorder] = None,
+) -> ScrapedDocumentStorage:
+    if output_format == OutputFormat.SQLITE:
+        return SqliteScrapedDocumentStorage(output_file)
+    if output_format == OutputFormat.JSONL:
+        return JsonLinesScrapedDocumentStorage(
+            output_file, merge_existing=merge_existing, append_existing=resume, metrics_recorder=metrics_recorder
+        )
+    return FileSystemScrapedDocumentStorage(
+        output_file, merge_existing=merge_existing or resume, metrics_recorder=metrics_recorder
+    )
+
+
+def create_document_source(input_format: OutputFormat, input_file: Path) -> ScrapedDocumentSource:
+    if input_format == OutputFormat.SQLITE:
+        return SqliteScrapedDocumentStorage(input_file)
+    if input_format == OutputFormat.JSONL:
+        return JsonLinesScrapedDocumentSource(input_file)
+    return FileSystemScrapedDocumentSource(input_file)
+
+
+def merge_scraped_documents(input_files: List[Path], output_format: OutputFormat, output_file: Path) -> MergeReport:
+    sources: List[ScrapedDocumentSource] = [JsonLinesScrapedDocumentSource(input_file) for input_file in input_files]
+    return asyncio.run(MergeScrapedDocuments(sources, create_storage(output_format, output_file)).execute())
+
+
+def remove_boilerplate(
+    file_format: OutputFormat, input_file: Path, output_file: Path, boilerplate_detector: BoilerplateDetector
+) -> BoilerplateReport:
+    target_file: Path = (
+        sidecar_file(output_file, ".stripping") if output_file.resolve() == input_file.resolve() else output_file
+    )
+    remove_boilerplate_use_case = RemoveBoilerplate(
+        create_document_source(file_format, input_file),
+        create_storage(file_format, target_file),
+        boilerplate_detector,
+    )
+    report = asyncio.run(remove_boilerplate_use_case.execute())
+    if target_file != output_file:
+        target_file.replace(output_file)
+    return report
+
+
+def print_boilerplate_report(report: BoilerplateReport) -> None:
+    rich.print(
+        f"Removed boilerplate from {report.changed_document_count} of {report.document_count} documents, "
+        f"saving {report.saved_bytes} bytes ({report.saved_ratio:.0%} of the content)."
+    )
+
+
+def strip_boilerplate_in_place(output_format: OutputFormat, output_file: Path, boilerplate_threshold: float) -> None:
+    print_boilerplate_report(
+        remove_boilerplate(
+            output_format, output_file, output_file, BoilerplateDetector(threshold=boilerplate_threshold)
+        )
+    )
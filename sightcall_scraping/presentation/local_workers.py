@@ -0,0 +1,137 @@
+import asyncio
+import os
+import shutil
+import socket
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import rich
+
+from sightcall_scraping.application.discovery.seen_url_index import SeenUrlIndex
+from sightcall_scraping.application.discovery.sitemap_url_discovery import SitemapUrlDiscovery
+from sightcall_scraping.application.merge_scraped_documents import MergeReport
+from sightcall_scraping.application.scrape_summary import ScrapeSummary
+from sightcall_scraping.application.work_queue.enqueue_sitemap_urls import EnqueueSitemapUrls
+from sightcall_scraping.infrastructure.in_memory_metrics_recorder import InMemoryMetricsRecorder
+from sightcall_scraping.infrastructure.metrics_exporters import write_json_report
+from sightcall_scraping.infrastructure.sqlite_work_queue import SqliteWorkQueue
+from sightcall_scraping.presentation.cli_options import OutputFormat
+from sightcall_scraping.presentation.cli_support import (
+    print_failed_sitemaps,
+    print_merge_report,
+    print_unreachable_sitemap_indexes,
+    run_report,
+)
+from sightcall_scraping.presentation.document_files import merge_scraped_documents, sidecar_file
+from sightcall_scraping.presentation.scraping_options import ScrapingOptions
+
+COORDINATOR_ID = "coordinator"
+WORKER_OUTPUT_DIR_SUFFIX = ".workers"
+WORKER_QUEUE_FILE_NAME = "queue.sqlite"
+
+
+@dataclass(frozen=True)
+class LocalWorkers:
+    count: int
+    scraping: ScrapingOptions
+    queue_file: Optional[Path]
+
+
+@dataclass(frozen=True)
+class MergedOutput:
+    output_file: Path
+    output_format: OutputFormat
+    report_file: Path
+
+
+def scrape_with_workers(
+    local_workers: LocalWorkers,
+    create_seen_url_index: Callable[[], SeenUrlIndex],
+    sitemaps: Tuple[List[str], Optional[int]],
+    merged_output: MergedOutput,
+) -> ScrapeSummary:
+    metrics_recorder = InMemoryMetricsRecorder()
+    url_discovery = SitemapUrlDiscovery(
+        local_workers.scraping.http.create_content_fetcher(metrics_recorder),
+        create_seen_url_index,
+        metrics_recorder=metrics_recorder,
+    )
+    worker_output_dir: Path = sidecar_file(merged_output.output_file, WORKER_OUTPUT_DIR_SUFFIX)
+    queue_file: Path = local_workers.queue_file or worker_output_dir / WORKER_QUEUE_FILE_NAME
+    worker_commands: List[List[str]] = [
+        worker_command(queue_file, worker_output_dir / f"worker-{index}.jsonl", index, local_workers.scraping)
+        for index in range(local_workers.count)
+    ]
+    started_at = datetime.now(timezone.utc)
+    enqueue_use_case = EnqueueSitemapUrls(url_discovery, SqliteWorkQueue(queue_file, COORDINATOR_ID))
+    summary, exit_codes = asyncio.run(
+        enqueue_while_scraping(enqueue_use_case, sitemaps, queue_file, worker_output_dir, worker_commands)
+    )
+    merge_report = merge_worker_output(worker_output_dir, merged_output, exit_codes)
+    report: dict[str, object] = {**run_report(started_at, datetime.now(timezone.utc), summary)}
+    report.update({"merge": asdict(merge_report), "worker_exit_codes": exit_codes, **metrics_recorder.to_report()})
+    write_json_report(report, merged_output.report_file)
+    print_discovery_summary(summary)
+    return summary
+
+
+def worker_command(queue_file: Path, output_file: Path, index: int, scraping: ScrapingOptions) -> List[str]:
+    return [
+        sys.executable,
+        "-m",
+        "sightcall_scraping.main",
+        "worker",
+        "--queue-file",
+        str(queue_file),
+        "--output-file",
+        str(output_file),
+        "--worker-id",
+        f"{socket.gethostname()}-{os.getpid()}-{index}",
+        *scraping.to_arguments(),
+    ]
+
+
+async def enqueue_while_scraping(
+    enqueue_use_case: EnqueueSitemapUrls,
+    sitemaps: Tuple[List[str], Optional[int]],
+    queue_file: Path,
+    worker_output_dir: Path,
+    worker_commands: List[List[str]],
+) -> Tuple[ScrapeSummary, List[int]]:
+    shutil.rmtree(worker_output_dir, ignore_errors=True)
+    worker_output_dir.mkdir(parents=True)
+    async with SqliteWorkQueue(queue_file, COORDINATOR_ID, clear_existing=True):
+        pass
+    workers: List[asyncio.subprocess.Process] = [
+        await asyncio.create_subprocess_exec(*command) for command in worker_commands
+    ]
+    try:
+        summary: ScrapeSummary = await enqueue_use_case.execute(*sitemaps)
+        return summary, [await worker.wait() for worker in workers]
+    finally:
+        for worker in workers:
+            if worker.returncode is None:
+                worker.kill()
+
+
+def merge_worker_output(worker_output_dir: Path, merged_output: MergedOutput, exit_codes: List[int]) -> MergeReport:
+    report: MergeReport = merge_scraped_documents(
+        sorted(worker_output_dir.glob("*.jsonl")), merged_output.output_format, merged_output.output_file
+    )
+    shutil.rmtree(worker_output_dir)
+    print_merge_report(report, merged_output.output_file)
+    for index, exit_code in enumerate(exit_codes):
+        if exit_code != 0:
+            rich.print(f"[yellow]Worker {index} exited with code {exit_code}.[/yellow]")
+    return report
+
+
+def print_discovery_summary(summary: ScrapeSummary) -> None:
+    if summary.is_every_sitemap_index_failed:
+        print_unreachable_sitemap_indexes(summary)
+    print_failed_sitemaps(summary)
+    if summary.duplicate_url_count:
+        rich.print(f"Suppressed {summary.duplicate_url_count} duplicate URLs.")
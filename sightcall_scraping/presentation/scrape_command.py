@@ -0,0 +1,292 @@
+import asyncio
+from pathlib import Path
+from typing import List, Optional
+
+import rich
+import typer
+
+from sightcall_scraping.application.discovery.crawl_url_discovery import CrawlUrlDiscovery
+from sightcall_scraping.application.discovery.link_crawl import MAX_CRAWL_DEPTH
+from sightcall_scraping.application.discovery.seen_url_index import DEFAULT_BLOOM_FILTER_CAPACITY
+from sightcall_scraping.application.discovery.sitemap_url_discovery import SitemapUrlDiscovery
+from sightcall_scraping.application.discovery.url_discovery import UrlDiscovery
+from sightcall_scraping.application.page_scraping.concurrency_limits import (
+    MAX_CONCURRENT_REQUESTS,
+    MIN_CONCURRENT_REQUESTS,
+)
+from sightcall_scraping.application.recording.near_duplicate_index import DEFAULT_SIMILARITY_THRESHOLD
+from sightcall_scraping.application.recording.page_recorder import PageRecorder, PageRecorders
+from sightcall_scraping.application.recording.run_journal_recorder import RunJournalRecorder
+from sightcall_scraping.application.recording.url_state_recorder import IncrementalUrlStateRecorder, UrlStateRecorder
+from sightcall_scraping.application.scrape_sightcall_website import ScrapeSightCallWebsite
+from sightcall_scraping.application.scrape_summary import ScrapeSummary
+from sightcall_scraping.domain.boilerplate_detector import DEFAULT_THRESHOLD
+from sightcall_scraping.domain.errors import UnknownRunError
+from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.domain.ports.document_parser import DocumentParser
+from sightcall_scraping.infrastructure.archiving_content_fetcher import ArchivingContentFetcher
+from sightcall_scraping.infrastructure.caching_content_fetcher import CachingContentFetcher
+from sightcall_scraping.infrastructure.document_parsers import ParserEngine, create_document_parser
+from sightcall_scraping.infrastructure.http_content_fetcher import (
+    DEFAULT_MAX_BODY_BYTES,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_TIMEOUT_SECONDS,
+    HttpContentFetcher,
+)
+from sightcall_scraping.infrastructure.in_memory_metrics_recorder import InMemoryMetricsRecorder
+from sightcall_scraping.infrastructure.sqlite_crawl_frontier import SqliteCrawlFrontier
+from sightcall_scraping.infrastructure.sqlite_http_response_cache import SqliteHttpResponseCache
+from sightcall_scraping.infrastructure.sqlite_run_journal import SqliteRunJournal
+from sightcall_scraping.infrastructure.sqlite_url_state_store import SqliteUrlStateStore
+from sightcall_scraping.infrastructure.warc_response_archive import WarcResponseArchive
+from sightcall_scraping.presentation.cli_options import (
+    BYTES_PER_MB,
+    REPORT_FILE_SUFFIX,
+    BloomCapacityOption,
+    BoilerplateThresholdOption,
+    DedupIndex,
+    DedupOption,
+    Http2Option,
+    MaxConcurrencyOption,
+    MaxConcurrencyPerHostOption,
+    MaxConnectionsOption,
+    MaxConnectionsPerHostOption,
+    MaxPageSizeMbOption,
+    MaxRpsOption,
+    MaxUrlsOption,
+    MinConcurrencyOption,
+    NearDuplicateHandling,
+    OutputFileOption,
+    OutputFormat,
+    OutputFormatOption,
+    ParserOption,
+    ParseWorkersOption,
+    ReportFileOption,
+    SitemapIndexUrlsOption,
+    SitesFileOption,
+    StripBoilerplateOption,
+    TimeoutOption,
+)
+from sightcall_scraping.presentation.cli_support import (
+    new_run_id,
+    print_progress,
+    seen_url_index_factory,
+    sitemap_index_urls_to_scrape,
+)
+from sightcall_scraping.presentation.document_files import (
+    create_storage,
+    default_output_file,
+    sidecar_file,
+    strip_boilerplate_in_place,
+)
+from sightcall_scraping.presentation.local_workers import LocalWorkers, MergedOutput, scrape_with_workers
+from sightcall_scraping.presentation.scrape_report import ScrapeReport, create_near_duplicate_filter
+from sightcall_scraping.presentation.scraping_options import (
+    HttpOptions,
+    ScrapingOptions,
+    concurrency_limits,
+    parse_executor,
+)
+
+STATE_FILE_SUFFIX = ".state.sqlite"
+JOURNAL_FILE_SUFFIX = ".journal.sqlite"
+FRONTIER_FILE_SUFFIX = ".frontier.sqlite"
+DEFAULT_CACHE_SIZE_MB = 512
+
+
+def scrape(
+    sitemap_index_urls: SitemapIndexUrlsOption = None,
+    sites_file: SitesFileOption = None,
+    max_urls: MaxUrlsOption = None,
+    output_file: OutputFileOption = None,
+    output_format: OutputFormatOption = OutputFormat.JSON,
+    max_connections: MaxConnectionsOption = DEFAULT_MAX_CONNECTIONS,
+    max_connections_per_host: MaxConnectionsPerHostOption = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    min_concurrency: MinConcurrencyOption = MIN_CONCURRENT_REQUESTS,
+    max_concurrency: MaxConcurrencyOption = MAX_CONCURRENT_REQUESTS,
+    max_concurrency_per_host: MaxConcurrencyPerHostOption = None,
+    max_rps: MaxRpsOption = None,
+    http2: Http2Option = False,
+    timeout: TimeoutOption = DEFAULT_TIMEOUT_SECONDS,
+    max_page_size_mb: MaxPageSizeMbOption = DEFAULT_MAX_BODY_BYTES / BYTES_PER_MB,
+    parser_engine: ParserOption = ParserEngine.BEAUTIFULSOUP,
+    parse_workers: ParseWorkersOption = 0,
+    incremental: bool = typer.Option(
+        False, help="Only scrape pages whose sitemap lastmod changed since the last run, keeping the others."
+    ),
+    state_file: Optional[Path] = typer.Option(
+        None,
+        help="SQLite database remembering what was scraped, for later --incremental runs. Only kept when given, "
+        f"or when incremental, which defaults it to the output file plus {STATE_FILE_SUFFIX}.",
+    ),
+    cache_file: Optional[Path] = typer.Option(
+        None, help="SQLite database caching responses, revalidated with ETag / Last-Modified on the next run."
+    ),
+    cache_size_mb: int = typer.Option(
+        DEFAULT_CACHE_SIZE_MB, help="Size above which least recently used responses are evicted."
+    ),
+    archive_file: Optional[Path] = typer.Option(
+        None, help="Gzipped WARC file every fetched page is archived to, for a later `reparse` without the network."
+    ),
+    resume: Optional[str] = typer.Option(
+        None, metavar="RUN_ID", help="Resume an interrupted run, skipping the pages it already stored."
+    ),
+    journal_file: Optional[Path] = typer.Option(
+        None,
+        help="SQLite database journaling the progress of recent runs, so that an interrupted one can be resumed. "
+        f"Only kept when given, or when resuming, which defaults it to the output file plus {JOURNAL_FILE_SUFFIX}.",
+    ),
+    crawl: bool = typer.Option(
+        False, help="Also scrape pages missing from the sitemaps, by following same-site links from the sitemap pages."
+    ),
+    max_crawl_depth: int = typer.Option(
+        MAX_CRAWL_DEPTH, help="Highest number of links followed from a sitemap page when crawling."
+    ),
+    crawl_time_budget: Optional[float] = typer.Option(
+        None, help="Seconds after which a crawl stops handing out new pages, finishing the ones in flight."
+    ),
+    frontier_file: Optional[Path] = typer.Option(
+        None,
+        help="SQLite database holding the pages waiting to be crawled and those already seen. Defaults to the "
+        f"output file plus {FRONTIER_FILE_SUFFIX}.",
+    ),
+    dedup: DedupOption = DedupIndex.EXACT,
+    bloom_capacity: BloomCapacityOption = DEFAULT_BLOOM_FILTER_CAPACITY,
+    near_duplicates: NearDuplicateHandling = typer.Option(
+        NearDuplicateHandling.KEEP,
+        help="What to do with pages nearly identical to one already scraped: keep them, "
+        "link them to it with a `duplicate_of` field, or drop them.",
+    ),
+    similarity_threshold: float = typer.Option(
+        DEFAULT_SIMILARITY_THRESHOLD, help="Estimated Jaccard similarity above which two pages are near-duplicates."
+    ),
+    strip_boilerplate: StripBoilerplateOption = False,
+    report_file: ReportFileOption = None,
+    prometheus_file: Optional[Path] = typer.Option(
+        None, help="Also write the metrics in Prometheus text format, e.g. for node_exporter's textfile collector."
+    ),
+    boilerplate_threshold: BoilerplateThresholdOption = DEFAULT_THRESHOLD,
+    workers: int = typer.Option(
+        1,
+        help="Number of worker processes scraping the pages, merged into the output file at the end. "
+        "The concurrency options apply to each worker.",
+    ),
+    queue_file: Optional[Path] = typer.Option(
+        None,
+        help="SQLite database of the pages shared out to the workers, so that more can join with `worker`. "
+        "Defaults to a file removed once the workers are done.",
+    ),
+) -> None:
+    output_file = output_file or default_output_file(output_format)
+    report_file = report_file or sidecar_file(output_file, REPORT_FILE_SUFFIX)
+    scraping = ScrapingOptions(
+        HttpOptions(max_connections, max_connections_per_host, http2, timeout, max_page_size_mb),
+        concurrency_limits(max_concurrency, min_concurrency, max_concurrency_per_host, max_rps, parse_workers),
+        parser_engine,
+        parse_workers,
+    )
+    if workers > 1:
+        exit_on_single_process_options(
+            {
+                "--resume": resume is not None,
+                "--incremental": incremental,
+                "--crawl": crawl,
+                "--cache-file": cache_file is not None,
+                "--archive-file": archive_file is not None,
+                "--near-duplicates": near_duplicates != NearDuplicateHandling.KEEP,
+                "--journal-file": journal_file is not None,
+                "--state-file": state_file is not None,
+            }
+        )
+        summary = scrape_with_workers(
+            LocalWorkers(workers, scraping, queue_file),
+            seen_url_index_factory(dedup, bloom_capacity),
+            (sitemap_index_urls_to_scrape(sitemap_index_urls, sites_file), max_urls),
+            MergedOutput(output_file, output_format, report_file),
+        )
+        finish_output(summary, output_format, output_file, boilerplate_threshold if strip_boilerplate else None)
+        return
+    run_id: str = resume or new_run_id()
+    is_resumed: bool = resume is not None
+    metrics_recorder = InMemoryMetricsRecorder()
+    http_content_fetcher: HttpContentFetcher = scraping.http.create_content_fetcher(metrics_recorder)
+    caching_content_fetcher = create_caching_content_fetcher(http_content_fetcher, cache_file, cache_size_mb)
+    content_fetcher = with_archive(
+        caching_content_fetcher or http_content_fetcher, archive_file, incremental or is_resumed
+    )
+    url_discovery: UrlDiscovery = SitemapUrlDiscovery(
+        content_fetcher, seen_url_index_factory(dedup, bloom_capacity), metrics_recorder=metrics_recorder
+    )
+    if crawl:
+        crawl_frontier = SqliteCrawlFrontier(
+            frontier_file or sidecar_file(output_file, FRONTIER_FILE_SUFFIX), resume=is_resumed
+        )
+        url_discovery = CrawlUrlDiscovery(url_discovery, crawl_frontier, max_crawl_depth, crawl_time_budget)
+    page_recorders: List[PageRecorder] = []
+    if is_resumed or journal_file is not None:
+        journal_file = journal_file or sidecar_file(output_file, JOURNAL_FILE_SUFFIX)
+        page_recorders.append(RunJournalRecorder(SqliteRunJournal(journal_file, run_id, is_resumed)))
+        rich.print(
+            f"Run {run_id}: if interrupted, continue it with `scrape --resume {run_id} --journal-file {journal_file}`."
+        )
+    if incremental or state_file is not None:
+        create_url_state_recorder = IncrementalUrlStateRecorder if incremental else UrlStateRecorder
+        url_state_store = SqliteUrlStateStore(state_file or sidecar_file(output_file, STATE_FILE_SUFFIX))
+        page_recorders.append(create_url_state_recorder(url_state_store))
+    scrape_report = ScrapeReport(run_id, metrics_recorder, caching_content_fetcher, near_duplicates)
+    with parse_executor(parse_workers) as executor:
+        document_parser: DocumentParser = create_document_parser(parser_engine, extract_links=crawl)
+        page_scraper = scraping.create_page_scraper(content_fetcher, document_parser, executor, metrics_recorder)
+        storage = create_storage(output_format, output_file, incremental, is_resumed, metrics_recorder)
+        near_duplicate_filter = create_near_duplicate_filter(near_duplicates, similarity_threshold)
+        scrape_use_case = ScrapeSightCallWebsite(
+            page_scraper, storage, url_discovery, PageRecorders(page_recorders), near_duplicate_filter
+        )
+        summary = run_scrape(scrape_use_case, sitemap_index_urls_to_scrape(sitemap_index_urls, sites_file), max_urls)
+    scrape_report.finish(summary, output_file, report_file, prometheus_file)
+    finish_output(summary, output_format, output_file, boilerplate_threshold if strip_boilerplate else None)
+
+
+def exit_on_single_process_options(is_used_by_option: dict[str, bool]) -> None:
+    used_options: List[str] = [option for option, is_used in is_used_by_option.items() if is_used]
+    if used_options:
+        rich.print(f"[red]{', '.join(used_options)} cannot be combined with --workers.[/red]")
+        raise typer.Exit(code=1)
+
+
+def finish_output(
+    summary: ScrapeSummary, output_format: OutputFormat, output_file: Path, boilerplate_threshold: Optional[float]
+) -> None:
+    if summary.is_every_sitemap_index_failed:
+        raise typer.Exit(code=1)
+    if boilerplate_threshold is not None:
+        strip_boilerplate_in_place(output_format, output_file, boilerplate_threshold)
+
+
+def create_caching_content_fetcher(
+    http_content_fetcher: HttpContentFetcher, cache_file: Optional[Path], cache_size_mb: int
+) -> Optional[CachingContentFetcher]:
+    if cache_file is None:
+        return None
+    return CachingContentFetcher(
+        http_content_fetcher, SqliteHttpResponseCache(cache_file, cache_size_mb * BYTES_PER_MB)
+    )
+
+
+def with_archive(
+    content_fetcher: ContentFetcher, archive_file: Optional[Path], append_existing: bool
+) -> ContentFetcher:
+    if archive_file is None:
+        return content_fetcher
+    return ArchivingContentFetcher(content_fetcher, WarcResponseArchive(archive_file, append_existing=append_existing))
+
+
+def run_scrape(
+    scrape_use_case: ScrapeSightCallWebsite, sitemap_index_urls: List[str], max_urls: Optional[int]
+) -> ScrapeSummary:
+    try:
+        return asyncio.run(scrape_use_case.execute(sitemap_index_urls, print_progress("Scraped"), max_urls))
+    except UnknownRunError as error:
+        rich.print(f"[red]{error}[/red]")
+        raise typer.Exit(code=1)
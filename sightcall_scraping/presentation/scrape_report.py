@@ -0,0 +1,97 @@
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import rich
+
+from sightcall_scraping.application.recording.near_duplicate_filter import (
+    DroppingNearDuplicateFilter,
+    LinkingNearDuplicateFilter,
+    NearDuplicateFilter,
+)
+from sightcall_scraping.application.recording.near_duplicate_index import MinHashNearDuplicateIndex
+from sightcall_scraping.application.scrape_summary import ScrapeSummary
+from sightcall_scraping.infrastructure.caching_content_fetcher import CachingContentFetcher
+from sightcall_scraping.infrastructure.in_memory_metrics_recorder import InMemoryMetricsRecorder
+from sightcall_scraping.infrastructure.metrics_exporters import write_json_report, write_prometheus_textfile
+from sightcall_scraping.presentation.cli_options import NearDuplicateHandling
+from sightcall_scraping.presentation.cli_support import (
+    print_failed_sitemaps,
+    print_unreachable_sitemap_indexes,
+    run_report,
+)
+
+
+def create_near_duplicate_filter(
+    near_duplicates: NearDuplicateHandling, similarity_threshold: float
+) -> NearDuplicateFilter:
+    if near_duplicates == NearDuplicateHandling.DROP:
+        return DroppingNearDuplicateFilter(lambda: MinHashNearDuplicateIndex(similarity_threshold))
+    if near_duplicates == NearDuplicateHandling.LINK:
+        return LinkingNearDuplicateFilter(lambda: MinHashNearDuplicateIndex(similarity_threshold))
+    return NearDuplicateFilter()
+
+
+class ScrapeReport:
+    def __init__(
+        self,
+        run_id: str,
+        metrics_recorder: InMemoryMetricsRecorder,
+        caching_content_fetcher: Optional[CachingContentFetcher],
+        near_duplicates: NearDuplicateHandling,
+    ):
+        self._run_id = run_id
+        self._metrics_recorder = metrics_recorder
+        self._caching_content_fetcher = caching_content_fetcher
+        self._near_duplicates = near_duplicates
+        self._started_at = datetime.now(timezone.utc)
+
+    def finish(
+        self, summary: ScrapeSummary, output_file: Path, report_file: Path, prometheus_file: Optional[Path]
+    ) -> None:
+        finished_at = datetime.now(timezone.utc)
+        self._print_summary(summary, output_file)
+        self._print_cache_report()
+        report: dict[str, object] = {
+            "run_id": self._run_id,
+            **run_report(self._started_at, finished_at, summary),
+            **self._metrics_recorder.to_report(),
+        }
+        if self._caching_content_fetcher is not None:
+            cache_report = self._caching_content_fetcher.report
+            report["cache"] = {**asdict(cache_report), "hit_ratio": cache_report.hit_ratio}
+        write_json_report(report, report_file)
+        if prometheus_file is not None:
+            write_prometheus_textfile(self._metrics_recorder, prometheus_file)
+
+    def _print_summary(self, summary: ScrapeSummary, output_file: Path) -> None:
+        if summary.is_every_sitemap_index_failed:
+            print_unreachable_sitemap_indexes(summary)
+        else:
+            rich.print(f"Scraped {summary.scraped_document_count} documents to {output_file} successfully!")
+        print_failed_sitemaps(summary)
+        if summary.previously_completed_url_count:
+            rich.print(f"{summary.previously_completed_url_count} pages were already stored before resuming.")
+        if summary.crawled_url_count:
+            rich.print(f"Found {summary.crawled_url_count} pages missing from the sitemaps by following links.")
+        if summary.duplicate_url_count:
+            rich.print(f"Suppressed {summary.duplicate_url_count} duplicate URLs.")
+        if summary.near_duplicate_document_count:
+            action: str = "Dropped" if self._near_duplicates == NearDuplicateHandling.DROP else "Linked"
+            rich.print(f"{action} {summary.near_duplicate_document_count} near-duplicate documents.")
+        if summary.unchanged_url_count:
+            rich.print(f"Skipped {summary.unchanged_url_count} unchanged URLs.")
+        if summary.skipped_url_count:
+            rich.print(f"Skipped {summary.skipped_url_count} pages that were not HTML or over the size cap.")
+        if summary.failed_urls:
+            rich.print(f"[yellow]{summary.failed_url_count} URLs could not be scraped.[/yellow]")
+
+    def _print_cache_report(self) -> None:
+        if self._caching_content_fetcher is None:
+            return
+        cache_report = self._caching_content_fetcher.report
+        rich.print(
+            f"HTTP cache: {cache_report.hit_count} hits, {cache_report.miss_count} misses "
+            f"({cache_report.hit_ratio:.0%} hit ratio)."
+        )
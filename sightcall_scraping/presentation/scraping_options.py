@@ -0,0 +1,102 @@
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+from sightcall_scraping.application.page_scraping.concurrency_limits import MAX_CONCURRENT_PARSES, ConcurrencyLimits
+from sightcall_scraping.application.page_scraping.page_scraper import PageScraper
+from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.domain.ports.document_parser import DocumentParser
+from sightcall_scraping.domain.ports.metrics_recorder import MetricsRecorder
+from sightcall_scraping.infrastructure.document_parsers import ParserEngine
+from sightcall_scraping.infrastructure.http_content_fetcher import HttpContentFetcher
+from sightcall_scraping.presentation.cli_options import BYTES_PER_MB
+
+
+@dataclass(frozen=True)
+class HttpOptions:
+    max_connections: int
+    max_connections_per_host: int
+    http2: bool
+    timeout: float
+    max_page_size_mb: float
+
+    def create_content_fetcher(self, metrics_recorder: MetricsRecorder) -> HttpContentFetcher:
+        return HttpContentFetcher(
+            max_connections=self.max_connections,
+            max_connections_per_host=self.max_connections_per_host,
+            http2=self.http2,
+            timeout_seconds=self.timeout,
+            max_body_bytes=int(self.max_page_size_mb * BYTES_PER_MB),
+            metrics_recorder=metrics_recorder,
+        )
+
+    def to_arguments(self) -> List[str]:
+        return [
+            "--max-connections",
+            str(self.max_connections),
+            "--max-connections-per-host",
+            str(self.max_connections_per_host),
+            "--timeout",
+            str(self.timeout),
+            "--max-page-size-mb",
+            str(self.max_page_size_mb),
+            "--http2" if self.http2 else "--no-http2",
+        ]
+
+
+@dataclass(frozen=True)
+class ScrapingOptions:
+    http: HttpOptions
+    limits: ConcurrencyLimits
+    parser_engine: ParserEngine
+    parse_workers: int
+
+    def create_page_scraper(
+        self,
+        content_fetcher: ContentFetcher,
+        document_parser: DocumentParser,
+        parse_executor: Optional[Executor],
+        metrics_recorder: MetricsRecorder,
+    ) -> PageScraper:
+        return PageScraper(content_fetcher, document_parser, self.limits, parse_executor, metrics_recorder)
+
+    def to_arguments(self) -> List[str]:
+        arguments: List[str] = [
+            *self.http.to_arguments(),
+            "--min-concurrency",
+            str(self.limits.min_concurrent_requests),
+            "--max-concurrency",
+            str(self.limits.max_concurrent_requests),
+            "--parser",
+            self.parser_engine.value,
+            "--parse-workers",
+            str(self.parse_workers),
+        ]
+        if self.limits.max_concurrent_requests_per_host is not None:
+            arguments += ["--max-concurrency-per-host", str(self.limits.max_concurrent_requests_per_host)]
+        if self.limits.max_requests_per_second is not None:
+            arguments += ["--max-rps", str(self.limits.max_requests_per_second)]
+        return arguments
+
+
+def concurrency_limits(
+    max_concurrency: int,
+    min_concurrency: int,
+    max_concurrency_per_host: Optional[int],
+    max_rps: Optional[float],
+    parse_workers: int,
+) -> ConcurrencyLimits:
+    return ConcurrencyLimits(
+        max_concurrency, min_concurrency, max_concurrency_per_host, max_rps, parse_workers or MAX_CONCURRENT_PARSES
+    )
+
+
+@contextmanager
+def parse_executor(parse_workers: int) -> Iterator[Optional[Executor]]:
+    if parse_workers <= 0:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        yield executor
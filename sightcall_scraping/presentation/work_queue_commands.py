@@ -0,0 +1,170 @@
+import asyncio
+import os
+import socket
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+import rich
+import typer
+
+from sightcall_scraping.application.discovery.seen_url_index import DEFAULT_BLOOM_FILTER_CAPACITY
+from sightcall_scraping.application.discovery.sitemap_url_discovery import SitemapUrlDiscovery
+from sightcall_scraping.application.page_scraping.concurrency_limits import (
+    MAX_CONCURRENT_REQUESTS,
+    MIN_CONCURRENT_REQUESTS,
+)
+from sightcall_scraping.application.work_queue.enqueue_sitemap_urls import EnqueueSitemapUrls
+from sightcall_scraping.application.work_queue.scrape_queued_pages import ScrapeQueuedPages
+from sightcall_scraping.infrastructure.document_parsers import ParserEngine, create_document_parser
+from sightcall_scraping.infrastructure.http_content_fetcher import (
+    DEFAULT_MAX_BODY_BYTES,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_TIMEOUT_SECONDS,
+)
+from sightcall_scraping.infrastructure.in_memory_metrics_recorder import InMemoryMetricsRecorder
+from sightcall_scraping.infrastructure.json_lines_scraped_document_storage import JsonLinesScrapedDocumentStorage
+from sightcall_scraping.infrastructure.metrics_exporters import write_json_report
+from sightcall_scraping.infrastructure.sqlite_work_queue import DEFAULT_LEASE_SECONDS, SqliteWorkQueue
+from sightcall_scraping.presentation.cli_options import (
+    BYTES_PER_MB,
+    DEFAULT_QUEUE_FILE,
+    REPORT_FILE_SUFFIX,
+    BloomCapacityOption,
+    DedupIndex,
+    DedupOption,
+    Http2Option,
+    MaxConcurrencyOption,
+    MaxConcurrencyPerHostOption,
+    MaxConnectionsOption,
+    MaxConnectionsPerHostOption,
+    MaxPageSizeMbOption,
+    MaxRpsOption,
+    MaxUrlsOption,
+    MinConcurrencyOption,
+    OutputFileOption,
+    OutputFormat,
+    OutputFormatOption,
+    ParserOption,
+    ParseWorkersOption,
+    QueueFileOption,
+    SitemapIndexUrlsOption,
+    SitesFileOption,
+    TimeoutOption,
+)
+from sightcall_scraping.presentation.cli_support import (
+    print_merge_report,
+    run_report,
+    seen_url_index_factory,
+    sitemap_index_urls_to_scrape,
+)
+from sightcall_scraping.presentation.document_files import default_output_file, merge_scraped_documents, sidecar_file
+from sightcall_scraping.presentation.local_workers import COORDINATOR_ID, print_discovery_summary
+from sightcall_scraping.presentation.scraping_options import (
+    HttpOptions,
+    ScrapingOptions,
+    concurrency_limits,
+    parse_executor,
+)
+
+
+def enqueue(
+    sitemap_index_urls: SitemapIndexUrlsOption = None,
+    sites_file: SitesFileOption = None,
+    max_urls: MaxUrlsOption = None,
+    queue_file: QueueFileOption = Path(DEFAULT_QUEUE_FILE),
+    max_connections: MaxConnectionsOption = DEFAULT_MAX_CONNECTIONS,
+    max_connections_per_host: MaxConnectionsPerHostOption = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    http2: Http2Option = False,
+    timeout: TimeoutOption = DEFAULT_TIMEOUT_SECONDS,
+    max_page_size_mb: MaxPageSizeMbOption = DEFAULT_MAX_BODY_BYTES / BYTES_PER_MB,
+    dedup: DedupOption = DedupIndex.EXACT,
+    bloom_capacity: BloomCapacityOption = DEFAULT_BLOOM_FILTER_CAPACITY,
+    report_file: Optional[Path] = typer.Option(
+        None,
+        help=f"JSON file the discovery summary and metrics are written to. Defaults to the queue file plus "
+        f"{REPORT_FILE_SUFFIX}.",
+    ),
+) -> None:
+    report_file = report_file or sidecar_file(queue_file, REPORT_FILE_SUFFIX)
+    metrics_recorder = InMemoryMetricsRecorder()
+    http = HttpOptions(max_connections, max_connections_per_host, http2, timeout, max_page_size_mb)
+    url_discovery = SitemapUrlDiscovery(
+        http.create_content_fetcher(metrics_recorder),
+        seen_url_index_factory(dedup, bloom_capacity),
+        metrics_recorder=metrics_recorder,
+    )
+    work_queue = SqliteWorkQueue(queue_file, COORDINATOR_ID, clear_existing=True)
+    started_at = datetime.now(timezone.utc)
+    summary = asyncio.run(
+        EnqueueSitemapUrls(url_discovery, work_queue).execute(
+            sitemap_index_urls_to_scrape(sitemap_index_urls, sites_file), max_urls
+        )
+    )
+    write_json_report(
+        {**run_report(started_at, datetime.now(timezone.utc), summary), **metrics_recorder.to_report()}, report_file
+    )
+    if not summary.is_every_sitemap_index_failed:
+        rich.print(f"Queued the sitemap pages to {queue_file}.")
+    print_discovery_summary(summary)
+    if summary.is_every_sitemap_index_failed:
+        raise typer.Exit(code=1)
+
+
+def worker(
+    output_file: Path = typer.Option(..., help="JSON lines file this worker appends its documents to."),
+    queue_file: Path = typer.Option(
+        DEFAULT_QUEUE_FILE, help="Work queue filled by `enqueue`, or by `scrape --workers` given a --queue-file."
+    ),
+    worker_id: Optional[str] = typer.Option(
+        None, help="Name the pages this worker claims are leased under. Defaults to the host name and process id."
+    ),
+    lease_seconds: float = typer.Option(
+        DEFAULT_LEASE_SECONDS, help="Seconds after which the pages of a worker that died go to the other workers."
+    ),
+    max_connections: MaxConnectionsOption = DEFAULT_MAX_CONNECTIONS,
+    max_connections_per_host: MaxConnectionsPerHostOption = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    min_concurrency: MinConcurrencyOption = MIN_CONCURRENT_REQUESTS,
+    max_concurrency: MaxConcurrencyOption = MAX_CONCURRENT_REQUESTS,
+    max_concurrency_per_host: MaxConcurrencyPerHostOption = None,
+    max_rps: MaxRpsOption = None,
+    http2: Http2Option = False,
+    timeout: TimeoutOption = DEFAULT_TIMEOUT_SECONDS,
+    max_page_size_mb: MaxPageSizeMbOption = DEFAULT_MAX_BODY_BYTES / BYTES_PER_MB,
+    parser_engine: ParserOption = ParserEngine.BEAUTIFULSOUP,
+    parse_workers: ParseWorkersOption = 0,
+) -> None:
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    metrics_recorder = InMemoryMetricsRecorder()
+    scraping = ScrapingOptions(
+        HttpOptions(max_connections, max_connections_per_host, http2, timeout, max_page_size_mb),
+        concurrency_limits(max_concurrency, min_concurrency, max_concurrency_per_host, max_rps, parse_workers),
+        parser_engine,
+        parse_workers,
+    )
+    storage = JsonLinesScrapedDocumentStorage(output_file, append_existing=True, metrics_recorder=metrics_recorder)
+    with parse_executor(parse_workers) as executor:
+        page_scraper = scraping.create_page_scraper(
+            scraping.http.create_content_fetcher(metrics_recorder),
+            create_document_parser(parser_engine),
+            executor,
+            metrics_recorder,
+        )
+        worker_use_case = ScrapeQueuedPages(
+            page_scraper, storage, SqliteWorkQueue(queue_file, worker_id, lease_seconds)
+        )
+        summary = asyncio.run(worker_use_case.execute(lambda _: None))
+    rich.print(f"Worker {worker_id} scraped {summary.scraped_document_count} documents to {output_file}.")
+    if summary.failed_urls:
+        rich.print(f"[yellow]Worker {worker_id}: {summary.failed_url_count} URLs could not be scraped.[/yellow]")
+
+
+def merge(
+    input_files: List[Path] = typer.Argument(..., help="JSON lines files written by `worker`."),
+    output_file: OutputFileOption = None,
+    output_format: OutputFormatOption = OutputFormat.JSON,
+) -> None:
+    output_file = output_file or default_output_file(output_format)
+    report = merge_scraped_documents(input_files, output_format, output_file)
+    print_merge_report(report, output_file)
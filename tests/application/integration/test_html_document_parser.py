@@ -15,3 +15,11 @@ def test_html_document_parser_extracts_rag_fields():
     assert doc.url == "https://test.com"
     assert doc.title == "Test Page"
     assert doc.content == "Hello World!"
+
+
+def test_html_document_parser_decodes_bytes_with_the_declared_encoding():
+    body = "<html><head><title>Café</title></head><body>Déjà vu</body></html>".encode("latin-1")
+
+    doc = HtmlDocumentParser().to_scraped_document_from_bytes("https://test.com", body, "iso8859-1")
+
+    assert (doc.title, doc.content) == ("Café", "Déjà vu")
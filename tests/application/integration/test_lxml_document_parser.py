@@ -0,0 +1,104 @@
+import pickle
+
+from benchmarks.compare_document_parsers import compare_document_parsers, load_corpus
+from sightcall_scraping.infrastructure.html_document_parser import HtmlDocumentParser
+from sightcall_scraping.infrastructure.lxml_document_parser import LxmlDocumentParser
+
+CORPUS: list[tuple[str, str]] = [
+    (
+        "https://test.com/nested",
+        "<html><head><title>Test Page</title></head><body><div>Hello <b>World</b>!</div></body></html>",
+    ),
+    (
+        "https://test.com/non-text",
+        """<html><head><title> Spaced &amp; escaped </title><style>p { color: red; }</style></head>
+        <body><!-- a comment --><nav>Menu</nav><script>var x = 1;</script>after script
+        <template>template text</template><p>Caf&eacute;&nbsp;menu , with punctuation ?</p><br/>end</body></html>""",
+    ),
+    ("https://test.com/no-body", "<html><title>Only a title</title></html>"),
+    ("https://test.com/empty", ""),
+    (
+        "https://test.com/blog/links",
+        """<html><body><a href="/about">About</a> <a href="post#comments">Post</a> <a href="#top">Top</a>
+        <a href="mailto:team@test.com">Mail</a> <a href="https://other.com/page">Other</a> <a>No href</a>
+        <a href="/about">About again</a></body></html>""",
+    ),
+    (
+        "https://test.com/xml-declaration",
+        "<?xml version='1.0' encoding='utf-8'?><html><body><p>Declared</p></body></html>",
+    ),
+]
+
+
+def test_lxml_document_parser_extracts_rag_fields():
+    doc = LxmlDocumentParser().to_scraped_document("https://test.com", CORPUS[0][1])
+    assert doc.url == "https://test.com"
+    assert doc.title == "Test Page"
+    assert doc.content == "Hello World!"
+
+
+def test_lxml_document_parser_extracts_absolute_page_links():
+    url = "https://test.com/blog/links"
+
+    doc = LxmlDocumentParser(extract_links=True).to_scraped_document(url, dict(CORPUS)[url])
+
+    assert doc.links == (
+        "https://test.com/about",
+        "https://test.com/blog/post",
+        "https://test.com/blog/links",
+        "https://other.com/page",
+    )
+
+
+def test_lxml_document_parser_only_extracts_links_when_asked_to():
+    url = "https://test.com/blog/links"
+
+    doc = LxmlDocumentParser().to_scraped_document(url, dict(CORPUS)[url])
+
+    assert doc.links == ()
+
+
+def test_lxml_document_parser_matches_html_document_parser():
+    comparison = compare_document_parsers(
+        HtmlDocumentParser(extract_links=True), LxmlDocumentParser(extract_links=True), CORPUS
+    )
+
+    assert comparison.reference.document_count == len(CORPUS)
+    assert comparison.differing_urls == []
+
+
+def test_lxml_document_parser_matches_html_document_parser_on_raw_bytes():
+    for encoding in ("utf-8", "cp1252", "utf-16"):
+        for url, html in CORPUS:
+            body = html.encode(encoding)
+
+            reference = HtmlDocumentParser(extract_links=True).to_scraped_document_from_bytes(url, body, encoding)
+            candidate = LxmlDocumentParser(extract_links=True).to_scraped_document_from_bytes(url, body, encoding)
+
+            assert (candidate.title, candidate.content, candidate.links) == (
+                reference.title,
+                reference.content,
+                reference.links,
+            ), (encoding, url)
+
+
+def test_comparison_reports_pages_whose_output_differs(tmp_path):
+    (tmp_path / "empty-body.html").write_text("<html><body></body></html>")
+    (tmp_path / "with-text.html").write_text("<html><body>Body</body></html>")
+
+    class TitleOnlyParser(HtmlDocumentParser):
+        def to_scraped_document(self, url, html):
+            document = super().to_scraped_document(url, html)
+            return type(document)(url=url, title=document.title, content="")
+
+    comparison = compare_document_parsers(HtmlDocumentParser(), TitleOnlyParser(), load_corpus(tmp_path))
+
+    assert comparison.differing_urls == ["with-text.html"]
+
+
+def test_lxml_document_parser_can_be_sent_to_a_parse_worker_process():
+    parser = pickle.loads(pickle.dumps(LxmlDocumentParser(extract_links=True)))
+
+    url = "https://test.com/blog/links"
+    assert parser.to_scraped_document("https://test.com", CORPUS[0][1]).content == "Hello World!"
+    assert parser.to_scraped_document(url, dict(CORPUS)[url]).links[0] == "https://test.com/about"
@@ -0,0 +1,37 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from sightcall_scraping.application.page_scraping.page_scraper import PageScraper
+from sightcall_scraping.application.scrape_sightcall_website import ScrapeSightCallWebsite
+from sightcall_scraping.infrastructure.html_document_parser import HtmlDocumentParser
+
+
+@pytest.mark.asyncio
+async def test_should_parse_html_documents_in_a_process_pool(
+    fake_content_fetcher,
+    fake_scraped_document_storage,
+    sitemap_index_xml,
+    post_sitemap_xml,
+    page_sitemap_xml,
+    html_responses,
+):
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml,
+        "https://sightcall.com/post-sitemap.xml": post_sitemap_xml,
+        "https://sightcall.com/page-sitemap.xml": page_sitemap_xml,
+        **html_responses,
+    }
+    storage = fake_scraped_document_storage()
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as parse_executor:
+        use_case = ScrapeSightCallWebsite(
+            PageScraper(fake_content_fetcher(responses), HtmlDocumentParser(), None, parse_executor), storage
+        )
+        summary = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+
+    assert summary.scraped_document_count == 2
+    assert sorted((document.title, document.content) for document in storage.saved_documents) == [
+        ("About", "About Content"),
+        ("Blog", "Blog Content"),
+    ]
@@ -0,0 +1,23 @@
+from benchmarks.scrape_benchmark import run_scrape_benchmark
+from benchmarks.synthetic_site import SyntheticSite, SyntheticSiteConfig, render_page
+
+
+def test_scrape_benchmark_scrapes_every_page_of_the_synthetic_site():
+    config = SyntheticSiteConfig(sitemap_count=2, page_count=7, page_size_bytes=2_000, latency_ms=0, jitter_ms=0)
+    with SyntheticSite(config) as site:
+        result = run_scrape_benchmark(site, max_concurrency=3)
+
+    assert result.scraped_document_count == 7
+    assert result.failed_url_count == 0
+    assert result.pages_per_second > 0
+    assert 0 < result.fetch_latency_ms.p50 <= result.fetch_latency_ms.p95 <= result.fetch_latency_ms.p99
+    assert 0 < result.parse_latency_ms.p50 <= result.parse_latency_ms.p99
+    assert result.peak_rss_mb > 0
+
+
+def test_synthetic_site_generates_the_same_pages_for_the_same_seed():
+    config = SyntheticSiteConfig(page_size_bytes=1_000, seed=42)
+
+    assert render_page(config, 3) == render_page(SyntheticSiteConfig(page_size_bytes=1_000, seed=42), 3)
+    assert render_page(config, 3) != render_page(config, 4)
+    assert len(render_page(config, 3)) >= 1_000
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from sightcall_scraping.application.discovery.link_crawl import LinkCrawl
+from sightcall_scraping.domain.models.url import Url
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def values_of(urls: list[Url]) -> list[str]:
+    return [url.value for url in urls]
+
+
+async def seeded_crawl(frontier, seed_urls: list[str], **options) -> LinkCrawl:
+    crawl = LinkCrawl(frontier, **options)
+    for url in seed_urls:
+        await crawl.add_seed(Url(url))
+    await crawl.finish_seeding()
+    return crawl
+
+
+@pytest.mark.asyncio
+async def test_should_hand_out_same_site_links_of_crawled_pages(fake_crawl_frontier):
+    # Given: a crawl seeded with the home page
+    crawl = await seeded_crawl(fake_crawl_frontier(), ["https://sightcall.com/"])
+    home_page = (await crawl.next_urls())[0]
+
+    # When: the home page links to a new page, itself, and another site
+    added_count = await crawl.complete(
+        home_page, ["https://sightcall.com/about", "https://sightcall.com/", "https://other.com/page"]
+    )
+
+    # Then: only the new same-site page is crawled next, after which the crawl is over
+    assert added_count == 1
+    assert values_of(await crawl.next_urls()) == ["https://sightcall.com/about"]
+    await crawl.complete(Url("https://sightcall.com/about"), [])
+    assert await crawl.next_urls() == []
+
+
+@pytest.mark.asyncio
+async def test_should_not_follow_links_deeper_than_max_depth(fake_crawl_frontier):
+    # Given: a crawl one link deep at most
+    crawl = await seeded_crawl(fake_crawl_frontier(), ["https://sightcall.com/"], max_depth=1)
+    home_page = (await crawl.next_urls())[0]
+    await crawl.complete(home_page, ["https://sightcall.com/level-1"])
+    level_1_page = (await crawl.next_urls())[0]
+
+    # When: the page one link away links further
+    added_count = await crawl.complete(level_1_page, ["https://sightcall.com/level-2"])
+
+    # Then: that link is not followed
+    assert added_count == 0
+    assert await crawl.next_urls() == []
+
+
+@pytest.mark.asyncio
+async def test_should_stop_handing_out_pages_once_max_pages_is_reached(fake_crawl_frontier):
+    crawl = await seeded_crawl(
+        fake_crawl_frontier(), [f"https://sightcall.com/page-{index}" for index in range(5)], max_pages=3
+    )
+
+    assert len(await crawl.next_urls()) == 3
+    assert await crawl.next_urls() == []
+
+
+@pytest.mark.asyncio
+async def test_should_stop_handing_out_pages_once_the_time_budget_is_spent(fake_crawl_frontier):
+    # Given: a crawl with a minute of time budget, half of which is spent
+    clock = FakeClock()
+    crawl = LinkCrawl(fake_crawl_frontier(), time_budget_seconds=60, clock=clock)
+    await crawl.add_seed(Url("https://sightcall.com/"))
+    await crawl.finish_seeding()
+    clock.now = 30
+    home_page = (await crawl.next_urls())[0]
+    await crawl.complete(home_page, ["https://sightcall.com/about"])
+
+    # When: the budget runs out with pages left in the frontier
+    clock.now = 60
+
+    # Then: the crawl is over
+    assert await crawl.next_urls() == []
+
+
+@pytest.mark.asyncio
+async def test_should_wait_for_pages_in_flight_before_ending_the_crawl(fake_crawl_frontier):
+    # Given: the only page of the crawl being scraped
+    crawl = await seeded_crawl(fake_crawl_frontier(), ["https://sightcall.com/"])
+    home_page = (await crawl.next_urls())[0]
+
+    # When: asking for more pages before it is complete
+    next_urls = asyncio.create_task(crawl.next_urls())
+    await asyncio.sleep(0)
+    is_waiting = not next_urls.done()
+    await crawl.complete(home_page, ["https://sightcall.com/about"])
+
+    # Then: the crawl waited, then handed out the link the page had
+    assert is_waiting
+    assert values_of(await asyncio.wait_for(next_urls, 1)) == ["https://sightcall.com/about"]
@@ -0,0 +1,25 @@
+import pytest
+
+from sightcall_scraping.application.discovery.seen_url_index import BloomFilterSeenUrlIndex, ExactSeenUrlIndex
+from sightcall_scraping.domain.models.url import Url
+
+
+@pytest.mark.parametrize("index", [ExactSeenUrlIndex(), BloomFilterSeenUrlIndex(capacity=1_000)])
+def test_seen_url_index_only_accepts_a_page_once(index):
+    assert index.add(Url("https://sightcall.com/blog/"))
+    assert not index.add(Url("https://sightcall.com/blog"))
+    assert index.add(Url("https://sightcall.com/about"))
+
+
+def test_bloom_filter_stays_close_to_its_false_positive_rate_at_capacity():
+    # Given: a Bloom filter filled up to its capacity
+    index = BloomFilterSeenUrlIndex(capacity=10_000, false_positive_rate=0.01)
+    for i in range(10_000):
+        index.add(Url(f"https://sightcall.com/page/{i}"))
+
+    # When: adding a thousand URLs it has never seen
+    wrongly_rejected = sum(not index.add(Url(f"https://sightcall.com/other/{i}")) for i in range(1_000))
+
+    # Then: about 1% of them are mistaken for duplicates, in about 12 KB
+    assert wrongly_rejected < 30
+    assert index.size_bytes < 12_000
@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from sightcall_scraping.application.page_scraping.adaptive_concurrency_limiter import AdaptiveConcurrencyLimiter
+from sightcall_scraping.domain.errors import SkippedResponseError, ThrottledError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+async def succeed(limiter: AdaptiveConcurrencyLimiter) -> None:
+    async with limiter.slot():
+        pass
+
+
+async def throttle(limiter: AdaptiveConcurrencyLimiter, retry_after_seconds=None) -> None:
+    with pytest.raises(ThrottledError):
+        async with limiter.slot():
+            raise ThrottledError("https://sightcall.com/page", retry_after_seconds)
+
+
+@pytest.mark.asyncio
+async def test_should_raise_concurrency_up_to_max_while_requests_succeed():
+    # Given: a limiter starting at its minimum
+    limiter = AdaptiveConcurrencyLimiter(min_concurrency=1, max_concurrency=10, clock=FakeClock())
+
+    # When: many requests succeed quickly
+    for _ in range(50):
+        await succeed(limiter)
+
+    # Then: concurrency grew to the maximum, and no further
+    assert limiter.limit == 10
+
+
+@pytest.mark.asyncio
+async def test_should_halve_concurrency_once_per_burst_of_throttled_requests():
+    # Given: a limiter that ramped up to its maximum
+    limiter = AdaptiveConcurrencyLimiter(min_concurrency=1, max_concurrency=16, clock=FakeClock())
+    for _ in range(50):
+        await succeed(limiter)
+
+    # When: several requests in flight together are throttled
+    async def throttled_request(started: asyncio.Event, release: asyncio.Event) -> None:
+        with pytest.raises(ThrottledError):
+            async with limiter.slot():
+                started.set()
+                await release.wait()
+                raise ThrottledError("https://sightcall.com/page")
+
+    release = asyncio.Event()
+    started_events = [asyncio.Event() for _ in range(4)]
+    requests = [asyncio.create_task(throttled_request(started, release)) for started in started_events]
+    await asyncio.gather(*(started.wait() for started in started_events))
+    release.set()
+    await asyncio.gather(*requests)
+
+    # Then: the limit was cut once, not once per request
+    assert limiter.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_should_never_go_below_min_concurrency():
+    limiter = AdaptiveConcurrencyLimiter(min_concurrency=2, max_concurrency=4, clock=FakeClock())
+
+    for _ in range(5):
+        await throttle(limiter)
+
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_should_pause_requests_until_retry_after_has_elapsed(monkeypatch):
+    # Given: a throttled request asking to retry in 30 seconds
+    clock = FakeClock()
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+    limiter = AdaptiveConcurrencyLimiter(min_concurrency=1, max_concurrency=4, clock=clock)
+    await throttle(limiter, retry_after_seconds=30)
+
+    # When: sending the next request
+    await succeed(limiter)
+
+    # Then: it waited for the server to be ready again
+    assert clock.sleeps == [30]
+
+
+@pytest.mark.asyncio
+async def test_should_space_requests_to_respect_requests_per_second_cap(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+    limiter = AdaptiveConcurrencyLimiter(min_concurrency=1, max_concurrency=4, max_requests_per_second=4, clock=clock)
+
+    for _ in range(3):
+        await succeed(limiter)
+
+    assert clock.sleeps == [0.25, 0.25]
+
+
+@pytest.mark.asyncio
+async def test_should_stop_growing_when_latency_degrades():
+    # Given: a limiter whose first windows were fast
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(min_concurrency=1, max_concurrency=100, clock=clock)
+
+    async def request_taking(seconds: float) -> None:
+        async with limiter.slot():
+            clock.now += seconds
+
+    await request_taking(0.1)
+    await throttle(limiter)
+    for _ in range(3):
+        await request_taking(0.1)
+    limit_before_slowdown = limiter.limit
+
+    # When: the server slows down a lot
+    for _ in range(20):
+        await request_taking(1.0)
+
+    # Then: concurrency is held where it was
+    assert limiter.limit == limit_before_slowdown
+
+
+@pytest.mark.asyncio
+async def test_should_count_skipped_responses_as_healthy():
+    # Given: a limiter starting at its minimum
+    limiter = AdaptiveConcurrencyLimiter(min_concurrency=1, max_concurrency=8, clock=FakeClock())
+
+    # When: every response is skipped as not worth scraping
+    for _ in range(20):
+        with pytest.raises(SkippedResponseError):
+            async with limiter.slot():
+                raise SkippedResponseError("https://sightcall.com/file.pdf", "content_type", "not HTML")
+
+    # Then: the server is not seen as failing, and concurrency grows as usual
+    assert limiter.limit == 8
@@ -0,0 +1,53 @@
+import pytest
+
+from sightcall_scraping.application.page_scraping.circuit_breaker import CircuitBreaker
+from sightcall_scraping.domain.errors import CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_should_open_circuit_of_a_host_after_consecutive_failures():
+    # Given: a breaker opening after three failures
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, open_seconds=30, clock=clock)
+
+    # When: a host fails three times in a row
+    for _ in range(3):
+        breaker.record_failure("https://down.test/page")
+
+    # Then: the host is paused, other hosts are not
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.raise_if_open("https://down.test/other")
+    assert error.value.remaining_open_seconds == 30
+    breaker.raise_if_open("https://up.test/page")
+
+
+def test_should_let_a_probe_through_once_pause_is_over_and_close_on_success():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, open_seconds=30, clock=clock)
+    breaker.record_failure("https://down.test/page")
+
+    clock.now = 30
+    breaker.raise_if_open("https://down.test/page")
+    breaker.record_success("https://down.test/page")
+    breaker.record_failure("https://down.test/page")
+
+    assert breaker.remaining_open_seconds("https://down.test/page") == 30
+
+
+def test_should_reopen_circuit_when_probe_fails():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, open_seconds=30, clock=clock)
+    breaker.record_failure("https://down.test/page")
+    breaker.record_failure("https://down.test/page")
+
+    clock.now = 30
+    breaker.record_failure("https://down.test/page")
+
+    assert breaker.remaining_open_seconds("https://down.test/page") == 30
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from sightcall_scraping.application.page_scraping.host_scheduler import HostScheduler
+from sightcall_scraping.domain.models.url import Url
+
+
+async def hold_slots(scheduler: HostScheduler, urls: list[str]) -> list[str]:
+    # Starts one request per URL and returns the URLs that got a slot, all of them being held.
+    granted_urls: list[str] = []
+    release = asyncio.Event()
+
+    async def request(url: str) -> None:
+        async with scheduler.slot(Url(url)):
+            granted_urls.append(url)
+            await release.wait()
+
+    requests = [asyncio.create_task(request(url)) for url in urls]
+    for _ in range(10):
+        await asyncio.sleep(0)
+    snapshot = list(granted_urls)
+    release.set()
+    await asyncio.gather(*requests)
+    return snapshot
+
+
+@pytest.mark.asyncio
+async def test_should_limit_concurrency_of_each_host_separately():
+    # Given: a large global budget and two requests per host at most
+    scheduler = HostScheduler(
+        max_concurrent_requests=10, min_concurrent_requests_per_host=2, max_concurrent_requests_per_host=2
+    )
+
+    # When: four requests are made to each of two hosts at once
+    urls = [f"https://{host}/page-{index}" for host in ("sightcall.com", "example.com") for index in range(4)]
+    granted_urls = await hold_slots(scheduler, urls)
+
+    # Then: each host got its two slots, without waiting on the other
+    assert sorted(granted_urls) == sorted(urls[:2] + urls[4:6])
+    assert scheduler.hosts == ["sightcall.com", "example.com"]
+
+
+@pytest.mark.asyncio
+async def test_should_share_the_global_budget_between_hosts():
+    # Given: a global budget smaller than the sum of the per-host limits
+    scheduler = HostScheduler(
+        max_concurrent_requests=3, min_concurrent_requests_per_host=2, max_concurrent_requests_per_host=2
+    )
+
+    # When: requests are made to three hosts at once
+    urls = [f"https://host-{host}.com/page-{index}" for host in range(3) for index in range(2)]
+    granted_urls = await hold_slots(scheduler, urls)
+
+    # Then: no more requests than the global budget are in flight
+    assert len(granted_urls) == 3
+
+
+@pytest.mark.asyncio
+async def test_should_not_hold_up_other_hosts_while_one_waits_for_its_request_rate():
+    # Given: a scheduler allowing one request per minute to each host
+    scheduler = HostScheduler(
+        max_concurrent_requests=1,
+        min_concurrent_requests_per_host=1,
+        max_concurrent_requests_per_host=1,
+        max_requests_per_second_per_host=1 / 60,
+    )
+    async with scheduler.slot(Url("https://sightcall.com/first")):
+        pass
+
+    # When: a second request to that host waits for its turn while another host is requested
+    waiting_request = asyncio.create_task(hold_slots(scheduler, ["https://sightcall.com/second"]))
+    await asyncio.sleep(0)
+    granted_urls = await asyncio.wait_for(hold_slots(scheduler, ["https://example.com/page"]), 1)
+    waiting_request.cancel()
+    await asyncio.gather(waiting_request, return_exceptions=True)
+
+    # Then: the other host did not wait behind it, even with a global budget of one
+    assert granted_urls == ["https://example.com/page"]
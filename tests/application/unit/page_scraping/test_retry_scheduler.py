@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from sightcall_scraping.application.page_scraping.retry_scheduler import RetryScheduler
+
+
+@pytest.mark.asyncio
+async def test_should_release_items_in_due_order():
+    # Given: retries scheduled out of order
+    scheduler: RetryScheduler[str] = RetryScheduler()
+    scheduler.schedule("late", 0.03)
+    scheduler.schedule("early", 0.01)
+
+    # When: waiting for them
+    released = [await scheduler.next_due(), await scheduler.next_due()]
+
+    # Then: the earliest comes first
+    assert released == ["early", "late"]
+    assert scheduler.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_should_wake_up_for_an_earlier_retry_scheduled_while_waiting():
+    scheduler: RetryScheduler[str] = RetryScheduler()
+    scheduler.schedule("late", 10)
+    next_due = asyncio.create_task(scheduler.next_due())
+    await asyncio.sleep(0)
+
+    scheduler.schedule("early", 0)
+
+    assert await asyncio.wait_for(next_due, timeout=1) == "early"
+    assert scheduler.pending_count == 1
@@ -0,0 +1,49 @@
+from sightcall_scraping.application.recording.near_duplicate_index import MinHashNearDuplicateIndex
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+
+ARTICLE = " ".join(
+    f"Remote video assistance sentence number {index} explains how technicians solve issue {index * 7}."
+    for index in range(60)
+)
+
+
+def document(url: str, content: str) -> ScrapedDocument:
+    return ScrapedDocument(url=url, title="Title", content=content)
+
+
+def test_should_link_a_near_identical_document_to_the_first_one_seen():
+    # Given an indexed article
+    index = MinHashNearDuplicateIndex(similarity_threshold=0.8)
+    assert index.find_or_add(document("https://sightcall.com/blog/article", ARTICLE)) is None
+
+    # When a localized variant differing by a few words comes in
+    variant = ARTICLE.replace("sentence number 3 ", "phrase numéro 3 ")
+
+    # Then it is reported as a near-duplicate of the article
+    assert index.find_or_add(document("https://sightcall.com/fr/blog/article", variant)) == (
+        "https://sightcall.com/blog/article"
+    )
+
+
+def test_should_not_link_unrelated_documents():
+    # Given many unrelated documents
+    index = MinHashNearDuplicateIndex()
+    documents = [
+        document(f"https://sightcall.com/{topic}", f"{topic} " * 10 + ARTICLE.replace("technicians", topic))
+        for topic in ("insurance", "telecom", "healthcare", "utilities", "manufacturing")
+    ]
+    unrelated = document("https://sightcall.com/about", "SightCall was founded to make video support simple.")
+
+    # When indexing them
+    # Then none is a near-duplicate of another
+    assert [index.find_or_add(each) for each in [*documents, unrelated]] == [None] * (len(documents) + 1)
+
+
+def test_should_ignore_documents_without_content():
+    # Given an empty document already seen
+    index = MinHashNearDuplicateIndex()
+    index.find_or_add(document("https://sightcall.com/empty", ""))
+
+    # When another empty document comes in
+    # Then it is not linked to the first one
+    assert index.find_or_add(document("https://sightcall.com/other-empty", "   ")) is None
@@ -0,0 +1,60 @@
+import pytest
+
+from sightcall_scraping.application.recording.run_journal_recorder import RunJournalRecorder
+from sightcall_scraping.domain.models.run_progress import RunProgress
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.ports.run_journal import RunJournal
+
+PAGE_URLS = [Url(f"https://sightcall.com/page/{index}") for index in range(3)]
+
+
+class WriteLoggingRunJournal(RunJournal):
+    def __init__(self):
+        self.writes: list[tuple[str, list[str]]] = []
+
+    async def load_progress(self) -> RunProgress:
+        return RunProgress()
+
+    async def record_discovered(self, urls: list[Url]) -> None:
+        self.writes.append(("discovered", [url.value for url in urls]))
+
+    async def record_completed(self, urls: list[str]) -> None:
+        self.writes.append(("completed", urls))
+
+    async def record_failed(self, url: str) -> None:
+        self.writes.append(("failed", [url]))
+
+
+@pytest.mark.asyncio
+async def test_should_journal_discovered_urls_in_one_write_before_their_outcome():
+    # Given: a recorder over a journal logging each of its writes
+    run_journal = WriteLoggingRunJournal()
+    page = ScrapedDocument(url=PAGE_URLS[0].value, title="Page", content="Content")
+
+    # When: three pages are discovered, then the first one is stored
+    async with RunJournalRecorder(run_journal) as recorder:
+        await recorder.load_progress()
+        for url in PAGE_URLS:
+            await recorder.record_discovered(url)
+        await recorder.record_stored([(PAGE_URLS[0], page)])
+
+    # Then: the discovered pages are written together, ahead of the stored one
+    assert run_journal.writes == [
+        ("discovered", [url.value for url in PAGE_URLS]),
+        ("completed", [PAGE_URLS[0].value]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_journal_the_last_discovered_urls_when_the_run_ends():
+    # Given: a recorder over a journal logging each of its writes
+    run_journal = WriteLoggingRunJournal()
+
+    # When: the run ends right after discovering pages
+    async with RunJournalRecorder(run_journal) as recorder:
+        for url in PAGE_URLS:
+            await recorder.record_discovered(url)
+
+    # Then: those pages are still journaled
+    assert run_journal.writes == [("discovered", [url.value for url in PAGE_URLS])]
@@ -0,0 +1,45 @@
+from typing import AsyncGenerator
+
+import pytest
+
+from sightcall_scraping.application.merge_scraped_documents import MergeScrapedDocuments
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.scraped_document_source import ScrapedDocumentSource
+
+
+class FakeScrapedDocumentSource(ScrapedDocumentSource):
+    def __init__(self, documents: list[ScrapedDocument]):
+        self._documents = documents
+
+    async def iter_documents(self) -> AsyncGenerator[ScrapedDocument, None]:
+        for document in self._documents:
+            yield document
+
+
+def document(url: str, content: str) -> ScrapedDocument:
+    return ScrapedDocument(url=url, title="Page", content=content)
+
+
+@pytest.mark.asyncio
+async def test_should_merge_worker_outputs_keeping_one_copy_of_each_page(fake_scraped_document_storage):
+    # Given: two worker outputs, both holding a page whose lease ran out while it was being scraped
+    sources = [
+        FakeScrapedDocumentSource(
+            [document("https://sightcall.com/a", "A"), document("https://sightcall.com/b", "B")]
+        ),
+        FakeScrapedDocumentSource(
+            [document("https://sightcall.com/b", "B again"), document("https://sightcall.com/c", "C")]
+        ),
+    ]
+    storage = fake_scraped_document_storage()
+
+    # When: merging them
+    report = await MergeScrapedDocuments(sources, storage).execute()
+
+    # Then: each page is stored once, from the first output holding it
+    assert [(document.url, document.content) for document in storage.saved_documents] == [
+        ("https://sightcall.com/a", "A"),
+        ("https://sightcall.com/b", "B"),
+        ("https://sightcall.com/c", "C"),
+    ]
+    assert (report.merged_document_count, report.duplicate_document_count) == (3, 1)
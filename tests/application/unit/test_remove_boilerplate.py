@@ -0,0 +1,73 @@
+from typing import AsyncGenerator
+
+import pytest
+
+from sightcall_scraping.application.remove_boilerplate import RemoveBoilerplate
+from sightcall_scraping.domain.boilerplate_detector import BoilerplateDetector
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.scraped_document_source import ScrapedDocumentSource
+
+FOOTER = "Copyright 2025 SightCall All rights reserved Privacy Policy Terms of Service"
+
+
+class FakeScrapedDocumentSource(ScrapedDocumentSource):
+    def __init__(self, documents: list[ScrapedDocument]):
+        self._documents = documents
+
+    async def iter_documents(self) -> AsyncGenerator[ScrapedDocument, None]:
+        for document in self._documents:
+            yield document
+
+
+@pytest.mark.asyncio
+async def test_should_store_documents_without_boilerplate_and_report_bytes_saved(fake_scraped_document_storage):
+    # Given three documents sharing a footer, and one without it
+    documents = [
+        ScrapedDocument(url=f"https://sightcall.com/{index}", title=f"Page {index}", content=f"Body {index}. {FOOTER}")
+        for index in range(3)
+    ]
+    documents.append(ScrapedDocument(url="https://sightcall.com/plain", title="Plain", content="Plain body."))
+    storage = fake_scraped_document_storage()
+    use_case = RemoveBoilerplate(FakeScrapedDocumentSource(documents), storage, BoilerplateDetector())
+
+    # When removing boilerplate
+    report = await use_case.execute()
+
+    # Then the footer is gone from every document that had it
+    assert [document.content for document in storage.saved_documents] == [
+        "Body 0.",
+        "Body 1.",
+        "Body 2.",
+        "Plain body.",
+    ]
+    assert [document.title for document in storage.saved_documents] == ["Page 0", "Page 1", "Page 2", "Plain"]
+    # And the report accounts for the removed bytes
+    assert report.document_count == 4
+    assert report.changed_document_count == 3
+    assert report.saved_bytes == 3 * len(f" {FOOTER}")
+
+
+@pytest.mark.asyncio
+async def test_should_keep_the_near_duplicate_link_of_stripped_documents(fake_scraped_document_storage):
+    # Given a near-duplicate document linked to the page it duplicates, both sharing a footer
+    documents = [
+        ScrapedDocument(url=f"https://sightcall.com/{index}", title=f"Page {index}", content=f"Body {index}. {FOOTER}")
+        for index in range(2)
+    ]
+    documents.append(
+        ScrapedDocument(
+            url="https://sightcall.com/copy",
+            title="Copy",
+            content=f"Body 0. {FOOTER}",
+            duplicate_of="https://sightcall.com/0",
+        )
+    )
+    storage = fake_scraped_document_storage()
+    use_case = RemoveBoilerplate(FakeScrapedDocumentSource(documents), storage, BoilerplateDetector())
+
+    # When removing boilerplate
+    await use_case.execute()
+
+    # Then the stripped copy still points to the page it duplicates
+    assert storage.saved_documents[2].content == "Body 0."
+    assert storage.saved_documents[2].duplicate_of == "https://sightcall.com/0"
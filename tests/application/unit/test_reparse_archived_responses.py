@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+from typing import AsyncGenerator
+
+import pytest
+
+from sightcall_scraping.application.reparse_archived_responses import ReparseArchivedResponses
+from sightcall_scraping.domain.models.archived_response import ArchivedResponse
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.document_parser import DocumentParser
+from sightcall_scraping.domain.ports.response_archive import ResponseArchive
+
+FETCHED_AT = datetime(2025, 5, 14, tzinfo=timezone.utc)
+
+
+class FakeResponseArchive(ResponseArchive):
+    def __init__(self, responses: list[ArchivedResponse]):
+        self._responses = responses
+
+    async def append(self, response: ArchivedResponse) -> None:
+        self._responses.append(response)
+
+    async def iter_responses(self) -> AsyncGenerator[ArchivedResponse, None]:
+        for response in self._responses:
+            yield response
+
+
+class BodyAsContentParser(DocumentParser):
+    def to_scraped_document(self, url: str, raw: str) -> ScrapedDocument:
+        if raw == "broken":
+            raise ValueError("Unparsable page")
+        return ScrapedDocument(url=url, title="Title", content=raw)
+
+
+@pytest.mark.asyncio
+async def test_should_parse_the_latest_archived_body_of_every_page(fake_scraped_document_storage):
+    # Given an archive holding two versions of the blog page, and a page that cannot be parsed
+    response_archive = FakeResponseArchive(
+        [
+            ArchivedResponse("https://sightcall.com/blog/", b"old blog", FETCHED_AT),
+            ArchivedResponse("https://sightcall.com/about", b"about", FETCHED_AT),
+            ArchivedResponse("https://sightcall.com/broken", b"broken", FETCHED_AT),
+            ArchivedResponse("https://sightcall.com/blog/", b"new blog", FETCHED_AT),
+        ]
+    )
+    storage = fake_scraped_document_storage()
+    use_case = ReparseArchivedResponses(response_archive, BodyAsContentParser(), storage, max_concurrent_parses=1)
+
+    # When reparsing it
+    summary = await use_case.execute(lambda _: None)
+
+    # Then each page is stored once, from its latest body
+    assert sorted((document.url, document.content) for document in storage.saved_documents) == [
+        ("https://sightcall.com/about", "about"),
+        ("https://sightcall.com/blog/", "new blog"),
+    ]
+    assert summary.reparsed_document_count == 2
+    assert summary.superseded_response_count == 1
+    assert summary.failed_urls == ["https://sightcall.com/broken"]
@@ -1,11 +1,38 @@
 import asyncio
-from typing import List, Tuple
+import contextlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
 
 import pytest
 
+from sightcall_scraping.application.discovery.crawl_url_discovery import CrawlUrlDiscovery
+from sightcall_scraping.application.discovery.sitemap_url_discovery import SitemapUrlDiscovery
+from sightcall_scraping.application.page_scraping.backoff import MAX_RETRY_ATTEMPTS
+from sightcall_scraping.application.page_scraping.concurrency_limits import ConcurrencyLimits
+from sightcall_scraping.application.page_scraping.page_scraper import PageScraper
+from sightcall_scraping.application.recording.near_duplicate_filter import (
+    DroppingNearDuplicateFilter,
+    LinkingNearDuplicateFilter,
+    NearDuplicateFilter,
+)
+from sightcall_scraping.application.recording.near_duplicate_index import MinHashNearDuplicateIndex, NearDuplicateIndex
+from sightcall_scraping.application.recording.page_recorder import PageRecorder
+from sightcall_scraping.application.recording.run_journal_recorder import RunJournalRecorder
+from sightcall_scraping.application.recording.url_state_recorder import IncrementalUrlStateRecorder, UrlStateRecorder
 from sightcall_scraping.application.scrape_sightcall_website import ScrapeSightCallWebsite
+from sightcall_scraping.domain.errors import FetchError, SkippedResponseError, ThrottledError
+from sightcall_scraping.domain.models.run_progress import RunProgress
 from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.models.url_state import UrlState
+from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.domain.ports.document_parser import DocumentParser
+from sightcall_scraping.domain.ports.run_journal import RunJournal
 from sightcall_scraping.domain.ports.scraped_document_storage import ScrapedDocumentStorage
+from sightcall_scraping.infrastructure.in_memory_metrics_recorder import InMemoryMetricsRecorder
 
 EXPECTED_SCRAPED_DOCUMENT_COUNT: int = 2
 EXPECTED_PROGRESS_BAR_TOTAL: int = 2
@@ -18,7 +45,66 @@ def create_use_case(
     content_fetcher = fake_content_fetcher(responses)
     document_parser = fake_document_parser(rag_responses)
     storage = fake_scraped_document_storage()
-    return ScrapeSightCallWebsite(content_fetcher, document_parser, storage), storage
+    return ScrapeSightCallWebsite(PageScraper(content_fetcher, document_parser), storage), storage
+
+
+class FakeDocumentParserFor(DocumentParser):
+    def __init__(self, documents: dict[str, ScrapedDocument]):
+        self._documents = documents
+
+    def to_scraped_document(self, url: str, raw: str) -> ScrapedDocument:
+        return self._documents[url]
+
+
+def fake_content_fetcher_for(responses: dict[str, str]) -> ContentFetcher:
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            if url not in responses:
+                raise FetchError(url, "404 Not Found")
+            return responses[url]
+
+    return FakeContentFetcher()
+
+
+def urlset_xml(page_urls: Iterable[str]) -> str:
+    urls = "".join(f"<url><loc>{url}</loc></url>" for url in page_urls)
+    return f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+
+
+def sitemap_index_xml_for(sitemap_urls: Iterable[str]) -> str:
+    sitemaps = "".join(f"<sitemap><loc>{url}</loc></sitemap>" for url in sitemap_urls)
+    return f'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{sitemaps}</sitemapindex>'
+
+
+class FakeRunJournal(RunJournal):
+    def __init__(self, progress: Optional[RunProgress] = None):
+        self.progress = progress or RunProgress()
+        self.discovered_urls: List[str] = []
+        self.completed_urls: List[str] = []
+        self.failed_urls: List[str] = []
+
+    async def load_progress(self) -> RunProgress:
+        return self.progress
+
+    async def record_discovered(self, urls: list[Url]) -> None:
+        self.discovered_urls.extend(url.value for url in urls)
+
+    async def record_completed(self, urls: list[str]) -> None:
+        self.completed_urls.extend(urls)
+
+    async def record_failed(self, url: str) -> None:
+        self.failed_urls.append(url)
+
+
+SHORT_CIRCUIT_OPEN_SECONDS: float = 0.01
+
+
+async def no_sleep(_: float) -> None:
+    pass
+
+
+def sorted_by_url(documents: Iterable[ScrapedDocument]) -> List[ScrapedDocument]:
+    return sorted(documents, key=lambda document: document.url)
 
 
 def expected_documents(rag_responses, html_responses) -> List[ScrapedDocument]:
@@ -29,7 +115,7 @@ def expected_documents(rag_responses, html_responses) -> List[ScrapedDocument]:
 
 
 @pytest.mark.asyncio
-async def test_should_return_scraped_documents_for_all_urls_in_sitemap_index(
+async def test_should_return_summary_of_scraped_documents_for_all_urls_in_sitemap_index(
     fake_content_fetcher,
     fake_document_parser,
     fake_scraped_document_storage,
@@ -48,8 +134,9 @@ async def test_should_return_scraped_documents_for_all_urls_in_sitemap_index(
     use_case, _ = create_use_case(
         fake_content_fetcher, fake_document_parser, fake_scraped_document_storage, responses, rag_responses
     )
-    documents = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
-    assert documents == expected_documents(rag_responses, html_responses)
+    summary = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+    assert summary.scraped_document_count == EXPECTED_SCRAPED_DOCUMENT_COUNT
+    assert summary.failed_urls == []
 
 
 @pytest.mark.asyncio
@@ -72,9 +159,8 @@ async def test_should_store_scraped_documents_for_all_urls_in_sitemap_index(
     use_case, storage = create_use_case(
         fake_content_fetcher, fake_document_parser, fake_scraped_document_storage, responses, rag_responses
     )
-    documents = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+    await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
     assert storage.saved_documents == expected_documents(rag_responses, html_responses)
-    assert documents == expected_documents(rag_responses, html_responses)
 
 
 @pytest.mark.asyncio
@@ -94,7 +180,7 @@ async def test_should_call_progress_callback_when_scraping_documents(
         "https://sightcall.com/page-sitemap.xml": page_sitemap_xml,
         **html_responses,
     }
-    use_case, _ = create_use_case(
+    use_case, storage = create_use_case(
         fake_content_fetcher, fake_document_parser, fake_scraped_document_storage, responses, rag_responses
     )
     progress_calls = []
@@ -102,16 +188,15 @@ async def test_should_call_progress_callback_when_scraping_documents(
     def on_progress(count):
         progress_calls.append(count)
 
-    documents = await use_case.execute("https://sightcall.com/sitemap_index.xml", on_progress=on_progress)
+    await use_case.execute("https://sightcall.com/sitemap_index.xml", on_progress=on_progress)
     assert progress_calls == [1, 2]
-    assert documents == expected_documents(rag_responses, html_responses)
+    assert storage.saved_documents == expected_documents(rag_responses, html_responses)
 
 
 @pytest.mark.asyncio
 async def test_should_not_exceed_maximum_concurrent_requests_when_scraping_documents(
     fake_document_parser,
     fake_scraped_document_storage,
-    sitemap_index_xml,
 ):
     # Given: 20 URLs to scrape and a fake fetcher that tracks concurrency
     sitemap_urls = [f"https://sightcall.com/sitemap-{i}.xml" for i in range(20)]
@@ -122,15 +207,15 @@ async def test_should_not_exceed_maximum_concurrent_requests_when_scraping_docum
         for i, url in enumerate(page_urls)
     }
     responses = {
-        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml,
-        **{sitemap_url: f"<xml>{sitemap_url}</xml>" for sitemap_url in sitemap_urls},
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml_for(sitemap_urls),
+        **{sitemap_url: urlset_xml([page_urls[i]]) for i, sitemap_url in enumerate(sitemap_urls)},
         **html_responses,
     }
     max_concurrent = 0
     current_concurrent = 0
     lock = asyncio.Lock()
 
-    class FakeContentFetcher:
+    class FakeContentFetcher(ContentFetcher):
         async def fetch(self, url):
             nonlocal max_concurrent, current_concurrent
             # Only track concurrency for document fetches
@@ -146,34 +231,22 @@ async def test_should_not_exceed_maximum_concurrent_requests_when_scraping_docum
                     current_concurrent -= 1
             return responses[url]
 
-    # Patch the sitemap parser to return 20 sitemap URLs from the index, and one page URL per sitemap
     fake_parser = fake_document_parser(rag_responses)
     fake_storage = fake_scraped_document_storage()
-    use_case = ScrapeSightCallWebsite(FakeContentFetcher(), fake_parser, fake_storage)
-
-    def fake_parse(xml):
-        if xml == sitemap_index_xml:
-            return [type("Url", (), {"value": url})() for url in sitemap_urls]
-        for i, sitemap_url in enumerate(sitemap_urls):
-            if xml == f"<xml>{sitemap_url}</xml>":
-                return [type("Url", (), {"value": page_urls[i]})()]
-        return []
-
-    use_case._sitemap_parser.parse = fake_parse
+    use_case = ScrapeSightCallWebsite(PageScraper(FakeContentFetcher(), fake_parser), fake_storage)
 
     # When: Executing the use case
-    documents = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+    summary = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
 
     # Then: All documents are scraped and concurrency never exceeds 10
     assert max_concurrent <= 10
-    assert len(documents) == len(page_urls)
-    assert fake_storage.saved_documents == list(rag_responses.values())
+    assert summary.scraped_document_count == len(page_urls)
+    assert sorted_by_url(fake_storage.saved_documents) == sorted_by_url(rag_responses.values())
 
 
 def test_should_call_on_progress_callback_for_each_scraped_document(
     fake_document_parser,
     fake_scraped_document_storage,
-    sitemap_index_xml,
 ):
     # Given: 5 URLs to scrape
     sitemap_urls = [f"https://sightcall.com/sitemap-{i}.xml" for i in range(5)]
@@ -184,28 +257,19 @@ def test_should_call_on_progress_callback_for_each_scraped_document(
         for i, url in enumerate(page_urls)
     }
     responses = {
-        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml,
-        **{sitemap_url: f"<xml>{sitemap_url}</xml>" for sitemap_url in sitemap_urls},
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml_for(sitemap_urls),
+        **{sitemap_url: urlset_xml([page_urls[i]]) for i, sitemap_url in enumerate(sitemap_urls)},
         **html_responses,
     }
 
-    class FakeContentFetcher:
+    class FakeContentFetcher(ContentFetcher):
         async def fetch(self, url):
             return responses[url]
 
     fake_parser = fake_document_parser(rag_responses)
     fake_storage = fake_scraped_document_storage()
-    use_case = ScrapeSightCallWebsite(FakeContentFetcher(), fake_parser, fake_storage)
-
-    def fake_parse(xml):
-        if xml == sitemap_index_xml:
-            return [type("Url", (), {"value": url})() for url in sitemap_urls]
-        for i, sitemap_url in enumerate(sitemap_urls):
-            if xml == f"<xml>{sitemap_url}</xml>":
-                return [type("Url", (), {"value": page_urls[i]})()]
-        return []
+    use_case = ScrapeSightCallWebsite(PageScraper(FakeContentFetcher(), fake_parser), fake_storage)
 
-    use_case._sitemap_parser.parse = fake_parse
     # Track progress callback calls
     progress_calls = []
 
@@ -215,8 +279,1174 @@ def test_should_call_on_progress_callback_for_each_scraped_document(
     # When: Executing the use case with the progress callback
     import asyncio
 
-    documents = asyncio.run(use_case.execute("https://sightcall.com/sitemap_index.xml", on_progress=on_progress))
+    summary = asyncio.run(use_case.execute("https://sightcall.com/sitemap_index.xml", on_progress=on_progress))
     # Then: The callback is called once per document, in order
     assert progress_calls == [1, 2, 3, 4, 5]
-    assert len(documents) == 5
-    assert fake_storage.saved_documents == list(rag_responses.values())
+    assert summary.scraped_document_count == 5
+    assert sorted_by_url(fake_storage.saved_documents) == sorted_by_url(rag_responses.values())
+
+
+@pytest.mark.asyncio
+async def test_should_start_scraping_pages_before_all_sitemaps_are_discovered(
+    fake_document_parser,
+    fake_scraped_document_storage,
+    sitemap_index_xml,
+    post_sitemap_xml,
+    page_sitemap_xml,
+    html_responses,
+    rag_responses,
+):
+    # Given: a fetcher that only serves the page sitemap once a page from the post sitemap was scraped
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml,
+        "https://sightcall.com/post-sitemap.xml": post_sitemap_xml,
+        "https://sightcall.com/page-sitemap.xml": page_sitemap_xml,
+        **html_responses,
+    }
+    blog_page_fetched = asyncio.Event()
+
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            if url == "https://sightcall.com/page-sitemap.xml":
+                await asyncio.wait_for(blog_page_fetched.wait(), timeout=1)
+            if url == "https://sightcall.com/blog/":
+                blog_page_fetched.set()
+            return responses[url]
+
+    storage = fake_scraped_document_storage()
+    use_case = ScrapeSightCallWebsite(PageScraper(FakeContentFetcher(), fake_document_parser(rag_responses)), storage)
+
+    # When: executing the use case
+    await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+
+    # Then: both pages are scraped, which requires page workers to run during discovery
+    assert storage.saved_documents == expected_documents(rag_responses, html_responses)
+
+
+@pytest.mark.asyncio
+async def test_should_stop_fetching_sitemaps_once_max_urls_is_reached(
+    fake_document_parser,
+    fake_scraped_document_storage,
+):
+    # Given: 20 sitemaps holding one page each
+    sitemap_urls = [f"https://sightcall.com/sitemap-{i}.xml" for i in range(20)]
+    page_urls = [f"https://sightcall.com/page/{i}" for i in range(20)]
+    rag_responses = {
+        (url, url): ScrapedDocument(url=url, title=f"Page {i}", content=f"Content {i}")
+        for i, url in enumerate(page_urls)
+    }
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml_for(sitemap_urls),
+        **{sitemap_url: urlset_xml([page_urls[i]]) for i, sitemap_url in enumerate(sitemap_urls)},
+        **{url: url for url in page_urls},
+    }
+    fetched_sitemaps: list[str] = []
+
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            if url in sitemap_urls:
+                fetched_sitemaps.append(url)
+            await asyncio.sleep(0)
+            return responses[url]
+
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(FakeContentFetcher(), fake_document_parser(rag_responses)), fake_scraped_document_storage()
+    )
+
+    # When: executing the use case with a limit of one URL
+    summary = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None, max_urls=1)
+
+    # Then: only one page is scraped and the remaining sitemaps are never fetched
+    assert summary.scraped_document_count == 1
+    assert len(fetched_sitemaps) < len(sitemap_urls)
+
+
+@pytest.mark.asyncio
+async def test_should_not_exceed_max_urls_while_checking_whether_pages_changed(
+    fake_document_parser,
+    fake_scraped_document_storage,
+):
+    # Given: 5 sitemaps walked at once, and a page recorder that takes a while to tell whether a page changed
+    sitemap_urls = [f"https://sightcall.com/sitemap-{i}.xml" for i in range(5)]
+    page_urls = [f"https://sightcall.com/page/{i}" for i in range(5)]
+    rag_responses = {
+        (url, url): ScrapedDocument(url=url, title=f"Page {i}", content=f"Content {i}")
+        for i, url in enumerate(page_urls)
+    }
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml_for(sitemap_urls),
+        **{sitemap_url: urlset_xml([page_urls[i]]) for i, sitemap_url in enumerate(sitemap_urls)},
+        **{url: url for url in page_urls},
+    }
+
+    class SlowPageRecorder(PageRecorder):
+        async def is_unchanged(self, url: Url) -> bool:
+            await asyncio.sleep(0)
+            return False
+
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(fake_content_fetcher_for(responses), fake_document_parser(rag_responses)),
+        fake_scraped_document_storage(),
+        page_recorder=SlowPageRecorder(),
+    )
+
+    # When: executing the use case with a limit of two URLs
+    summary = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None, max_urls=2)
+
+    # Then: only two pages are scraped
+    assert summary.scraped_document_count == 2
+
+
+@pytest.mark.asyncio
+async def test_should_report_urls_that_keep_failing_in_summary(
+    fake_document_parser,
+    fake_scraped_document_storage,
+    sitemap_index_xml,
+    post_sitemap_xml,
+    page_sitemap_xml,
+    html_responses,
+    rag_responses,
+    monkeypatch,
+):
+    # Given: a fetcher for which the about page is always unavailable
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml,
+        "https://sightcall.com/post-sitemap.xml": post_sitemap_xml,
+        "https://sightcall.com/page-sitemap.xml": page_sitemap_xml,
+        "https://sightcall.com/blog/": html_responses["https://sightcall.com/blog/"],
+    }
+
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            if url not in responses:
+                raise FetchError(url, "connection refused")
+            return responses[url]
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    storage = fake_scraped_document_storage()
+    use_case = ScrapeSightCallWebsite(PageScraper(FakeContentFetcher(), fake_document_parser(rag_responses)), storage)
+
+    # When: executing the use case
+    summary = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+
+    # Then: the blog page is stored and the about page is reported as failed
+    assert summary.scraped_document_count == 1
+    assert summary.failed_urls == ["https://sightcall.com/about"]
+    assert [document.url for document in storage.saved_documents] == ["https://sightcall.com/blog/"]
+
+
+@pytest.mark.asyncio
+async def test_should_report_pages_the_parser_cannot_parse_and_store_the_others(
+    fake_content_fetcher,
+    fake_scraped_document_storage,
+    sitemap_index_xml,
+    post_sitemap_xml,
+    page_sitemap_xml,
+    html_responses,
+    rag_responses,
+):
+    # Given: a parser that raises on the about page
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml,
+        "https://sightcall.com/post-sitemap.xml": post_sitemap_xml,
+        "https://sightcall.com/page-sitemap.xml": page_sitemap_xml,
+        **html_responses,
+    }
+
+    class FailingOnAboutDocumentParser(DocumentParser):
+        def to_scraped_document(self, url: str, raw: str) -> ScrapedDocument:
+            if url == "https://sightcall.com/about":
+                raise ValueError("malformed markup")
+            return rag_responses[(url, raw)]
+
+    storage = fake_scraped_document_storage()
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(fake_content_fetcher(responses), FailingOnAboutDocumentParser()), storage
+    )
+
+    # When: executing the use case
+    summary = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+
+    # Then: the blog page is stored and the about page is reported as failed
+    assert summary.failed_urls == ["https://sightcall.com/about"]
+    assert [document.url for document in storage.saved_documents] == ["https://sightcall.com/blog/"]
+
+
+@pytest.mark.asyncio
+async def test_should_wait_for_retry_after_before_retrying_a_throttled_page(
+    fake_scraped_document_storage,
+    monkeypatch,
+):
+    # Given: a page throttled once with a Retry-After longer than the default backoff
+    sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    page_url = "https://sightcall.com/page"
+    responses = {sitemap_url: urlset_xml([page_url]), page_url: page_url}
+    throttled_urls = {page_url}
+
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            if url in throttled_urls:
+                throttled_urls.remove(url)
+                raise ThrottledError(url, retry_after_seconds=42)
+            return responses[url]
+
+    sleeps: list[float] = []
+
+    async def record_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", record_sleep)
+    document = ScrapedDocument(url=page_url, title="Page", content="Content")
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(FakeContentFetcher(), FakeDocumentParserFor({page_url: document})), fake_scraped_document_storage()
+    )
+
+    # When: executing the use case
+    summary = await use_case.execute(sitemap_url, lambda _: None)
+
+    # Then: the page is scraped after waiting as long as the server asked
+    assert summary.scraped_document_count == 1
+    assert max(sleeps) == pytest.approx(42, abs=1)
+
+
+@pytest.mark.asyncio
+async def test_should_keep_scraping_healthy_urls_while_failed_ones_wait_for_retry(
+    fake_scraped_document_storage,
+    monkeypatch,
+):
+    # Given: two workers, and two failing URLs listed before healthy ones
+    sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    failing_urls = [f"https://down.sightcall.com/page/{i}" for i in range(2)]
+    healthy_urls = [f"https://sightcall.com/page/{i}" for i in range(6)]
+    responses = {sitemap_url: urlset_xml(failing_urls + healthy_urls), **{url: url for url in healthy_urls}}
+    all_healthy_urls_fetched = asyncio.Event()
+    fetched_healthy_urls: set[str] = set()
+
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            if url in failing_urls:
+                raise FetchError(url, "connection refused")
+            if url in healthy_urls:
+                fetched_healthy_urls.add(url)
+            if fetched_healthy_urls == set(healthy_urls):
+                all_healthy_urls_fetched.set()
+            return responses[url]
+
+    async def backoff_until_healthy_urls_are_fetched(_: float) -> None:
+        await all_healthy_urls_fetched.wait()
+
+    monkeypatch.setattr(asyncio, "sleep", backoff_until_healthy_urls_are_fetched)
+    documents = {url: ScrapedDocument(url=url, title="Page", content=url) for url in healthy_urls}
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(
+            FakeContentFetcher(),
+            FakeDocumentParserFor(documents),
+            ConcurrencyLimits(
+                max_concurrent_requests=1,
+                max_concurrent_parses=1,
+                circuit_open_seconds=SHORT_CIRCUIT_OPEN_SECONDS,
+            ),
+        ),
+        fake_scraped_document_storage(),
+    )
+
+    # When: executing the use case while backoffs last until every healthy page is fetched
+    summary = await asyncio.wait_for(use_case.execute(sitemap_url, lambda _: None), timeout=5)
+
+    # Then: waiting retries did not hold the workers, and failing URLs are reported after their retries
+    assert summary.scraped_document_count == len(healthy_urls)
+    assert sorted(summary.failed_urls) == failing_urls
+
+
+@pytest.mark.asyncio
+async def test_should_postpone_the_pages_of_a_host_while_its_circuit_is_open(
+    fake_scraped_document_storage,
+    monkeypatch,
+):
+    # Given: a host that is down for every one of its pages, with a circuit opening for a few milliseconds
+    sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    page_urls = [f"https://down.sightcall.com/page/{i}" for i in range(10)]
+    responses = {sitemap_url: urlset_xml(page_urls)}
+    down_host_fetch_count = 0
+
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            nonlocal down_host_fetch_count
+            if url in page_urls:
+                down_host_fetch_count += 1
+                raise FetchError(url, "connection refused")
+            return responses[url]
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    metrics_recorder = InMemoryMetricsRecorder()
+    limits = ConcurrencyLimits(max_concurrent_requests=1, circuit_open_seconds=SHORT_CIRCUIT_OPEN_SECONDS)
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(FakeContentFetcher(), FakeDocumentParserFor({}), limits, None, metrics_recorder),
+        fake_scraped_document_storage(),
+    )
+
+    # When: executing the use case
+    summary = await use_case.execute(sitemap_url, lambda _: None)
+
+    # Then: pages reaching the open circuit wait for it, and only requests to the host use up their attempts
+    assert sorted(summary.failed_urls) == sorted(page_urls)
+    assert down_host_fetch_count == len(page_urls) * MAX_RETRY_ATTEMPTS
+    assert metrics_recorder.counter_value("postponed_pages") > 0
+
+
+@pytest.mark.asyncio
+async def test_should_store_documents_while_other_pages_are_still_being_scraped(
+    fake_document_parser,
+    fake_scraped_document_storage,
+    sitemap_index_xml,
+    post_sitemap_xml,
+    page_sitemap_xml,
+    html_responses,
+    rag_responses,
+):
+    # Given: a fetcher that only serves the about page once a document reached the storage
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml,
+        "https://sightcall.com/post-sitemap.xml": post_sitemap_xml,
+        "https://sightcall.com/page-sitemap.xml": page_sitemap_xml,
+        **html_responses,
+    }
+    storage = fake_scraped_document_storage()
+
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            if url == "https://sightcall.com/about":
+                while not storage.saved_documents:
+                    await asyncio.sleep(0)
+            return responses[url]
+
+    use_case = ScrapeSightCallWebsite(PageScraper(FakeContentFetcher(), fake_document_parser(rag_responses)), storage)
+
+    # When: executing the use case
+    summary = await asyncio.wait_for(use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None), 1)
+
+    # Then: both documents end up in the storage
+    assert summary.scraped_document_count == EXPECTED_SCRAPED_DOCUMENT_COUNT
+    assert storage.saved_documents == expected_documents(rag_responses, html_responses)
+
+
+@pytest.mark.asyncio
+async def test_should_parse_documents_outside_of_the_event_loop_thread(
+    fake_content_fetcher,
+    fake_scraped_document_storage,
+    sitemap_index_xml,
+    post_sitemap_xml,
+    page_sitemap_xml,
+    html_responses,
+    rag_responses,
+):
+    # Given: a parser recording the thread it runs on and a dedicated parse executor
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml,
+        "https://sightcall.com/post-sitemap.xml": post_sitemap_xml,
+        "https://sightcall.com/page-sitemap.xml": page_sitemap_xml,
+        **html_responses,
+    }
+    parse_thread_ids: set[int] = set()
+
+    class ThreadRecordingDocumentParser(DocumentParser):
+        def to_scraped_document(self, url: str, raw: str) -> ScrapedDocument:
+            parse_thread_ids.add(threading.get_ident())
+            return rag_responses[(url, raw)]
+
+    storage = fake_scraped_document_storage()
+    with ThreadPoolExecutor(max_workers=2) as parse_executor:
+        use_case = ScrapeSightCallWebsite(
+            PageScraper(fake_content_fetcher(responses), ThreadRecordingDocumentParser(), None, parse_executor),
+            storage,
+        )
+
+        # When: executing the use case
+        await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+
+    # Then: documents are parsed, never on the event loop thread
+    assert storage.saved_documents == expected_documents(rag_responses, html_responses)
+    assert threading.get_ident() not in parse_thread_ids
+
+
+@pytest.mark.asyncio
+async def test_should_limit_parse_concurrency_independently_from_fetch_concurrency(
+    fake_content_fetcher,
+    fake_scraped_document_storage,
+):
+    # Given: 10 pages and a parser tracking how many parses run at once
+    sitemap_urls = [f"https://sightcall.com/sitemap-{i}.xml" for i in range(10)]
+    page_urls = [f"https://sightcall.com/page/{i}" for i in range(10)]
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml_for(sitemap_urls),
+        **{sitemap_url: urlset_xml([page_urls[i]]) for i, sitemap_url in enumerate(sitemap_urls)},
+        **{url: url for url in page_urls},
+    }
+    lock = threading.Lock()
+    parses_in_flight = 0
+    max_parses_in_flight = 0
+
+    class SlowDocumentParser(DocumentParser):
+        def to_scraped_document(self, url: str, raw: str) -> ScrapedDocument:
+            nonlocal parses_in_flight, max_parses_in_flight
+            with lock:
+                parses_in_flight += 1
+                max_parses_in_flight = max(max_parses_in_flight, parses_in_flight)
+            time.sleep(0.01)
+            with lock:
+                parses_in_flight -= 1
+            return ScrapedDocument(url=url, title=url, content=url)
+
+    with ThreadPoolExecutor(max_workers=8) as parse_executor:
+        use_case = ScrapeSightCallWebsite(
+            PageScraper(
+                fake_content_fetcher(responses),
+                SlowDocumentParser(),
+                ConcurrencyLimits(max_concurrent_parses=2),
+                parse_executor,
+            ),
+            fake_scraped_document_storage(),
+        )
+
+        # When: executing the use case
+        summary = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+
+    # Then: every page is parsed, never more than two at once
+    assert summary.scraped_document_count == len(page_urls)
+    assert max_parses_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_should_follow_nested_sitemap_indexes_without_looping_on_cycles(
+    fake_content_fetcher,
+    fake_scraped_document_storage,
+):
+    # Given: an index whose child is itself an index pointing to a page sitemap and back to the root
+    root_url = "https://sightcall.com/sitemap_index.xml"
+    nested_index_url = "https://sightcall.com/nested-index.xml"
+    page_sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    page_url = "https://sightcall.com/page"
+    responses = {
+        root_url: sitemap_index_xml_for([nested_index_url]),
+        nested_index_url: sitemap_index_xml_for([page_sitemap_url, root_url, nested_index_url]),
+        page_sitemap_url: urlset_xml([page_url]),
+        page_url: page_url,
+    }
+    document = ScrapedDocument(url=page_url, title="Page", content="Content")
+    storage = fake_scraped_document_storage()
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(fake_content_fetcher(responses), FakeDocumentParserFor({page_url: document})), storage
+    )
+
+    # When: executing the use case
+    summary = await use_case.execute(root_url, lambda _: None)
+
+    # Then: the page behind the nested index is scraped exactly once
+    assert summary.scraped_document_count == 1
+    assert storage.saved_documents == [document]
+
+
+@pytest.mark.asyncio
+async def test_should_not_follow_sitemap_indexes_deeper_than_max_depth(
+    fake_content_fetcher,
+    fake_scraped_document_storage,
+):
+    # Given: a chain of indexes two levels deep above the page sitemap
+    root_url = "https://sightcall.com/sitemap_index.xml"
+    nested_index_url = "https://sightcall.com/nested-index.xml"
+    page_sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    page_url = "https://sightcall.com/page"
+    responses = {
+        root_url: sitemap_index_xml_for([nested_index_url]),
+        nested_index_url: sitemap_index_xml_for([page_sitemap_url]),
+        page_sitemap_url: urlset_xml([page_url]),
+        page_url: page_url,
+    }
+    content_fetcher = fake_content_fetcher(responses)
+    document = ScrapedDocument(url=page_url, title="Page", content="Content")
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(content_fetcher, FakeDocumentParserFor({page_url: document})),
+        fake_scraped_document_storage(),
+        SitemapUrlDiscovery(content_fetcher, max_sitemap_depth=1),
+    )
+
+    # When: executing the use case
+    summary = await use_case.execute(root_url, lambda _: None)
+
+    # Then: the page sitemap is out of reach
+    assert summary.scraped_document_count == 0
+
+
+def urlset_xml_with_lastmod(lastmod_by_url: dict[str, str]) -> str:
+    urls = "".join(
+        f"<url><loc>{url}</loc><lastmod>{lastmod}</lastmod></url>" for url, lastmod in lastmod_by_url.items()
+    )
+    return f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+
+
+@pytest.mark.asyncio
+async def test_should_only_scrape_urls_modified_since_last_run_when_incremental(
+    fake_content_fetcher,
+    fake_scraped_document_storage,
+    fake_url_state_store,
+):
+    # Given: a page unchanged since the last run, a page modified since, and a page never scraped
+    sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    unchanged_url = "https://sightcall.com/unchanged"
+    modified_url = "https://sightcall.com/modified"
+    new_url = "https://sightcall.com/new"
+    responses = {
+        sitemap_url: urlset_xml_with_lastmod(
+            {unchanged_url: "2025-01-01", modified_url: "2025-03-01", new_url: "2025-01-01"}
+        ),
+        unchanged_url: unchanged_url,
+        modified_url: modified_url,
+        new_url: new_url,
+    }
+    documents = {url: ScrapedDocument(url=url, title="Title", content=url) for url in (modified_url, new_url)}
+    last_run = datetime(2025, 2, 1, tzinfo=timezone.utc)
+    url_state_store = fake_url_state_store(
+        [UrlState(unchanged_url, last_run, "hash"), UrlState(modified_url, last_run, "hash")]
+    )
+    storage = fake_scraped_document_storage()
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(fake_content_fetcher(responses), FakeDocumentParserFor(documents)),
+        storage,
+        page_recorder=IncrementalUrlStateRecorder(url_state_store),
+    )
+
+    # When: executing the use case incrementally
+    summary = await use_case.execute(sitemap_url, lambda _: None)
+
+    # Then: only the modified and new pages are scraped, and their state is recorded
+    assert sorted_by_url(storage.saved_documents) == sorted_by_url(documents.values())
+    assert summary.unchanged_url_count == 1
+    assert url_state_store.states[new_url] == UrlState(
+        new_url, datetime(2025, 1, 1, tzinfo=timezone.utc), documents[new_url].content_hash
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_record_url_states_but_scrape_everything_when_not_incremental(
+    fake_content_fetcher,
+    fake_scraped_document_storage,
+    fake_url_state_store,
+):
+    # Given: a page already scraped at its current lastmod
+    sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    page_url = "https://sightcall.com/page"
+    lastmod = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    responses = {sitemap_url: urlset_xml_with_lastmod({page_url: "2025-01-01"}), page_url: page_url}
+    document = ScrapedDocument(url=page_url, title="Page", content="Content")
+    url_state_store = fake_url_state_store([UrlState(page_url, lastmod, "old")])
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(fake_content_fetcher(responses), FakeDocumentParserFor({page_url: document})),
+        fake_scraped_document_storage(),
+        page_recorder=UrlStateRecorder(url_state_store),
+    )
+
+    # When: executing a full scrape
+    summary = await use_case.execute(sitemap_url, lambda _: None)
+
+    # Then: the page is scraped again and its new content hash is stored
+    assert summary.scraped_document_count == 1
+    assert url_state_store.states[page_url] == UrlState(page_url, lastmod, document.content_hash)
+
+
+@pytest.mark.asyncio
+async def test_should_journal_discovered_completed_and_failed_urls(
+    fake_scraped_document_storage,
+    monkeypatch,
+):
+    # Given: a sitemap with a working page and a broken one
+    sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    page_url = "https://sightcall.com/page"
+    broken_url = "https://sightcall.com/broken"
+    responses = {sitemap_url: urlset_xml([page_url, broken_url]), page_url: page_url}
+
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            if url not in responses:
+                raise FetchError(url, "connection refused")
+            return responses[url]
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    run_journal = FakeRunJournal()
+    document = ScrapedDocument(url=page_url, title="Page", content="Content")
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(FakeContentFetcher(), FakeDocumentParserFor({page_url: document})),
+        fake_scraped_document_storage(),
+        page_recorder=RunJournalRecorder(run_journal),
+    )
+
+    # When: executing the use case
+    await use_case.execute(sitemap_url, lambda _: None)
+
+    # Then: the journal knows the whole frontier and how each page ended
+    assert sorted(run_journal.discovered_urls) == sorted([page_url, broken_url])
+    assert run_journal.completed_urls == [page_url]
+    assert run_journal.failed_urls == [broken_url]
+
+
+@pytest.mark.asyncio
+async def test_should_resume_a_run_without_scraping_completed_pages_again(
+    fake_content_fetcher,
+    fake_scraped_document_storage,
+):
+    # Given: an interrupted run that stored one page and had another one in flight
+    sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    completed_url = "https://sightcall.com/completed"
+    unfinished_url = "https://sightcall.com/unfinished"
+    undiscovered_url = "https://sightcall.com/undiscovered"
+    responses = {
+        sitemap_url: urlset_xml([completed_url, unfinished_url, undiscovered_url]),
+        unfinished_url: unfinished_url,
+        undiscovered_url: undiscovered_url,
+    }
+    documents = {
+        url: ScrapedDocument(url=url, title="Page", content=url) for url in (unfinished_url, undiscovered_url)
+    }
+    run_journal = FakeRunJournal(RunProgress([completed_url], [Url(unfinished_url)]))
+    storage = fake_scraped_document_storage()
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(fake_content_fetcher(responses), FakeDocumentParserFor(documents)),
+        storage,
+        page_recorder=RunJournalRecorder(run_journal),
+    )
+
+    # When: resuming it
+    summary = await use_case.execute(sitemap_url, lambda _: None)
+
+    # Then: only the pages that were not stored yet are scraped, each once
+    assert sorted_by_url(storage.saved_documents) == sorted_by_url(documents.values())
+    assert summary.previously_completed_url_count == 1
+    assert run_journal.discovered_urls == [undiscovered_url]
+
+
+@pytest.mark.asyncio
+async def test_should_scrape_a_page_listed_in_several_sitemaps_only_once(
+    fake_content_fetcher,
+    fake_scraped_document_storage,
+):
+    # Given: the same page listed in two sitemaps, under variants of its URL
+    root_url = "https://sightcall.com/sitemap_index.xml"
+    post_sitemap_url = "https://sightcall.com/post-sitemap.xml"
+    page_sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    page_url = "https://sightcall.com/blog/"
+    responses = {
+        root_url: sitemap_index_xml_for([post_sitemap_url, page_sitemap_url]),
+        post_sitemap_url: urlset_xml([page_url, "https://SIGHTCALL.com/blog#top"]),
+        page_sitemap_url: urlset_xml(["https://sightcall.com/blog"]),
+        page_url: page_url,
+        "https://SIGHTCALL.com/blog#top": page_url,
+        "https://sightcall.com/blog": page_url,
+    }
+    document = ScrapedDocument(url=page_url, title="Blog", content="Content")
+    parser = FakeDocumentParserFor(
+        {url: document for url in (page_url, "https://SIGHTCALL.com/blog#top", "https://sightcall.com/blog")}
+    )
+    storage = fake_scraped_document_storage()
+    use_case = ScrapeSightCallWebsite(PageScraper(fake_content_fetcher(responses), parser), storage)
+
+    # When: executing the use case
+    summary = await use_case.execute(root_url, lambda _: None)
+
+    # Then: the page is scraped once and the two other copies are reported as duplicates
+    assert storage.saved_documents == [document]
+    assert summary.duplicate_url_count == 2
+
+
+def similar_at_80_percent() -> NearDuplicateIndex:
+    return MinHashNearDuplicateIndex(similarity_threshold=0.8)
+
+
+def near_duplicate_scrape(
+    fake_content_fetcher, fake_scraped_document_storage, near_duplicate_filter: NearDuplicateFilter
+) -> Tuple[ScrapeSightCallWebsite, ScrapedDocumentStorage, List[ScrapedDocument]]:
+    page_urls = ["https://sightcall.com/blog/", "https://sightcall.com/blog/page/2", "https://sightcall.com/about"]
+    listing = " ".join(
+        f"Article {index} about remote video assistance for field service teams." for index in range(30)
+    )
+    documents = [
+        ScrapedDocument(url=page_urls[0], title="Blog", content=listing),
+        ScrapedDocument(url=page_urls[1], title="Blog page 2", content=listing + " Next page"),
+        ScrapedDocument(url=page_urls[2], title="About", content="SightCall makes video support simple."),
+    ]
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml_for(["https://sightcall.com/page-sitemap.xml"]),
+        "https://sightcall.com/page-sitemap.xml": urlset_xml(page_urls),
+        **{url: url for url in page_urls},
+    }
+    storage = fake_scraped_document_storage()
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(
+            fake_content_fetcher(responses),
+            FakeDocumentParserFor({document.url: document for document in documents}),
+            ConcurrencyLimits(max_concurrent_requests=1),
+        ),
+        storage,
+        near_duplicate_filter=near_duplicate_filter,
+    )
+    return use_case, storage, documents
+
+
+@pytest.mark.asyncio
+async def test_should_link_near_duplicate_documents_to_the_first_one_scraped(
+    fake_content_fetcher,
+    fake_scraped_document_storage,
+):
+    # Given: two blog listing pages that are nearly identical, and an unrelated page
+    use_case, storage, documents = near_duplicate_scrape(
+        fake_content_fetcher, fake_scraped_document_storage, LinkingNearDuplicateFilter(similar_at_80_percent)
+    )
+
+    # When: executing the use case
+    summary = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+
+    # Then: every page is stored, the second listing page pointing at the first one
+    assert [(document.url, document.duplicate_of) for document in sorted_by_url(storage.saved_documents)] == [
+        ("https://sightcall.com/about", None),
+        ("https://sightcall.com/blog/", None),
+        ("https://sightcall.com/blog/page/2", "https://sightcall.com/blog/"),
+    ]
+    assert summary.near_duplicate_document_count == 1
+    assert summary.scraped_document_count == len(documents)
+
+
+@pytest.mark.asyncio
+async def test_should_drop_near_duplicate_documents_when_asked_to(
+    fake_content_fetcher,
+    fake_scraped_document_storage,
+):
+    # Given: two blog listing pages that are nearly identical, and an unrelated page
+    use_case, storage, documents = near_duplicate_scrape(
+        fake_content_fetcher, fake_scraped_document_storage, DroppingNearDuplicateFilter(similar_at_80_percent)
+    )
+
+    # When: executing the use case
+    summary = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+
+    # Then: the second listing page is not stored
+    assert sorted_by_url(storage.saved_documents) == [documents[2], documents[0]]
+    assert summary.near_duplicate_document_count == 1
+    assert summary.scraped_document_count == 2
+
+
+@pytest.mark.asyncio
+async def test_should_record_per_stage_metrics_and_failures_by_cause(
+    fake_document_parser,
+    fake_scraped_document_storage,
+    sitemap_index_xml,
+    post_sitemap_xml,
+    page_sitemap_xml,
+    html_responses,
+    rag_responses,
+    monkeypatch,
+):
+    # Given: a fetcher for which the about page is always throttled
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml,
+        "https://sightcall.com/post-sitemap.xml": post_sitemap_xml,
+        "https://sightcall.com/page-sitemap.xml": page_sitemap_xml,
+        "https://sightcall.com/blog/": html_responses["https://sightcall.com/blog/"],
+    }
+
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            if url not in responses:
+                raise ThrottledError(url)
+            return responses[url]
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    metrics_recorder = InMemoryMetricsRecorder()
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(FakeContentFetcher(), fake_document_parser(rag_responses), None, None, metrics_recorder),
+        fake_scraped_document_storage(),
+    )
+
+    # When: executing the use case
+    await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+
+    # Then: every stage is timed and the throttled page is counted as retried then failed
+    histograms = metrics_recorder.histograms
+    assert histograms["discovery_duration_seconds"].count == 3
+    assert histograms["fetch_duration_seconds"].count == 1 + MAX_RETRY_ATTEMPTS
+    assert histograms["parse_duration_seconds"].count == 1
+    assert histograms["store_duration_seconds"].count == 1
+    assert metrics_recorder.counter_value("urls_discovered") == 2
+    assert metrics_recorder.counter_value("documents_stored") == 1
+    assert metrics_recorder.counter_value("retries", {"stage": "page", "cause": "ThrottledError"}) == (
+        MAX_RETRY_ATTEMPTS - 1
+    )
+    assert metrics_recorder.counter_value("failures", {"stage": "page", "cause": "ThrottledError"}) == 1
+
+
+@pytest.mark.asyncio
+async def test_should_stream_scraped_documents_without_storing_them(
+    fake_content_fetcher,
+    fake_document_parser,
+    fake_scraped_document_storage,
+    sitemap_index_xml,
+    post_sitemap_xml,
+    page_sitemap_xml,
+    html_responses,
+    rag_responses,
+):
+    # Given: a sitemap index with two pages
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml,
+        "https://sightcall.com/post-sitemap.xml": post_sitemap_xml,
+        "https://sightcall.com/page-sitemap.xml": page_sitemap_xml,
+        **html_responses,
+    }
+    use_case, storage = create_use_case(
+        fake_content_fetcher, fake_document_parser, fake_scraped_document_storage, responses, rag_responses
+    )
+
+    # When: streaming the scraped documents
+    documents = [document async for document in use_case.stream("https://sightcall.com/sitemap_index.xml")]
+
+    # Then: every document is yielded and none goes through the storage
+    assert sorted_by_url(documents) == sorted_by_url(expected_documents(rag_responses, html_responses))
+    assert storage.saved_documents == []
+
+
+@pytest.mark.asyncio
+async def test_should_stream_a_document_before_the_other_pages_are_scraped(
+    fake_document_parser,
+    fake_scraped_document_storage,
+    sitemap_index_xml,
+    post_sitemap_xml,
+    page_sitemap_xml,
+    html_responses,
+    rag_responses,
+):
+    # Given: a fetcher that blocks on the about page until it is released
+    responses = {
+        "https://sightcall.com/sitemap_index.xml": sitemap_index_xml,
+        "https://sightcall.com/post-sitemap.xml": post_sitemap_xml,
+        "https://sightcall.com/page-sitemap.xml": page_sitemap_xml,
+        **html_responses,
+    }
+    about_page_released = asyncio.Event()
+
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            if url == "https://sightcall.com/about":
+                await about_page_released.wait()
+            return responses[url]
+
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(FakeContentFetcher(), fake_document_parser(rag_responses)), fake_scraped_document_storage()
+    )
+    documents = use_case.stream("https://sightcall.com/sitemap_index.xml")
+
+    # When: waiting for the first streamed document
+    first_document = await asyncio.wait_for(anext(documents), 1)
+    about_page_released.set()
+    other_documents = [document async for document in documents]
+
+    # Then: the blog page came out while the about page was still in flight
+    assert first_document.url == "https://sightcall.com/blog/"
+    assert [document.url for document in other_documents] == ["https://sightcall.com/about"]
+
+
+@pytest.mark.asyncio
+async def test_should_stop_scraping_and_release_resources_when_the_stream_is_closed(fake_scraped_document_storage):
+    # Given: a sitemap with many pages and a fetcher that tracks its requests
+    sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    page_urls = [f"https://sightcall.com/page-{index}" for index in range(200)]
+    fetched_urls: List[str] = []
+    is_closed = False
+
+    class FakeContentFetcher(ContentFetcher):
+        async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+            nonlocal is_closed
+            is_closed = True
+
+        async def fetch(self, url):
+            fetched_urls.append(url)
+            await asyncio.sleep(0)
+            return urlset_xml(page_urls) if url == sitemap_url else url
+
+    documents = {url: ScrapedDocument(url=url, title="Page", content=url) for url in page_urls}
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(FakeContentFetcher(), FakeDocumentParserFor(documents)), fake_scraped_document_storage()
+    )
+
+    # When: the caller stops after the first document
+    async with contextlib.aclosing(use_case.stream(sitemap_url)) as stream:
+        async for _ in stream:
+            break
+    fetched_url_count = len(fetched_urls)
+    await asyncio.sleep(0.01)
+
+    # Then: the fetcher is closed, nothing is fetched any more and most pages were never requested
+    assert is_closed
+    assert len(fetched_urls) == fetched_url_count
+    assert fetched_url_count < len(page_urls)
+
+
+@pytest.mark.asyncio
+async def test_should_only_journal_streamed_pages_once_the_caller_asks_for_more(fake_scraped_document_storage):
+    # Given: a journaled scrape of a single page
+    sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    page_url = "https://sightcall.com/page"
+    responses = {sitemap_url: urlset_xml([page_url]), page_url: page_url}
+    run_journal = FakeRunJournal()
+    document = ScrapedDocument(url=page_url, title="Page", content="Content")
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(fake_content_fetcher_for(responses), FakeDocumentParserFor({page_url: document})),
+        fake_scraped_document_storage(),
+        page_recorder=RunJournalRecorder(run_journal),
+    )
+    documents = use_case.stream(sitemap_url)
+
+    # When: receiving the page, then asking for the next one
+    await anext(documents)
+    completed_urls_while_handled = list(run_journal.completed_urls)
+    remaining_documents = [document async for document in documents]
+
+    # Then: the page is only journaled as done once the caller is finished with it
+    assert completed_urls_while_handled == []
+    assert remaining_documents == []
+    assert run_journal.completed_urls == [page_url]
+
+
+def two_site_responses(pages_per_site: int) -> Tuple[dict[str, str], dict[str, ScrapedDocument]]:
+    responses: dict[str, str] = {}
+    documents: dict[str, ScrapedDocument] = {}
+    for host in ("sightcall.com", "example.com"):
+        page_urls = [f"https://{host}/page-{index}" for index in range(pages_per_site)]
+        responses[f"https://{host}/sitemap_index.xml"] = sitemap_index_xml_for([f"https://{host}/page-sitemap.xml"])
+        responses[f"https://{host}/page-sitemap.xml"] = urlset_xml(page_urls)
+        for url in page_urls:
+            responses[url] = url
+            documents[url] = ScrapedDocument(url=url, title="Page", content=url)
+    return responses, documents
+
+
+@pytest.mark.asyncio
+async def test_should_scrape_several_sites_in_one_run(fake_scraped_document_storage):
+    # Given: two sites with their own sitemap index
+    responses, documents = two_site_responses(pages_per_site=3)
+    storage = fake_scraped_document_storage()
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(fake_content_fetcher_for(responses), FakeDocumentParserFor(documents)), storage
+    )
+
+    # When: scraping both sites
+    summary = await use_case.execute(
+        ["https://sightcall.com/sitemap_index.xml", "https://example.com/sitemap_index.xml"], lambda _: None
+    )
+
+    # Then: the pages of both sites are stored
+    assert summary.scraped_document_count == 6
+    assert sorted(document.url for document in storage.saved_documents) == sorted(documents)
+
+
+@pytest.mark.asyncio
+async def test_should_keep_scraping_a_site_while_another_one_is_at_its_host_limit(fake_scraped_document_storage):
+    # Given: a first site whose pages hang until every page of the second site was fetched
+    responses, documents = two_site_responses(pages_per_site=5)
+    example_pages_fetched: List[str] = []
+    every_example_page_fetched = asyncio.Event()
+    sightcall_in_flight = 0
+    max_sightcall_in_flight = 0
+
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            nonlocal sightcall_in_flight, max_sightcall_in_flight
+            if url.startswith("https://sightcall.com/page-") and "sitemap" not in url:
+                sightcall_in_flight += 1
+                max_sightcall_in_flight = max(max_sightcall_in_flight, sightcall_in_flight)
+                await every_example_page_fetched.wait()
+                sightcall_in_flight -= 1
+            elif url.startswith("https://example.com/page-") and "sitemap" not in url:
+                example_pages_fetched.append(url)
+                if len(example_pages_fetched) == 5:
+                    every_example_page_fetched.set()
+            return responses[url]
+
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(
+            FakeContentFetcher(),
+            FakeDocumentParserFor(documents),
+            ConcurrencyLimits(
+                max_concurrent_requests=4, min_concurrent_requests=2, max_concurrent_requests_per_host=2
+            ),
+        ),
+        fake_scraped_document_storage(),
+    )
+
+    # When: scraping both sites
+    summary = await asyncio.wait_for(
+        use_case.execute(
+            ["https://sightcall.com/sitemap_index.xml", "https://example.com/sitemap_index.xml"], lambda _: None
+        ),
+        1,
+    )
+
+    # Then: the second site was not queued behind the first one, which never got more than its share
+    assert summary.scraped_document_count == 10
+    assert max_sightcall_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_should_scrape_the_other_sites_when_one_sitemap_index_is_unreachable(
+    fake_scraped_document_storage, monkeypatch
+):
+    # Given: two sites, the first of which never serves its sitemap index
+    responses, documents = two_site_responses(pages_per_site=2)
+    del responses["https://sightcall.com/sitemap_index.xml"]
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(fake_content_fetcher_for(responses), FakeDocumentParserFor(documents)),
+        fake_scraped_document_storage(),
+    )
+
+    # When: scraping both sites
+    summary = await use_case.execute(
+        ["https://sightcall.com/sitemap_index.xml", "https://example.com/sitemap_index.xml"], lambda _: None
+    )
+
+    # Then: the reachable site is scraped anyway, and the unreachable index is reported
+    assert summary.scraped_document_count == 2
+    assert summary.failed_sitemap_index_urls == ["https://sightcall.com/sitemap_index.xml"]
+    assert not summary.is_every_sitemap_index_failed
+
+
+@pytest.mark.asyncio
+async def test_should_report_when_every_sitemap_index_is_unreachable(fake_scraped_document_storage, monkeypatch):
+    # Given: a site that never serves its sitemap index
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(fake_content_fetcher_for({}), FakeDocumentParserFor({})), fake_scraped_document_storage()
+    )
+
+    # When: scraping it
+    summary = await use_case.execute("https://sightcall.com/sitemap_index.xml", lambda _: None)
+
+    # Then: the failure is in the summary instead of passing for an empty site
+    assert summary.is_every_sitemap_index_failed
+    assert summary.failed_sitemap_index_urls == ["https://sightcall.com/sitemap_index.xml"]
+    assert summary.scraped_document_count == 0
+
+
+def linked_site() -> Tuple[dict[str, str], dict[str, ScrapedDocument]]:
+    # Only the home page is in the sitemap: the others are found through its links, two levels deep.
+    sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    links = {
+        "https://sightcall.com/": ["https://sightcall.com/about", "https://other.com/page"],
+        "https://sightcall.com/about": ["https://sightcall.com/", "https://sightcall.com/team"],
+        "https://sightcall.com/team": [],
+    }
+    responses = {sitemap_url: urlset_xml(["https://sightcall.com/"]), **{url: url for url in links}}
+    documents = {
+        url: ScrapedDocument(url=url, title="Page", content=url, links=page_links) for url, page_links in links.items()
+    }
+    return responses, documents
+
+
+@pytest.mark.asyncio
+async def test_should_scrape_same_site_pages_missing_from_the_sitemaps_when_crawling(
+    fake_scraped_document_storage, fake_crawl_frontier
+):
+    # Given: a site whose sitemap only lists the home page
+    responses, documents = linked_site()
+    content_fetcher = fake_content_fetcher_for(responses)
+    storage = fake_scraped_document_storage()
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(content_fetcher, FakeDocumentParserFor(documents)),
+        storage,
+        CrawlUrlDiscovery(SitemapUrlDiscovery(content_fetcher), fake_crawl_frontier()),
+    )
+
+    # When: crawling it
+    summary = await use_case.execute("https://sightcall.com/page-sitemap.xml", lambda _: None)
+
+    # Then: every page linked from the site is scraped once, and the other site is left alone
+    assert sorted(document.url for document in storage.saved_documents) == sorted(documents)
+    assert summary.crawled_url_count == 2
+
+
+@pytest.mark.asyncio
+async def test_should_stop_crawling_at_max_depth_and_max_urls(fake_scraped_document_storage, fake_crawl_frontier):
+    # Given: a site whose deepest page is two links away from the sitemap
+    responses, documents = linked_site()
+    content_fetcher = fake_content_fetcher_for(responses)
+    shallow_storage = fake_scraped_document_storage()
+    limited_storage = fake_scraped_document_storage()
+
+    # When: crawling it one link deep, then two pages at most
+    await ScrapeSightCallWebsite(
+        PageScraper(content_fetcher, FakeDocumentParserFor(documents)),
+        shallow_storage,
+        CrawlUrlDiscovery(SitemapUrlDiscovery(content_fetcher), fake_crawl_frontier(), max_crawl_depth=1),
+    ).execute("https://sightcall.com/page-sitemap.xml", lambda _: None)
+    await ScrapeSightCallWebsite(
+        PageScraper(content_fetcher, FakeDocumentParserFor(documents)),
+        limited_storage,
+        CrawlUrlDiscovery(SitemapUrlDiscovery(content_fetcher), fake_crawl_frontier()),
+    ).execute("https://sightcall.com/page-sitemap.xml", lambda _: None, max_urls=2)
+
+    # Then: the crawl stops short of the team page both times
+    expected_urls = ["https://sightcall.com/", "https://sightcall.com/about"]
+    assert sorted(document.url for document in shallow_storage.saved_documents) == expected_urls
+    assert sorted(document.url for document in limited_storage.saved_documents) == expected_urls
+
+
+@pytest.mark.asyncio
+async def test_should_journal_pages_found_by_following_links(fake_scraped_document_storage, fake_crawl_frontier):
+    # Given: a crawl journaling its progress
+    responses, documents = linked_site()
+    content_fetcher = fake_content_fetcher_for(responses)
+    run_journal = FakeRunJournal()
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(content_fetcher, FakeDocumentParserFor(documents)),
+        fake_scraped_document_storage(),
+        CrawlUrlDiscovery(SitemapUrlDiscovery(content_fetcher), fake_crawl_frontier()),
+        RunJournalRecorder(run_journal),
+    )
+
+    # When: crawling the site
+    await use_case.execute("https://sightcall.com/page-sitemap.xml", lambda _: None)
+
+    # Then: pages found through links are journaled like sitemap pages
+    assert sorted(run_journal.discovered_urls) == sorted(documents)
+    assert sorted(run_journal.completed_urls) == sorted(documents)
+
+
+@pytest.mark.asyncio
+async def test_should_count_skipped_pages_apart_from_failures_without_retrying_them(fake_scraped_document_storage):
+    # Given: a sitemap listing a page and a PDF the fetcher refuses to download
+    sitemap_url = "https://sightcall.com/page-sitemap.xml"
+    page_url = "https://sightcall.com/page"
+    pdf_url = "https://sightcall.com/brochure.pdf"
+    fetched_urls: List[str] = []
+
+    class FakeContentFetcher(ContentFetcher):
+        async def fetch(self, url):
+            fetched_urls.append(url)
+            if url == pdf_url:
+                raise SkippedResponseError(url, "content_type", "content type application/pdf is not HTML")
+            return urlset_xml([page_url, pdf_url]) if url == sitemap_url else url
+
+    run_journal = FakeRunJournal()
+    metrics_recorder = InMemoryMetricsRecorder()
+    document = ScrapedDocument(url=page_url, title="Page", content="Content")
+    use_case = ScrapeSightCallWebsite(
+        PageScraper(FakeContentFetcher(), FakeDocumentParserFor({page_url: document}), None, None, metrics_recorder),
+        fake_scraped_document_storage(),
+        page_recorder=RunJournalRecorder(run_journal),
+    )
+
+    # When: executing the use case
+    summary = await use_case.execute(sitemap_url, lambda _: None)
+
+    # Then: the PDF was requested once, and is reported as skipped rather than failed
+    assert fetched_urls.count(pdf_url) == 1
+    assert summary.skipped_url_count == 1
+    assert summary.failed_urls == []
+    assert sorted(run_journal.completed_urls) == sorted([page_url, pdf_url])
+    assert metrics_recorder.counter_value("skipped_pages", {"reason": "content_type"}) == 1
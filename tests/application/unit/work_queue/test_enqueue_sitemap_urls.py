@@ -0,0 +1,45 @@
+import pytest
+
+from sightcall_scraping.application.discovery.sitemap_url_discovery import SitemapUrlDiscovery
+from sightcall_scraping.application.work_queue.enqueue_sitemap_urls import EnqueueSitemapUrls
+
+SITEMAP_URL = "https://sightcall.com/page-sitemap.xml"
+PAGE_URLS = [f"https://sightcall.com/page-{index}" for index in range(3)]
+
+
+def urlset_xml(page_urls: list[str]) -> str:
+    urls = "".join(f"<url><loc>{url}</loc></url>" for url in page_urls)
+    return f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+
+
+@pytest.mark.asyncio
+async def test_should_only_enqueue_the_sitemap_pages_for_the_workers(fake_content_fetcher, fake_work_queue):
+    # Given: a sitemap of three pages and an empty work queue
+    content_fetcher = fake_content_fetcher({SITEMAP_URL: urlset_xml(PAGE_URLS)})
+    work_queue = fake_work_queue()
+    use_case = EnqueueSitemapUrls(SitemapUrlDiscovery(content_fetcher), work_queue)
+
+    # When: enqueuing at most two of its pages
+    summary = await use_case.execute(SITEMAP_URL, max_urls=2)
+
+    # Then: the pages are queued, not scraped, and the workers are told no more are coming
+    assert [url.value for url in work_queue.pending_urls] == PAGE_URLS[:2]
+    assert work_queue.is_adding_finished
+    assert summary.scraped_document_count == 0
+
+
+@pytest.mark.asyncio
+async def test_should_tell_the_workers_no_more_pages_are_coming_when_the_sitemap_is_unreachable(
+    fake_content_fetcher, fake_work_queue
+):
+    # Given: a sitemap index that cannot be fetched
+    work_queue = fake_work_queue()
+    use_case = EnqueueSitemapUrls(SitemapUrlDiscovery(fake_content_fetcher({})), work_queue)
+
+    # When: enqueuing its pages
+    summary = await use_case.execute(SITEMAP_URL)
+
+    # Then: nothing is queued, and the workers stop waiting for pages
+    assert work_queue.pending_urls == []
+    assert work_queue.is_adding_finished
+    assert summary.failed_sitemap_index_urls == [SITEMAP_URL]
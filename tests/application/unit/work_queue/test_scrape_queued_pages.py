@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from sightcall_scraping.application.page_scraping.concurrency_limits import ConcurrencyLimits
+from sightcall_scraping.application.page_scraping.page_scraper import PageScraper
+from sightcall_scraping.application.work_queue.scrape_queued_pages import ScrapeQueuedPages
+from sightcall_scraping.domain.errors import SkippedResponseError
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.domain.ports.document_parser import DocumentParser
+
+PAGE_URLS = [f"https://sightcall.com/page-{index}" for index in range(10)]
+PDF_URL = "https://sightcall.com/brochure.pdf"
+
+
+class PagesContentFetcher(ContentFetcher):
+    async def fetch(self, url: str) -> str:
+        await asyncio.sleep(0)
+        if url == PDF_URL:
+            raise SkippedResponseError(url, "content_type", "content type application/pdf is not HTML")
+        return url
+
+
+class PagesDocumentParser(DocumentParser):
+    def to_scraped_document(self, url: str, raw: str) -> ScrapedDocument:
+        return ScrapedDocument(url=url, title="Page", content=raw)
+
+
+@pytest.mark.asyncio
+async def test_should_share_the_queued_pages_between_workers(fake_scraped_document_storage, fake_work_queue):
+    # Given: two workers sharing a queue of pages, one of which is skipped
+    work_queue = fake_work_queue([*PAGE_URLS, PDF_URL])
+    storages = [fake_scraped_document_storage() for _ in range(2)]
+    workers = [
+        ScrapeQueuedPages(
+            PageScraper(PagesContentFetcher(), PagesDocumentParser(), ConcurrencyLimits(max_concurrent_requests=2)),
+            storage,
+            work_queue,
+        )
+        for storage in storages
+    ]
+
+    # When: both workers run
+    summaries = await asyncio.gather(*(worker.execute(lambda _: None) for worker in workers))
+
+    # Then: every page is scraped once, by one worker or the other, and all of them are done in the queue
+    stored_urls = [document.url for storage in storages for document in storage.saved_documents]
+    assert sorted(stored_urls) == sorted(PAGE_URLS)
+    assert all(storage.saved_documents for storage in storages)
+    assert sum(summary.skipped_url_count for summary in summaries) == 1
+    assert sorted(work_queue.completed_urls) == sorted([*PAGE_URLS, PDF_URL])
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from sightcall_scraping.application.work_queue.work_queue_consumer import POLL_INTERVAL_SECONDS, WorkQueueConsumer
+from sightcall_scraping.domain.models.url import Url
+
+
+def values_of(urls: list[Url]) -> list[str]:
+    return [url.value for url in urls]
+
+
+@pytest.mark.asyncio
+async def test_should_claim_more_pages_only_once_half_the_claimed_ones_are_finished(fake_work_queue):
+    # Given: a consumer holding at most four pages
+    work_queue = fake_work_queue([f"https://sightcall.com/{index}" for index in range(10)])
+    consumer = WorkQueueConsumer(work_queue, max_claimed_urls=4)
+    first_claim = await consumer.next_urls()
+
+    # When: one page is finished, then another
+    next_claim = asyncio.create_task(consumer.next_urls())
+    consumer.finish()
+    await asyncio.sleep(0)
+    is_waiting_after_one_page = not next_claim.done()
+    consumer.finish()
+
+    # Then: the pages are claimed in batches of two at least
+    assert len(first_claim) == 4
+    assert is_waiting_after_one_page
+    assert values_of(await next_claim) == ["https://sightcall.com/4", "https://sightcall.com/5"]
+
+
+@pytest.mark.asyncio
+async def test_should_poll_for_pages_still_being_added_until_the_queue_is_drained(fake_work_queue):
+    # Given: a queue still being filled by the sitemap walk
+    work_queue = fake_work_queue()
+    sleeps: list[float] = []
+
+    async def add_page_while_sleeping(seconds: float) -> None:
+        sleeps.append(seconds)
+        await work_queue.add([Url("https://sightcall.com/late")])
+        await work_queue.finish_adding()
+
+    consumer = WorkQueueConsumer(work_queue, max_claimed_urls=4, sleep=add_page_while_sleeping)
+
+    # When: consuming it
+    first_claim = await consumer.next_urls()
+    second_claim = await consumer.next_urls()
+
+    # Then: the consumer polls until the page arrives, and stops once nothing is left
+    assert sleeps == [POLL_INTERVAL_SECONDS]
+    assert values_of(first_claim) == ["https://sightcall.com/late"]
+    assert second_claim == []
@@ -1,7 +1,10 @@
 from .fixtures import (
     fake_content_fetcher,  # noqa: F401
+    fake_crawl_frontier,  # noqa: F401
     fake_document_parser,  # noqa: F401
     fake_scraped_document_storage,  # noqa: F401
+    fake_url_state_store,  # noqa: F401
+    fake_work_queue,  # noqa: F401
     html_responses,  # noqa: F401
     page_sitemap_xml,  # noqa: F401
     post_sitemap_xml,  # noqa: F401
@@ -0,0 +1,81 @@
+from sightcall_scraping.domain.boilerplate_detector import DEFAULT_SHINGLE_SIZE, BoilerplateDetector
+
+MENU = "Home Products Solutions Pricing Resources Blog Contact Us Request a demo"
+FOOTER = "Copyright 2025 SightCall All rights reserved Privacy Policy Terms of Service"
+
+
+def page(body: str) -> str:
+    return f"{MENU} {body} {FOOTER}"
+
+
+def detector_trained_on(contents: list[str], **kwargs) -> BoilerplateDetector:
+    boilerplate_detector = BoilerplateDetector(**kwargs)
+    for content in contents:
+        boilerplate_detector.learn(content)
+    return boilerplate_detector
+
+
+def test_should_remove_text_repeated_across_most_documents():
+    # Given pages sharing a menu and a footer
+    bodies = [
+        "Remote video assistance helps field technicians fix equipment faster than ever before.",
+        "Our augmented reality platform guides customers through complex product installations.",
+        "Insurance adjusters can now inspect claims remotely using a smartphone camera stream.",
+    ]
+    boilerplate_detector = detector_trained_on([page(body) for body in bodies])
+
+    # When removing boilerplate from one of them
+    content = boilerplate_detector.remove_boilerplate(page(bodies[0]))
+
+    # Then only its own text is kept
+    assert content == bodies[0]
+
+
+def test_should_keep_text_shared_by_fewer_documents_than_the_threshold():
+    # Given a quote appearing in one page out of four
+    quote = "The best way to predict the future is to invent it said someone"
+    contents = [page(f"Body number {index} talks about something else entirely.") for index in range(3)]
+    contents.append(page(quote))
+    boilerplate_detector = detector_trained_on(contents, threshold=0.5)
+
+    # When removing boilerplate from that page
+    content = boilerplate_detector.remove_boilerplate(page(quote))
+
+    # Then the quote survives
+    assert content == quote
+
+
+def test_should_not_remove_anything_below_the_minimum_document_count():
+    # Given two identical pages, fewer than the minimum document count
+    boilerplate_detector = detector_trained_on([page("Same body."), page("Same body.")], min_document_count=3)
+
+    # When removing boilerplate
+    content = boilerplate_detector.remove_boilerplate(page("Same body."))
+
+    # Then the content is untouched
+    assert content == page("Same body.")
+
+
+def test_should_preserve_original_whitespace_of_untouched_content():
+    # Given a document whose text is unique
+    content = "Line one\nline   two of a document that has nothing in common with others"
+    boilerplate_detector = detector_trained_on([content, "a b c d e f g h i j", "k l m n o p q r s t"])
+
+    # When removing boilerplate
+    # Then the content is returned unchanged
+    assert boilerplate_detector.remove_boilerplate(content) == content
+
+
+def test_should_forget_rare_text_while_keeping_boilerplate_on_large_corpora():
+    # Given a thousand pages sharing a footer, each with a body of its own
+    contents = [
+        f"Page {index} body {index} words {index} unique {index} here {index} {FOOTER}" for index in range(1000)
+    ]
+
+    # When learning them
+    boilerplate_detector = detector_trained_on(contents, max_frequency_error=0.01)
+
+    # Then only the footer's shingles are still tracked, and it is still removed
+    footer_shingle_count = len(FOOTER.split()) - DEFAULT_SHINGLE_SIZE + 1
+    assert boilerplate_detector.tracked_shingle_count == footer_shingle_count
+    assert boilerplate_detector.remove_boilerplate(contents[0]) == "Page 0 body 0 words 0 unique 0 here 0"
@@ -1,3 +1,9 @@
+import gzip
+from datetime import datetime, timezone
+
+import pytest
+
+from sightcall_scraping.domain.errors import InvalidSitemapError
 from sightcall_scraping.domain.models.url import Url
 from sightcall_scraping.domain.sitemap_parser import SitemapParser
 
@@ -20,3 +26,59 @@ def test_sitemap_parser_returns_all_sitemap_urls_from_index(sitemap_index_xml):
         Url("https://sightcall.com/page-sitemap.xml"),
     ]
     assert sitemap_urls == expected_sitemap_urls
+
+
+def test_incremental_sitemap_parser_emits_urls_fed_byte_by_byte(sitemap_xml):
+    parser = SitemapParser().incremental()
+    entries = []
+
+    for byte in sitemap_xml.encode("utf-8"):
+        entries.extend(parser.feed(bytes([byte])))
+    entries.extend(parser.close())
+
+    assert [entry.url for entry in entries] == [
+        Url("https://sightcall.com/blog/"),
+        Url("https://sightcall.com/blog/telecom-embrace-api-fication-trend-new-revenue/"),
+    ]
+    assert not any(entry.is_sitemap for entry in entries)
+
+
+def test_sitemap_parser_flags_entries_of_a_sitemap_index(sitemap_index_xml):
+    entries = list(SitemapParser().iter_entries([sitemap_index_xml.encode("utf-8")]))
+
+    assert all(entry.is_sitemap for entry in entries)
+
+
+def test_sitemap_parser_decompresses_gzip_sitemaps_on_the_fly(sitemap_xml):
+    compressed = gzip.compress(sitemap_xml.encode("utf-8"))
+    chunks = [compressed[i : i + 16] for i in range(0, len(compressed), 16)]
+
+    urls = [entry.url for entry in SitemapParser().iter_entries(chunks)]
+
+    assert urls == SitemapParser().parse(sitemap_xml)
+
+
+def test_sitemap_parser_reads_lastmod_of_each_url(sitemap_xml):
+    parser = SitemapParser()
+    urls = parser.parse(sitemap_xml)
+    assert [url.lastmod for url in urls] == [
+        datetime(2025, 5, 14, 21, 48, 38, tzinfo=timezone.utc),
+        datetime(2024, 7, 9, 16, 36, 57, tzinfo=timezone.utc),
+    ]
+
+
+def test_sitemap_parser_ignores_invalid_lastmod():
+    parser = SitemapParser()
+    urls = parser.parse(
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        "<url><loc>https://sightcall.com/a</loc><lastmod>yesterday</lastmod></url>"
+        "</urlset>"
+    )
+    assert urls == [Url("https://sightcall.com/a")]
+    assert urls[0].lastmod is None
+
+
+def test_sitemap_parser_raises_invalid_sitemap_error_on_malformed_xml():
+    parser = SitemapParser()
+    with pytest.raises(InvalidSitemapError):
+        parser.parse("<urlset><url><loc>https://sightcall.com/a</loc></urlset>")
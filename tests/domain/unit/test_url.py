@@ -0,0 +1,43 @@
+import pytest
+
+from sightcall_scraping.domain.models.url import Url
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        "https://sightcall.com/blog",
+        "https://sightcall.com/blog/",
+        "HTTPS://SightCall.com/blog",
+        "https://sightcall.com:443/blog",
+        "https://sightcall.com/blog#comments",
+        " https://sightcall.com/blog ",
+    ],
+)
+def test_url_variants_of_the_same_page_are_equal(variant):
+    assert Url(variant) == Url("https://sightcall.com/blog/")
+    assert hash(Url(variant)) == hash(Url("https://sightcall.com/blog/"))
+
+
+def test_url_query_parameters_order_does_not_matter():
+    assert Url("https://sightcall.com/search?q=video&page=2") == Url("https://sightcall.com/search?page=2&q=video")
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        "https://sightcall.com/Blog",
+        "http://sightcall.com/blog",
+        "https://sightcall.com:8443/blog",
+        "https://sightcall.com/blog?page=2",
+    ],
+)
+def test_urls_of_different_pages_are_not_equal(other):
+    assert Url(other) != Url("https://sightcall.com/blog")
+
+
+def test_url_keeps_its_original_value_for_fetching():
+    url = Url("HTTPS://SightCall.com/blog/#comments")
+
+    assert url.value == "HTTPS://SightCall.com/blog/#comments"
+    assert url.canonical_value == "https://sightcall.com/blog"
@@ -1,15 +1,28 @@
+from typing import Optional
+
 import pytest
 
+from sightcall_scraping.domain.errors import FetchError
 from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.domain.models.url_state import UrlState
+from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.domain.ports.crawl_frontier import CrawlFrontier
+from sightcall_scraping.domain.ports.document_parser import DocumentParser
+from sightcall_scraping.domain.ports.scraped_document_storage import ScrapedDocumentStorage
+from sightcall_scraping.domain.ports.url_state_store import UrlStateStore
+from sightcall_scraping.domain.ports.work_queue import WorkQueue
 
 
 @pytest.fixture(scope="function")
 def fake_content_fetcher():
-    class FakeContentFetcher:
+    class FakeContentFetcher(ContentFetcher):
         def __init__(self, responses):
             self._responses = responses
 
         async def fetch(self, uri: str) -> str:
+            if uri not in self._responses:
+                raise FetchError(uri, "404 Not Found")
             return self._responses[uri]
 
     return FakeContentFetcher
@@ -17,7 +30,7 @@ def fake_content_fetcher():
 
 @pytest.fixture(scope="function")
 def fake_document_parser():
-    class FakeDocumentParser:
+    class FakeDocumentParser(DocumentParser):
         def __init__(self, responses):
             self._responses = responses
 
@@ -29,7 +42,7 @@ def fake_document_parser():
 
 @pytest.fixture(scope="function")
 def fake_scraped_document_storage():
-    class FakeScrapedDocumentStorage:
+    class FakeScrapedDocumentStorage(ScrapedDocumentStorage):
         def __init__(self):
             self.saved_documents: list[ScrapedDocument] = []
 
@@ -39,6 +52,76 @@ def fake_scraped_document_storage():
     return FakeScrapedDocumentStorage
 
 
+@pytest.fixture(scope="function")
+def fake_url_state_store():
+    class FakeUrlStateStore(UrlStateStore):
+        def __init__(self, states: Optional[list[UrlState]] = None):
+            self.states: dict[str, UrlState] = {state.url: state for state in states or []}
+
+        async def get(self, url: str) -> Optional[UrlState]:
+            return self.states.get(url)
+
+        async def save_all(self, states: list[UrlState]) -> None:
+            self.states.update((state.url, state) for state in states)
+
+    return FakeUrlStateStore
+
+
+@pytest.fixture(scope="function")
+def fake_crawl_frontier():
+    class FakeCrawlFrontier(CrawlFrontier):
+        def __init__(self):
+            self.depths: dict[str, int] = {}
+            self.pending_urls: list[Url] = []
+
+        async def add(self, urls: list[Url], depth: int) -> int:
+            new_urls = [url for url in dict.fromkeys(urls) if url.canonical_value not in self.depths]
+            for url in new_urls:
+                self.depths[url.canonical_value] = depth
+            self.pending_urls.extend(new_urls)
+            self.pending_urls.sort(key=lambda url: self.depths[url.canonical_value])
+            return len(new_urls)
+
+        async def depth_of(self, url: Url) -> Optional[int]:
+            return self.depths.get(url.canonical_value)
+
+        async def pop(self, limit: int) -> list[Url]:
+            urls, self.pending_urls = self.pending_urls[:limit], self.pending_urls[limit:]
+            return urls
+
+    return FakeCrawlFrontier
+
+
+@pytest.fixture(scope="function")
+def fake_work_queue():
+    class FakeWorkQueue(WorkQueue):
+        def __init__(self, urls: Optional[list[str]] = None):
+            self.pending_urls: list[Url] = [Url(url) for url in urls or []]
+            self.claimed_urls: list[Url] = []
+            self.completed_urls: list[str] = []
+            self.is_adding_finished: bool = urls is not None
+
+        async def add(self, urls: list[Url]) -> int:
+            self.pending_urls.extend(urls)
+            return len(urls)
+
+        async def finish_adding(self) -> None:
+            self.is_adding_finished = True
+
+        async def claim(self, limit: int) -> list[Url]:
+            urls, self.pending_urls = self.pending_urls[:limit], self.pending_urls[limit:]
+            self.claimed_urls.extend(urls)
+            return urls
+
+        async def complete(self, urls: list[Url]) -> None:
+            self.completed_urls.extend(url.value for url in urls)
+
+        async def is_drained(self) -> bool:
+            return self.is_adding_finished and not self.pending_urls
+
+    return FakeWorkQueue
+
+
 @pytest.fixture(scope="function")
 def sitemap_index_xml() -> str:
     return """<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<sitemapindex xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">\n  <sitemap>\n    <loc>https://sightcall.com/post-sitemap.xml</loc>\n  </sitemap>\n  <sitemap>\n    <loc>https://sightcall.com/page-sitemap.xml</loc>\n  </sitemap>\n</sitemapindex>\n"""
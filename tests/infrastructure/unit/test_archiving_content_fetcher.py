@@ -0,0 +1,56 @@
+from typing import AsyncGenerator
+
+import pytest
+
+from sightcall_scraping.domain.models.archived_response import ArchivedResponse
+from sightcall_scraping.domain.ports.content_fetcher import ContentFetcher
+from sightcall_scraping.domain.ports.response_archive import ResponseArchive
+from sightcall_scraping.infrastructure.archiving_content_fetcher import ArchivingContentFetcher
+
+
+class FakeResponseArchive(ResponseArchive):
+    def __init__(self):
+        self.responses: list[ArchivedResponse] = []
+        self.is_open: bool = False
+
+    async def __aenter__(self):
+        self.is_open = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.is_open = False
+
+    async def append(self, response: ArchivedResponse) -> None:
+        self.responses.append(response)
+
+    async def iter_responses(self) -> AsyncGenerator[ArchivedResponse, None]:
+        for response in self.responses:
+            yield response
+
+
+class FakeContentFetcher(ContentFetcher):
+    async def fetch(self, uri: str) -> str:
+        return f"<html>{uri}</html>"
+
+
+@pytest.mark.asyncio
+async def test_should_archive_fetched_pages_but_not_streamed_sitemaps():
+    # Given an archiving fetcher
+    response_archive = FakeResponseArchive()
+    fetcher = ArchivingContentFetcher(FakeContentFetcher(), response_archive)
+
+    # When fetching a page and streaming a sitemap, from nested contexts
+    async with fetcher:
+        async with fetcher:
+            body = await fetcher.fetch("https://sightcall.com/blog/")
+        is_archive_open_after_inner_context = response_archive.is_open
+        chunks = [chunk async for chunk in fetcher.stream("https://sightcall.com/sitemap_index.xml")]
+
+    # Then only the page is archived, and the archive stays open until the outermost context exits
+    assert body == "<html>https://sightcall.com/blog/</html>"
+    assert chunks == [b"<html>https://sightcall.com/sitemap_index.xml</html>"]
+    assert [(response.url, response.body) for response in response_archive.responses] == [
+        ("https://sightcall.com/blog/", body.encode())
+    ]
+    assert is_archive_open_after_inner_context
+    assert not response_archive.is_open
@@ -0,0 +1,71 @@
+import httpx
+import pytest
+
+from sightcall_scraping.infrastructure.caching_content_fetcher import CachingContentFetcher
+from sightcall_scraping.infrastructure.http_content_fetcher import HttpContentFetcher
+from sightcall_scraping.infrastructure.sqlite_http_response_cache import SqliteHttpResponseCache
+
+ETAG: str = '"v1"'
+LAST_MODIFIED: str = "Wed, 14 May 2025 21:48:38 GMT"
+
+
+class FakeOrigin:
+    def __init__(self, pages: dict[str, str], headers: dict[str, str]):
+        self.pages = pages
+        self.headers = headers
+        self.requests: list[httpx.Request] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.headers.get("ETag"):
+            return httpx.Response(304, headers=self.headers)
+        return httpx.Response(200, html=self.pages[str(request.url)], headers=self.headers)
+
+    def create_fetcher(self, cache_path, max_size_bytes: int = 1024 * 1024) -> CachingContentFetcher:
+        return CachingContentFetcher(
+            HttpContentFetcher(transport=httpx.MockTransport(self.handle)),
+            SqliteHttpResponseCache(cache_path, max_size_bytes),
+        )
+
+
+@pytest.mark.asyncio
+async def test_should_serve_cached_body_when_origin_answers_not_modified(tmp_path):
+    # Given: a page fetched during a previous run
+    origin = FakeOrigin({"https://a.test/": "A"}, {"ETag": ETAG, "Last-Modified": LAST_MODIFIED})
+    async with origin.create_fetcher(tmp_path / "cache.sqlite") as fetcher:
+        await fetcher.fetch("https://a.test/")
+
+    # When: fetching it again in a new run
+    async with origin.create_fetcher(tmp_path / "cache.sqlite") as fetcher:
+        text = await fetcher.fetch("https://a.test/")
+
+    # Then: the request was conditional and the cached body is served
+    assert text == "A"
+    assert origin.requests[-1].headers["If-None-Match"] == ETAG
+    assert origin.requests[-1].headers["If-Modified-Since"] == LAST_MODIFIED
+    assert (fetcher.report.hit_count, fetcher.report.miss_count) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_should_refresh_cache_when_page_changed(tmp_path):
+    origin = FakeOrigin({"https://a.test/": "A"}, {"ETag": ETAG})
+    async with origin.create_fetcher(tmp_path / "cache.sqlite") as fetcher:
+        await fetcher.fetch("https://a.test/")
+        origin.pages["https://a.test/"], origin.headers["ETag"] = "B", '"v2"'
+
+        changed_text = await fetcher.fetch("https://a.test/")
+        cached_text = await fetcher.fetch("https://a.test/")
+
+    assert (changed_text, cached_text) == ("B", "B")
+    assert (fetcher.report.hit_count, fetcher.report.miss_count) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_should_not_cache_responses_without_validators(tmp_path):
+    origin = FakeOrigin({"https://a.test/": "A"}, {})
+    async with origin.create_fetcher(tmp_path / "cache.sqlite") as fetcher:
+        await fetcher.fetch("https://a.test/")
+        await fetcher.fetch("https://a.test/")
+
+    assert "If-None-Match" not in origin.requests[-1].headers
+    assert fetcher.report.miss_count == 2
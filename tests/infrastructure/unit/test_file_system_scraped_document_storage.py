@@ -4,18 +4,78 @@ import pytest
 
 from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
 from sightcall_scraping.infrastructure.file_system_scraped_document_storage import FileSystemScrapedDocumentStorage
+from sightcall_scraping.infrastructure.in_memory_metrics_recorder import InMemoryMetricsRecorder
 
 
 @pytest.mark.asyncio
 async def test_should_save_documents_to_file(tmp_path):
     output_file = tmp_path / "scraped_documents.json"
-    storage = FileSystemScrapedDocumentStorage(output_file)
     doc1 = ScrapedDocument(url="http://a", title="A", content="C")
     doc2 = ScrapedDocument(url="http://b", title="B", content="D")
-    await storage.save_all([doc1, doc2])
+    async with FileSystemScrapedDocumentStorage(output_file) as storage:
+        await storage.save_all([doc1, doc2])
     with open(output_file) as f:
         data = json.load(f)
     assert data == [
         {"url": "http://a", "title": "A", "content": "C"},
         {"url": "http://b", "title": "B", "content": "D"},
     ]
+
+
+@pytest.mark.asyncio
+async def test_should_write_the_json_array_once_whatever_the_number_of_batches(tmp_path):
+    # Given: a storage saving many batches
+    output_file = tmp_path / "scraped_documents.json"
+    metrics_recorder = InMemoryMetricsRecorder()
+    async with FileSystemScrapedDocumentStorage(output_file, metrics_recorder=metrics_recorder) as storage:
+        for index in range(100):
+            await storage.save_all([ScrapedDocument(url=f"http://{index}", title="T", content="C" * 100)])
+
+    # When: the storage is closed
+    written_byte_count = metrics_recorder.counter_value("bytes_written")
+
+    # Then: each document is written twice at most, once to the partial output and once to the array
+    assert len(json.loads(output_file.read_text())) == 100
+    assert written_byte_count < 2 * output_file.stat().st_size
+    assert not output_file.with_name(output_file.name + ".partial").exists()
+
+
+@pytest.mark.asyncio
+async def test_should_merge_documents_into_output_of_a_previous_run(tmp_path):
+    # Given: the output of a previous run
+    output_file = tmp_path / "scraped_documents.json"
+    output_file.write_text(
+        json.dumps(
+            [{"url": "http://a", "title": "Old", "content": "Old"}, {"url": "http://b", "title": "B", "content": "D"}]
+        )
+    )
+
+    # When: rescraping one of its documents in merge mode
+    async with FileSystemScrapedDocumentStorage(output_file, merge_existing=True) as storage:
+        await storage.save_all([ScrapedDocument(url="http://a", title="A", content="C")])
+
+    # Then: the rescraped document is replaced and the other one is kept
+    with open(output_file) as f:
+        data = json.load(f)
+    assert data == [
+        {"url": "http://a", "title": "A", "content": "C"},
+        {"url": "http://b", "title": "B", "content": "D"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_keep_the_documents_flushed_by_a_killed_run_when_merging(tmp_path):
+    # Given: a run killed after flushing a document, with half of the next one written
+    output_file = tmp_path / "scraped_documents.json"
+    partial_output_file = output_file.with_name(output_file.name + ".partial")
+    partial_output_file.write_text('{"url": "http://a", "title": "A", "content": "C"}\n{"url": "http://b", "ti')
+
+    # When: resuming it in merge mode
+    async with FileSystemScrapedDocumentStorage(output_file, merge_existing=True) as storage:
+        await storage.save_all([ScrapedDocument(url="http://b", title="B", content="D")])
+
+    # Then: the flushed document is kept and the half-written one is dropped
+    assert json.loads(output_file.read_text()) == [
+        {"url": "http://a", "title": "A", "content": "C"},
+        {"url": "http://b", "title": "B", "content": "D"},
+    ]
@@ -0,0 +1,210 @@
+import asyncio
+
+import httpx
+import pytest
+
+from sightcall_scraping.domain.errors import FetchError, SkippedResponseError, ThrottledError
+from sightcall_scraping.infrastructure.http_content_fetcher import HttpContentFetcher
+from sightcall_scraping.infrastructure.in_memory_metrics_recorder import InMemoryMetricsRecorder
+
+
+def create_transport(pages: dict[str, str], delay_seconds: float = 0.0) -> httpx.MockTransport:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delay_seconds)
+        url = str(request.url)
+        if url not in pages:
+            return httpx.Response(404)
+        return httpx.Response(200, html=pages[url])
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_should_keep_client_open_for_the_whole_context():
+    # Given: a fetcher over a fake transport
+    fetcher = HttpContentFetcher(transport=create_transport({"https://a.test/": "A", "https://a.test/b": "B"}))
+
+    # When: fetching several pages inside one context
+    async with fetcher:
+        first = await fetcher.fetch("https://a.test/")
+        is_open_between_fetches = fetcher.is_open
+        second = await fetcher.fetch("https://a.test/b")
+
+    # Then: the same client served both fetches and is closed on exit
+    assert (first, second) == ("A", "B")
+    assert is_open_between_fetches
+    assert not fetcher.is_open
+
+
+@pytest.mark.asyncio
+async def test_should_only_close_client_when_outermost_context_exits():
+    fetcher = HttpContentFetcher(transport=create_transport({}))
+
+    async with fetcher:
+        async with fetcher:
+            pass
+        assert fetcher.is_open
+
+    assert not fetcher.is_open
+
+
+@pytest.mark.asyncio
+async def test_should_fetch_outside_of_a_context_with_a_short_lived_client():
+    fetcher = HttpContentFetcher(transport=create_transport({"https://a.test/": "A"}))
+
+    content = await fetcher.fetch("https://a.test/")
+
+    assert content == "A"
+    assert not fetcher.is_open
+
+
+@pytest.mark.asyncio
+async def test_should_raise_on_http_error_status():
+    fetcher = HttpContentFetcher(transport=create_transport({}))
+
+    async with fetcher:
+        with pytest.raises(FetchError):
+            await fetcher.fetch("https://a.test/missing")
+
+
+@pytest.mark.asyncio
+async def test_should_not_exceed_connections_per_host():
+    # Given: a transport that tracks how many requests are in flight
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, html="ok")
+
+    fetcher = HttpContentFetcher(max_connections_per_host=2, transport=httpx.MockTransport(handler))
+
+    # When: fetching many pages of the same host concurrently
+    async with fetcher:
+        await asyncio.gather(*(fetcher.fetch(f"https://a.test/{i}") for i in range(10)))
+
+    # Then: at most two requests hit the host at once
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_should_stream_response_body_in_chunks():
+    fetcher = HttpContentFetcher(transport=create_transport({"https://a.test/sitemap.xml": "<urlset/>"}))
+
+    async with fetcher:
+        chunks = [chunk async for chunk in fetcher.stream("https://a.test/sitemap.xml")]
+
+    assert b"".join(chunks) == b"<urlset/>"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [429, 503])
+async def test_should_raise_throttled_error_with_retry_after_on_throttling_status(status_code):
+    fetcher = HttpContentFetcher(
+        transport=httpx.MockTransport(lambda _: httpx.Response(status_code, headers={"Retry-After": "120"}))
+    )
+
+    async with fetcher:
+        with pytest.raises(ThrottledError) as error:
+            await fetcher.fetch("https://a.test/")
+
+    assert error.value.retry_after_seconds == 120
+
+
+@pytest.mark.asyncio
+async def test_should_record_downloaded_bytes_and_response_statuses():
+    # Given: a fetcher recording metrics
+    metrics_recorder = InMemoryMetricsRecorder()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/missing":
+            return httpx.Response(404, stream=httpx.ByteStream(b""))
+        return httpx.Response(200, stream=httpx.ByteStream(b"A" * 100))
+
+    fetcher = HttpContentFetcher(transport=httpx.MockTransport(handler), metrics_recorder=metrics_recorder)
+
+    # When: fetching an existing page and a missing one
+    async with fetcher:
+        await fetcher.fetch("https://a.test/")
+        with pytest.raises(FetchError):
+            await fetcher.fetch("https://a.test/missing")
+
+    # Then: both responses are counted by status, with their bytes
+    assert metrics_recorder.counter_value("http_responses", {"status": "200"}) == 1
+    assert metrics_recorder.counter_value("http_responses", {"status": "404"}) == 1
+    assert metrics_recorder.counter_value("bytes_downloaded") == 100
+
+
+@pytest.mark.asyncio
+async def test_should_skip_responses_that_are_not_html_without_reading_them():
+    # Given: a server answering with a PDF
+    metrics_recorder = InMemoryMetricsRecorder()
+    transport = httpx.MockTransport(
+        lambda _: httpx.Response(
+            200, headers={"Content-Type": "application/pdf"}, stream=httpx.ByteStream(b"%PDF" * 1000)
+        )
+    )
+    fetcher = HttpContentFetcher(transport=transport, metrics_recorder=metrics_recorder)
+
+    # When: fetching it
+    async with fetcher:
+        with pytest.raises(SkippedResponseError) as error:
+            await fetcher.fetch("https://a.test/brochure.pdf")
+
+    # Then: it is skipped as not HTML, and its body was never downloaded
+    assert error.value.reason == "content_type"
+    assert metrics_recorder.counter_value("bytes_downloaded") == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_length_announced", [True, False])
+async def test_should_skip_pages_over_the_size_cap(is_length_announced):
+    # Given: a page of 100 bytes, announced in Content-Length or not, and a 50 bytes cap
+    metrics_recorder = InMemoryMetricsRecorder()
+    body = b"<p>" + b"A" * 97
+
+    async def chunks():
+        for start in range(0, len(body), 10):
+            yield body[start : start + 10]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"Content-Type": "text/html; charset=utf-8"}
+        if is_length_announced:
+            headers["Content-Length"] = str(len(body))
+            return httpx.Response(200, headers=headers, stream=httpx.ByteStream(body))
+        return httpx.Response(200, headers=headers, content=chunks())
+
+    fetcher = HttpContentFetcher(
+        transport=httpx.MockTransport(handler), metrics_recorder=metrics_recorder, max_body_bytes=50
+    )
+
+    # When: fetching it
+    async with fetcher:
+        with pytest.raises(SkippedResponseError) as error:
+            await fetcher.fetch("https://a.test/huge")
+
+    # Then: it is skipped as too large, having downloaded no more than the cap and one chunk
+    assert error.value.reason == "too_large"
+    assert metrics_recorder.counter_value("bytes_downloaded") <= 60
+
+
+@pytest.mark.asyncio
+async def test_should_hand_pages_over_as_raw_bytes_with_their_declared_encoding():
+    # Given: a page served in Latin-1
+    body = "<html>Café</html>".encode("latin-1")
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body, headers={"Content-Type": "text/html; charset=ISO-8859-1"})
+    )
+
+    # When: fetching its response
+    async with HttpContentFetcher(transport=transport) as fetcher:
+        response = await fetcher.fetch_response("https://a.test/fr/")
+
+    # Then: the body is left undecoded, with what is needed to decode it
+    assert (response.url, response.status_code, response.body) == ("https://a.test/fr/", 200, body)
+    assert response.encoding == "iso8859-1"
+    assert response.text == "<html>Café</html>"
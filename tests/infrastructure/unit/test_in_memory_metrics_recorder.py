@@ -0,0 +1,59 @@
+import pytest
+
+from sightcall_scraping.infrastructure.in_memory_metrics_recorder import Histogram, InMemoryMetricsRecorder
+from sightcall_scraping.infrastructure.metrics_exporters import to_prometheus_text
+
+
+def test_should_count_separately_per_label_set():
+    metrics_recorder = InMemoryMetricsRecorder()
+
+    metrics_recorder.increment("failures", labels={"stage": "page", "cause": "ThrottledError"})
+    metrics_recorder.increment("failures", labels={"cause": "ThrottledError", "stage": "page"})
+    metrics_recorder.increment("failures", labels={"stage": "page", "cause": "ConnectError"})
+    metrics_recorder.increment("bytes_downloaded", 1024)
+
+    assert metrics_recorder.counter_value("failures", {"stage": "page", "cause": "ThrottledError"}) == 2
+    assert metrics_recorder.counter_value("failures", {"stage": "page", "cause": "ConnectError"}) == 1
+    assert metrics_recorder.counter_value("bytes_downloaded") == 1024
+    assert metrics_recorder.counter_value("retries") == 0
+
+
+def test_should_estimate_quantiles_from_histogram_buckets():
+    histogram = Histogram(bucket_bounds=(0.1, 0.2, 0.5, float("inf")))
+    for value in [0.05] * 50 + [0.15] * 45 + [0.3] * 5:
+        histogram.observe(value)
+
+    assert histogram.count == 100
+    assert histogram.sum == pytest.approx(0.05 * 50 + 0.15 * 45 + 0.3 * 5)
+    assert histogram.quantile(0.5) == pytest.approx(0.1)
+    assert 0.1 < histogram.quantile(0.95) <= 0.2
+    assert 0.2 < histogram.quantile(0.99) <= 0.5
+
+
+def test_should_report_quantiles_of_every_timed_stage():
+    metrics_recorder = InMemoryMetricsRecorder()
+    with metrics_recorder.timer("fetch_duration_seconds"):
+        pass
+
+    report = metrics_recorder.to_report()
+
+    assert report["histograms"]["fetch_duration_seconds"]["count"] == 1
+    assert set(report["histograms"]["fetch_duration_seconds"]) == {"count", "sum_seconds", "p50", "p95", "p99"}
+
+
+def test_should_export_counters_and_histograms_in_prometheus_text_format():
+    metrics_recorder = InMemoryMetricsRecorder()
+    metrics_recorder.increment("http_responses", labels={"status": "200"})
+    metrics_recorder.increment("http_responses", labels={"status": "503"})
+    metrics_recorder.observe("parse_duration_seconds", 0.003)
+
+    lines = to_prometheus_text(metrics_recorder).splitlines()
+
+    assert lines.count("# TYPE sightcall_scraper_http_responses_total counter") == 1
+    assert 'sightcall_scraper_http_responses_total{status="200"} 1' in lines
+    assert 'sightcall_scraper_http_responses_total{status="503"} 1' in lines
+    assert "# TYPE sightcall_scraper_parse_duration_seconds histogram" in lines
+    assert 'sightcall_scraper_parse_duration_seconds_bucket{le="0.0025"} 0' in lines
+    assert 'sightcall_scraper_parse_duration_seconds_bucket{le="0.005"} 1' in lines
+    assert 'sightcall_scraper_parse_duration_seconds_bucket{le="+Inf"} 1' in lines
+    assert "sightcall_scraper_parse_duration_seconds_count 1" in lines
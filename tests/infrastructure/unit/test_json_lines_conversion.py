@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.infrastructure.file_system_scraped_document_storage import FileSystemScrapedDocumentStorage
+from sightcall_scraping.infrastructure.json_lines_conversion import convert_json_lines_to_json_array
+from sightcall_scraping.infrastructure.json_lines_scraped_document_storage import JsonLinesScrapedDocumentStorage
+
+
+@pytest.mark.asyncio
+async def test_should_convert_json_lines_to_the_same_file_as_json_storage(tmp_path):
+    # Given: the same documents written by both storages
+    documents = [
+        ScrapedDocument(url="http://a", title="A", content="Café — menu"),
+        ScrapedDocument(url="http://b", title="B", content='Quote " and \\ backslash'),
+    ]
+    json_lines_file = tmp_path / "data.jsonl"
+    json_file = tmp_path / "data.json"
+    async with JsonLinesScrapedDocumentStorage(json_lines_file) as json_lines_storage:
+        await json_lines_storage.save_all(documents)
+    async with FileSystemScrapedDocumentStorage(json_file) as json_storage:
+        await json_storage.save_all(documents)
+
+    # When: converting the JSON lines file
+    converted_file = tmp_path / "converted.json"
+    converted_count = convert_json_lines_to_json_array(json_lines_file, converted_file)
+
+    # Then: the converted file is byte for byte the JSON storage output
+    assert converted_count == 2
+    assert converted_file.read_text() == json_file.read_text()
+
+
+def test_should_convert_empty_json_lines_to_empty_array(tmp_path):
+    json_lines_file = tmp_path / "data.jsonl"
+    json_lines_file.write_text("")
+    converted_file = tmp_path / "converted.json"
+
+    converted_count = convert_json_lines_to_json_array(json_lines_file, converted_file)
+
+    assert converted_count == 0
+    assert json.loads(converted_file.read_text()) == []
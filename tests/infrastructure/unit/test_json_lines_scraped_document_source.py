@@ -0,0 +1,30 @@
+import pytest
+
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.infrastructure.json_lines_scraped_document_source import JsonLinesScrapedDocumentSource
+
+
+def as_tuple(document: ScrapedDocument) -> tuple[str, str, str]:
+    return document.url, document.title, document.content
+
+
+@pytest.mark.asyncio
+async def test_should_read_every_complete_line_and_skip_a_truncated_last_one(tmp_path):
+    # Given a JSON lines file cut off in the middle of its last line
+    input_file = tmp_path / "scraped_documents.jsonl"
+    input_file.write_text(
+        '{"url": "http://a", "title": "A", "content": "C"}\n'
+        '{"url": "http://b", "title": "B", "content": "D — é"}\n'
+        '{"url": "http://c", "tit',
+        encoding="utf-8",
+    )
+
+    # When reading it twice
+    source = JsonLinesScrapedDocumentSource(input_file)
+    first_pass = [as_tuple(document) async for document in source.iter_documents()]
+    second_pass = [as_tuple(document) async for document in source.iter_documents()]
+
+    # Then both passes yield the complete documents only
+    expected = [("http://a", "A", "C"), ("http://b", "B", "D — é")]
+    assert first_pass == expected
+    assert second_pass == expected
@@ -0,0 +1,127 @@
+import json
+
+import pytest
+
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.infrastructure.json_lines_scraped_document_storage import JsonLinesScrapedDocumentStorage
+
+
+def read_json_lines(path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.asyncio
+async def test_should_append_one_line_per_document_across_calls(tmp_path):
+    output_file = tmp_path / "scraped_documents.jsonl"
+    async with JsonLinesScrapedDocumentStorage(output_file) as storage:
+        await storage.save_all([ScrapedDocument(url="http://a", title="A", content="C")])
+        await storage.save_all([ScrapedDocument(url="http://b", title="B", content="D — é")])
+
+    assert read_json_lines(output_file) == [
+        {"url": "http://a", "title": "A", "content": "C"},
+        {"url": "http://b", "title": "B", "content": "D — é"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_flush_documents_to_disk_once_batch_is_full(tmp_path):
+    output_file = tmp_path / "scraped_documents.jsonl"
+    async with JsonLinesScrapedDocumentStorage(output_file, flush_batch_size=2) as storage:
+        await storage.save_all([ScrapedDocument(url="http://a", title="A", content="C")])
+        await storage.save_all([ScrapedDocument(url="http://b", title="B", content="D")])
+
+        lines_on_disk_before_close = read_json_lines(output_file)
+
+    assert len(lines_on_disk_before_close) == 2
+
+
+@pytest.mark.asyncio
+async def test_should_overwrite_output_of_a_previous_run(tmp_path):
+    output_file = tmp_path / "scraped_documents.jsonl"
+    output_file.write_text('{"url": "http://old", "title": "Old", "content": "Old"}\n')
+
+    async with JsonLinesScrapedDocumentStorage(output_file) as storage:
+        await storage.save_all([ScrapedDocument(url="http://a", title="A", content="C")])
+
+    assert read_json_lines(output_file) == [{"url": "http://a", "title": "A", "content": "C"}]
+
+
+@pytest.mark.asyncio
+async def test_should_keep_documents_of_a_previous_run_that_were_not_rescraped_when_merging(tmp_path):
+    output_file = tmp_path / "scraped_documents.jsonl"
+    output_file.write_text(
+        '{"url": "http://a", "title": "Old", "content": "Old"}\n{"url": "http://b", "title": "B", "content": "D"}\n'
+    )
+
+    async with JsonLinesScrapedDocumentStorage(output_file, merge_existing=True) as storage:
+        await storage.save_all([ScrapedDocument(url="http://a", title="A", content="C")])
+
+    assert read_json_lines(output_file) == [
+        {"url": "http://a", "title": "A", "content": "C"},
+        {"url": "http://b", "title": "B", "content": "D"},
+    ]
+    assert list(tmp_path.iterdir()) == [output_file]
+
+
+@pytest.mark.asyncio
+async def test_should_keep_the_previous_output_when_a_merging_run_is_killed_then_rerun(tmp_path):
+    # Given: the output of a previous run, and the partial output of a merging run killed after one document
+    output_file = tmp_path / "scraped_documents.jsonl"
+    previous_output = (
+        '{"url": "http://a", "title": "Old", "content": "Old"}\n{"url": "http://b", "title": "B", "content": "D"}\n'
+    )
+    output_file.write_text(previous_output)
+    (tmp_path / "scraped_documents.jsonl.partial").write_text('{"url": "http://a", "title": "A", "content": "C"}\n{"u')
+
+    # When: rerunning the merging run
+    async with JsonLinesScrapedDocumentStorage(output_file, merge_existing=True) as storage:
+        await storage.save_all([ScrapedDocument(url="http://a", title="A", content="C")])
+        await storage.flush()
+
+        output_while_running = output_file.read_text()
+
+    # Then: the previous output stays untouched until the run ends, then keeps the documents not scraped again
+    assert output_while_running == previous_output
+    assert read_json_lines(output_file) == [
+        {"url": "http://a", "title": "A", "content": "C"},
+        {"url": "http://b", "title": "B", "content": "D"},
+    ]
+    assert list(tmp_path.iterdir()) == [output_file]
+
+
+@pytest.mark.asyncio
+async def test_should_append_after_complete_lines_of_an_interrupted_run_when_resuming(tmp_path):
+    # Given: the output of a run killed in the middle of writing its second document
+    output_file = tmp_path / "scraped_documents.jsonl"
+    output_file.write_text('{"url": "http://a", "title": "A", "content": "C"}\n{"url": "http://b", "ti')
+
+    # When: resuming into the same file
+    async with JsonLinesScrapedDocumentStorage(output_file, append_existing=True) as storage:
+        await storage.save_all([ScrapedDocument(url="http://b", title="B", content="D")])
+        await storage.flush()
+
+        lines_on_disk_after_flush = read_json_lines(output_file)
+
+    # Then: the half-written line is dropped and new documents follow the complete ones
+    assert lines_on_disk_after_flush == [
+        {"url": "http://a", "title": "A", "content": "C"},
+        {"url": "http://b", "title": "B", "content": "D"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_write_the_canonical_url_of_near_duplicate_documents(tmp_path):
+    output_file = tmp_path / "scraped_documents.jsonl"
+    async with JsonLinesScrapedDocumentStorage(output_file) as storage:
+        await storage.save_all(
+            [
+                ScrapedDocument(url="http://a", title="A", content="C"),
+                ScrapedDocument(url="http://b", title="A", content="C", duplicate_of="http://a"),
+            ]
+        )
+
+    assert read_json_lines(output_file) == [
+        {"url": "http://a", "title": "A", "content": "C"},
+        {"url": "http://b", "title": "A", "content": "C", "duplicate_of": "http://a"},
+    ]
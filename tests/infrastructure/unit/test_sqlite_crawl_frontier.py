@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.infrastructure.sqlite_crawl_frontier import SqliteCrawlFrontier
+
+LASTMOD = datetime(2025, 5, 14, 21, 48, 38, tzinfo=timezone.utc)
+
+
+def values_of(urls: list[Url]) -> list[str]:
+    return [url.value for url in urls]
+
+
+@pytest.mark.asyncio
+async def test_should_pop_shallowest_urls_first_in_discovery_order(tmp_path):
+    # Given: URLs added at several depths
+    async with SqliteCrawlFrontier(tmp_path / "frontier.sqlite") as frontier:
+        await frontier.add([Url("https://sightcall.com/deep")], depth=2)
+        await frontier.add([Url("https://sightcall.com/b"), Url("https://sightcall.com/c")], depth=1)
+        await frontier.add([Url("https://sightcall.com/a", LASTMOD)], depth=0)
+
+        # When: popping them in two batches
+        first_batch = await frontier.pop(2)
+        second_batch = await frontier.pop(10)
+
+    # Then: the crawl goes breadth-first, keeping the sitemap lastmod of seeds
+    assert values_of(first_batch) == ["https://sightcall.com/a", "https://sightcall.com/b"]
+    assert first_batch[0].lastmod == LASTMOD
+    assert values_of(second_batch) == ["https://sightcall.com/c", "https://sightcall.com/deep"]
+
+
+@pytest.mark.asyncio
+async def test_should_only_add_urls_never_seen_before(tmp_path):
+    async with SqliteCrawlFrontier(tmp_path / "frontier.sqlite") as frontier:
+        await frontier.add([Url("https://sightcall.com/blog")], depth=0)
+        await frontier.pop(10)
+
+        # When: the same page is linked again, under another spelling, along with a new one
+        added_count = await frontier.add(
+            [
+                Url("https://SightCall.com/blog/"),
+                Url("https://sightcall.com/about"),
+                Url("https://sightcall.com/about"),
+            ],
+            depth=1,
+        )
+
+        # Then: only the new page is added, and the first one keeps its depth
+        assert added_count == 1
+        assert values_of(await frontier.pop(10)) == ["https://sightcall.com/about"]
+        assert await frontier.depth_of(Url("https://sightcall.com/blog")) == 0
+        assert await frontier.depth_of(Url("https://sightcall.com/unknown")) is None
+
+
+@pytest.mark.asyncio
+async def test_should_start_empty_unless_resuming(tmp_path):
+    # Given: a crawl that stopped with one page handed out and one still waiting
+    database_path = tmp_path / "frontier.sqlite"
+    async with SqliteCrawlFrontier(database_path) as frontier:
+        await frontier.add([Url("https://sightcall.com/a"), Url("https://sightcall.com/b")], depth=0)
+        await frontier.pop(1)
+
+    # When: resuming it, then starting a new crawl
+    async with SqliteCrawlFrontier(database_path, resume=True) as frontier:
+        resumed_urls = await frontier.pop(10)
+    async with SqliteCrawlFrontier(database_path) as frontier:
+        new_crawl_urls = await frontier.pop(10)
+
+    # Then: the resumed crawl hands out both pages again, while a new crawl starts from scratch
+    assert values_of(resumed_urls) == ["https://sightcall.com/a", "https://sightcall.com/b"]
+    assert new_crawl_urls == []
@@ -0,0 +1,64 @@
+import pytest
+
+from sightcall_scraping.infrastructure.sqlite_http_response_cache import CachedResponse, SqliteHttpResponseCache
+
+
+def response_of_size(size: int) -> CachedResponse:
+    return CachedResponse(etag='"v1"', last_modified=None, body=b"x" * size, content_type="text/html")
+
+
+@pytest.mark.asyncio
+async def test_should_evict_least_recently_used_responses_beyond_max_size(tmp_path):
+    # Given: a cache with room for about two compressed responses
+    async with SqliteHttpResponseCache(tmp_path / "cache.sqlite", max_size_bytes=45) as cache:
+        await cache.put("https://a.test/1", response_of_size(1000))
+        await cache.put("https://a.test/2", response_of_size(2000))
+        # When: reading the oldest response then adding a third one
+        await cache.get("https://a.test/1")
+        await cache.put("https://a.test/3", response_of_size(3000))
+
+        # Then: the least recently used response was evicted
+        assert await cache.get("https://a.test/2") is None
+        assert await cache.get("https://a.test/1") == response_of_size(1000)
+        assert await cache.get("https://a.test/3") == response_of_size(3000)
+        assert await cache.total_size_bytes() <= 45
+
+
+@pytest.mark.asyncio
+async def test_should_count_a_replaced_response_once_when_evicting(tmp_path):
+    # Given: a cache with room for about two compressed responses, holding one response cached twice
+    async with SqliteHttpResponseCache(tmp_path / "cache.sqlite", max_size_bytes=45) as cache:
+        await cache.put("https://a.test/1", response_of_size(1000))
+        await cache.put("https://a.test/1", response_of_size(1000))
+
+        # When: adding a second response
+        await cache.put("https://a.test/2", response_of_size(2000))
+
+        # Then: both fit, the replaced copy no longer counting
+        assert await cache.get("https://a.test/1") == response_of_size(1000)
+        assert await cache.get("https://a.test/2") == response_of_size(2000)
+
+
+@pytest.mark.asyncio
+async def test_should_keep_evicting_within_the_size_budget_of_a_reopened_cache(tmp_path):
+    # Given: a cache filled by a previous run
+    database_path = tmp_path / "cache.sqlite"
+    async with SqliteHttpResponseCache(database_path, max_size_bytes=45) as cache:
+        await cache.put("https://a.test/1", response_of_size(1000))
+        await cache.put("https://a.test/2", response_of_size(2000))
+
+    # When: the next run adds a response
+    async with SqliteHttpResponseCache(database_path, max_size_bytes=45) as cache:
+        await cache.put("https://a.test/3", response_of_size(3000))
+
+        # Then: the previous run's responses count towards the budget
+        assert await cache.get("https://a.test/1") is None
+        assert await cache.total_size_bytes() <= 45
+
+
+@pytest.mark.asyncio
+async def test_should_store_bodies_compressed(tmp_path):
+    async with SqliteHttpResponseCache(tmp_path / "cache.sqlite") as cache:
+        await cache.put("https://a.test/", response_of_size(100_000))
+
+        assert await cache.total_size_bytes() < 1_000
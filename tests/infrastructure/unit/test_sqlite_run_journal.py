@@ -0,0 +1,66 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from sightcall_scraping.domain.errors import UnknownRunError
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.infrastructure.sqlite_run_journal import SqliteRunJournal
+
+LASTMOD = datetime(2025, 5, 14, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_should_restore_progress_of_an_interrupted_run(tmp_path):
+    # Given: a run that discovered three pages, stored one and failed one before being killed
+    journal_path = tmp_path / "journal.sqlite"
+    async with SqliteRunJournal(journal_path, "run-1") as journal:
+        await journal.record_discovered([Url(f"https://sightcall.com/{page}", LASTMOD) for page in ("a", "b", "c")])
+        await journal.record_completed(["https://sightcall.com/a"])
+        await journal.record_failed("https://sightcall.com/c")
+
+    # When: resuming it
+    async with SqliteRunJournal(journal_path, "run-1", resume=True) as journal:
+        progress = await journal.load_progress()
+
+    # Then: the stored page is done, the others are still to scrape with their lastmod
+    assert progress.completed_urls == {"https://sightcall.com/a"}
+    assert progress.unfinished_urls == [Url("https://sightcall.com/b"), Url("https://sightcall.com/c")]
+    assert progress.unfinished_urls[0].lastmod == LASTMOD
+
+
+@pytest.mark.asyncio
+async def test_should_keep_runs_apart(tmp_path):
+    journal_path = tmp_path / "journal.sqlite"
+    async with SqliteRunJournal(journal_path, "run-1") as journal:
+        await journal.record_discovered([Url("https://sightcall.com/a")])
+
+    async with SqliteRunJournal(journal_path, "run-2") as journal:
+        progress = await journal.load_progress()
+
+    assert progress.unfinished_urls == []
+
+
+@pytest.mark.asyncio
+async def test_should_refuse_to_resume_an_unknown_run(tmp_path):
+    with pytest.raises(UnknownRunError):
+        async with SqliteRunJournal(tmp_path / "journal.sqlite", "missing", resume=True):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_should_forget_runs_older_than_the_kept_ones(tmp_path):
+    # Given: three runs journaled while keeping the two latest
+    journal_path = tmp_path / "journal.sqlite"
+    for run_id in ("run-1", "run-2", "run-3"):
+        async with SqliteRunJournal(journal_path, run_id, kept_run_count=2) as journal:
+            await journal.record_discovered([Url("https://sightcall.com/a")])
+
+    # When: resuming the oldest and the latest runs
+    with pytest.raises(UnknownRunError):
+        async with SqliteRunJournal(journal_path, "run-1", resume=True):
+            pass
+    async with SqliteRunJournal(journal_path, "run-3", resume=True) as journal:
+        progress = await journal.load_progress()
+
+    # Then: only the oldest run is gone
+    assert progress.unfinished_urls == [Url("https://sightcall.com/a")]
@@ -0,0 +1,72 @@
+import pytest
+
+from sightcall_scraping.domain.models.scraped_document import ScrapedDocument
+from sightcall_scraping.infrastructure.sqlite_scraped_document_storage import SqliteScrapedDocumentStorage
+
+BLOG = ScrapedDocument(
+    url="https://sightcall.com/blog/", title="Blog", content="Remote video assistance for field technicians."
+)
+INSURANCE = ScrapedDocument(
+    url="https://sightcall.com/insurance",
+    title="Video claims inspection",
+    content="Insurers inspect claims remotely with a live video session.",
+)
+
+
+@pytest.mark.asyncio
+async def test_should_find_documents_matching_every_search_term(tmp_path):
+    # Given stored documents
+    async with SqliteScrapedDocumentStorage(tmp_path / "data.sqlite") as storage:
+        await storage.save_all([BLOG, INSURANCE])
+
+        # When searching for terms found in one of them only
+        results = await storage.search("video claims")
+
+    # Then only that document is returned, with the matching passage
+    assert [result.url for result in results] == [INSURANCE.url]
+    assert "[claims]" in results[0].snippet
+
+
+@pytest.mark.asyncio
+async def test_should_rank_title_matches_first(tmp_path):
+    async with SqliteScrapedDocumentStorage(tmp_path / "data.sqlite") as storage:
+        await storage.save_all([BLOG, INSURANCE])
+
+        results = await storage.search("video")
+
+    assert [result.url for result in results] == [INSURANCE.url, BLOG.url]
+
+
+@pytest.mark.asyncio
+async def test_should_update_documents_and_their_index_in_place_across_runs(tmp_path):
+    # Given a document stored by a previous run
+    database_path = tmp_path / "data.sqlite"
+    async with SqliteScrapedDocumentStorage(database_path) as storage:
+        await storage.save_all([BLOG, INSURANCE])
+
+    # When a new run stores a new version of it
+    updated_blog = ScrapedDocument(url=BLOG.url, title="Blog", content="Augmented reality guidance.")
+    async with SqliteScrapedDocumentStorage(database_path) as storage:
+        await storage.save_all([updated_blog])
+
+        old_version_results = await storage.search("technicians")
+        new_version_results = await storage.search("augmented")
+        documents = [document async for document in storage.iter_documents()]
+
+    # Then the row is replaced, and only its new text is searchable
+    assert old_version_results == []
+    assert [result.url for result in new_version_results] == [BLOG.url]
+    assert [(document.url, document.content) for document in documents] == [
+        (BLOG.url, updated_blog.content),
+        (INSURANCE.url, INSURANCE.content),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_treat_search_operators_as_plain_words(tmp_path):
+    async with SqliteScrapedDocumentStorage(tmp_path / "data.sqlite") as storage:
+        await storage.save_all([BLOG])
+
+        results = await storage.search('field" OR NEAR(')
+
+    assert results == []
@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from sightcall_scraping.domain.models.url_state import UrlState
+from sightcall_scraping.infrastructure.sqlite_url_state_store import SqliteUrlStateStore
+
+LASTMOD = datetime(2025, 5, 14, 21, 48, 38, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_should_remember_url_states_across_runs(tmp_path):
+    # Given a state saved in a previous run
+    database_path = tmp_path / "state.sqlite"
+    async with SqliteUrlStateStore(database_path) as store:
+        await store.save_all([UrlState("https://sightcall.com/blog/", LASTMOD, "hash")])
+
+    # When a new run reads it back
+    async with SqliteUrlStateStore(database_path) as store:
+        state = await store.get("https://sightcall.com/blog/")
+
+    # Then the state is unchanged
+    assert state == UrlState("https://sightcall.com/blog/", LASTMOD, "hash")
+
+
+@pytest.mark.asyncio
+async def test_should_overwrite_state_of_a_rescraped_url(tmp_path):
+    async with SqliteUrlStateStore(tmp_path / "state.sqlite") as store:
+        await store.save_all([UrlState("https://sightcall.com/blog/", None, "old")])
+        await store.save_all([UrlState("https://sightcall.com/blog/", LASTMOD, "new")])
+
+        state = await store.get("https://sightcall.com/blog/")
+
+    assert state == UrlState("https://sightcall.com/blog/", LASTMOD, "new")
+
+
+@pytest.mark.asyncio
+async def test_should_return_none_for_unknown_url(tmp_path):
+    async with SqliteUrlStateStore(tmp_path / "state.sqlite") as store:
+        assert await store.get("https://sightcall.com/unknown") is None
@@ -0,0 +1,125 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from sightcall_scraping.domain.models.url import Url
+from sightcall_scraping.infrastructure.sqlite_work_queue import SqliteWorkQueue
+
+LASTMOD = datetime(2025, 5, 14, 21, 48, 38, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def values_of(urls: list[Url]) -> list[str]:
+    return [url.value for url in urls]
+
+
+@pytest.mark.asyncio
+async def test_should_hand_each_url_to_a_single_worker(tmp_path):
+    # Given: two workers sharing a queue
+    database_path = tmp_path / "queue.sqlite"
+    async with (
+        SqliteWorkQueue(database_path, "worker-1") as first_worker,
+        SqliteWorkQueue(database_path, "worker-2") as second_worker,
+    ):
+        added_count = await first_worker.add(
+            [Url("https://sightcall.com/a", LASTMOD), Url("https://sightcall.com/b"), Url("https://SightCall.com/a/")]
+        )
+
+        # When: both claim pages
+        first_claim = await first_worker.claim(1)
+        second_claim = await second_worker.claim(10)
+        third_claim = await first_worker.claim(10)
+
+    # Then: the URLs are shared out in the order they were added, without duplicates
+    assert added_count == 2
+    assert values_of(first_claim) == ["https://sightcall.com/a"]
+    assert first_claim[0].lastmod == LASTMOD
+    assert values_of(second_claim) == ["https://sightcall.com/b"]
+    assert third_claim == []
+
+
+@pytest.mark.asyncio
+async def test_should_hand_out_again_the_urls_of_a_worker_whose_lease_ran_out(tmp_path):
+    # Given: a worker that claimed a page and died
+    clock = FakeClock()
+    database_path = tmp_path / "queue.sqlite"
+    async with (
+        SqliteWorkQueue(database_path, "dead-worker", lease_seconds=60, clock=clock) as dead_worker,
+        SqliteWorkQueue(database_path, "live-worker", lease_seconds=60, clock=clock) as live_worker,
+    ):
+        await dead_worker.add([Url("https://sightcall.com/a")])
+        await dead_worker.finish_adding()
+        await dead_worker.claim(10)
+
+        # When: the other worker claims pages before and after the lease expires
+        claimed_while_leased = await live_worker.claim(10)
+        is_drained_while_leased = await live_worker.is_drained()
+        clock.now += 61
+        claimed_after_expiry = await live_worker.claim(10)
+
+    # Then: the page is only handed out again once its lease expired
+    assert claimed_while_leased == []
+    assert not is_drained_while_leased
+    assert values_of(claimed_after_expiry) == ["https://sightcall.com/a"]
+
+
+@pytest.mark.asyncio
+async def test_should_keep_the_lease_of_a_worker_still_scraping_its_pages(tmp_path):
+    # Given: a live worker holding a page for longer than its lease
+    clock = FakeClock()
+    database_path = tmp_path / "queue.sqlite"
+    async with (
+        SqliteWorkQueue(database_path, "slow-worker", lease_seconds=0.3, clock=clock) as slow_worker,
+        SqliteWorkQueue(database_path, "other-worker", lease_seconds=0.3, clock=clock) as other_worker,
+    ):
+        await slow_worker.add([Url("https://sightcall.com/a")])
+        await slow_worker.claim(10)
+        clock.now += 0.2
+        await asyncio.sleep(0.25)
+
+        # When: another worker claims pages once the first lease would have run out
+        clock.now += 0.2
+        other_claim = await other_worker.claim(10)
+
+    # Then: the page is not handed out twice
+    assert other_claim == []
+
+
+@pytest.mark.asyncio
+async def test_should_be_drained_once_every_url_is_added_and_completed(tmp_path):
+    async with SqliteWorkQueue(tmp_path / "queue.sqlite", "worker-1") as work_queue:
+        await work_queue.add([Url("https://sightcall.com/a"), Url("https://sightcall.com/b")])
+        is_drained_while_adding = await work_queue.is_drained()
+        await work_queue.finish_adding()
+        urls = await work_queue.claim(10)
+
+        # When: the worker still holds its pages, then completes them
+        is_drained_while_holding_its_own_urls = await work_queue.is_drained()
+        await work_queue.complete(urls)
+        is_drained_once_completed = await work_queue.is_drained()
+
+        # Then: it need not wait for its own pages, and completed pages are never handed out again
+        assert not is_drained_while_adding
+        assert is_drained_while_holding_its_own_urls
+        assert is_drained_once_completed
+        assert await work_queue.claim(10) == []
+
+
+@pytest.mark.asyncio
+async def test_should_start_empty_when_asked_to_clear_the_previous_run(tmp_path):
+    database_path = tmp_path / "queue.sqlite"
+    async with SqliteWorkQueue(database_path, "worker-1") as work_queue:
+        await work_queue.add([Url("https://sightcall.com/a")])
+        await work_queue.finish_adding()
+
+    async with SqliteWorkQueue(database_path, "worker-1", clear_existing=True) as work_queue:
+        assert await work_queue.claim(10) == []
+        assert not await work_queue.is_drained()
@@ -0,0 +1,95 @@
+import gzip
+from datetime import datetime, timezone
+
+import pytest
+
+from sightcall_scraping.domain.models.archived_response import ArchivedResponse
+from sightcall_scraping.infrastructure.warc_response_archive import WarcResponseArchive
+
+FETCHED_AT = datetime(2025, 5, 14, 21, 48, 38, tzinfo=timezone.utc)
+
+
+async def read_all(archive: WarcResponseArchive) -> list[tuple[str, bytes, datetime]]:
+    return [(response.url, response.body, response.fetched_at) async for response in archive.iter_responses()]
+
+
+@pytest.mark.asyncio
+async def test_should_read_back_archived_responses_in_order(tmp_path):
+    # Given responses archived by a run
+    archive_path = tmp_path / "pages.warc.gz"
+    async with WarcResponseArchive(archive_path) as archive:
+        await archive.append(
+            ArchivedResponse("https://sightcall.com/blog/", "<html>Blog — é</html>".encode(), FETCHED_AT)
+        )
+        await archive.append(ArchivedResponse("https://sightcall.com/about", b"<html>About</html>", FETCHED_AT))
+
+    # When reading the archive
+    responses = await read_all(WarcResponseArchive(archive_path))
+
+    # Then every response comes back unchanged
+    assert responses == [
+        ("https://sightcall.com/blog/", "<html>Blog — é</html>".encode(), FETCHED_AT),
+        ("https://sightcall.com/about", b"<html>About</html>", FETCHED_AT),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_should_keep_bodies_in_their_declared_encoding(tmp_path):
+    # Given a page served in Latin-1
+    archive_path = tmp_path / "pages.warc.gz"
+    body = "<html>Café</html>".encode("latin-1")
+    async with WarcResponseArchive(archive_path) as archive:
+        await archive.append(
+            ArchivedResponse("https://sightcall.com/fr/", body, FETCHED_AT, "text/html; charset=ISO-8859-1")
+        )
+
+    # When reading the archive
+    [response] = [response async for response in WarcResponseArchive(archive_path).iter_responses()]
+
+    # Then the body comes back byte for byte, with the encoding it was served in
+    assert response.body == body
+    assert response.encoding == "iso8859-1"
+
+
+@pytest.mark.asyncio
+async def test_should_write_standard_warc_records(tmp_path):
+    archive_path = tmp_path / "pages.warc.gz"
+    async with WarcResponseArchive(archive_path) as archive:
+        await archive.append(ArchivedResponse("https://sightcall.com/blog/", b"<html>Blog</html>", FETCHED_AT))
+
+    record = gzip.decompress(archive_path.read_bytes())
+
+    assert record.startswith(b"WARC/1.1\r\nWARC-Type: resource\r\n")
+    assert b"WARC-Target-URI: https://sightcall.com/blog/\r\n" in record
+    assert b"WARC-Date: 2025-05-14T21:48:38Z\r\n" in record
+    assert record.endswith(b"Content-Length: 17\r\n\r\n<html>Blog</html>\r\n\r\n")
+
+
+@pytest.mark.asyncio
+async def test_should_append_to_the_archive_of_a_previous_run_when_asked_to(tmp_path):
+    archive_path = tmp_path / "pages.warc.gz"
+    async with WarcResponseArchive(archive_path) as archive:
+        await archive.append(ArchivedResponse("https://sightcall.com/blog/", b"old", FETCHED_AT))
+    async with WarcResponseArchive(archive_path, append_existing=True) as archive:
+        await archive.append(ArchivedResponse("https://sightcall.com/blog/", b"new", FETCHED_AT))
+
+    responses = await read_all(WarcResponseArchive(archive_path))
+
+    assert [body for _, body, _ in responses] == [b"old", b"new"]
+
+
+@pytest.mark.asyncio
+async def test_should_skip_a_record_cut_off_by_a_killed_run(tmp_path):
+    # Given an archive whose last record was only partly written
+    archive_path = tmp_path / "pages.warc.gz"
+    async with WarcResponseArchive(archive_path) as archive:
+        await archive.append(ArchivedResponse("https://sightcall.com/blog/", b"<html>Blog</html>", FETCHED_AT))
+        await archive.append(ArchivedResponse("https://sightcall.com/about", b"<html>About</html>" * 50, FETCHED_AT))
+    archive_bytes = archive_path.read_bytes()
+    archive_path.write_bytes(archive_bytes[: len(archive_bytes) - 20])
+
+    # When reading it
+    responses = await read_all(WarcResponseArchive(archive_path))
+
+    # Then the complete records are still read
+    assert [url for url, _, _ in responses] == ["https://sightcall.com/blog/"]
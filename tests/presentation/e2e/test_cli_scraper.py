@@ -24,3 +24,9 @@ def test_cli_scraper_outputs_expected(output_file_path):
         data = json.load(f)
         assert isinstance(data, list)
         assert len(data) > 0
+
+
+def test_cli_runs_scrape_when_no_command_is_given():
+    result = runner.invoke(app, ["--max-urls", "not-a-number"])
+    assert result.exit_code == 2
+    assert "Usage: root scrape" in result.output